@@ -23,12 +23,15 @@ from openmdao.solvers.linear.direct import DirectSolver
 from openmdao.solvers.linear.petsc_ksp import PetscKSP
 from openmdao.solvers.linear.linear_runonce import LinearRunOnce
 from openmdao.solvers.linear.scipy_iter_solver import ScipyIterativeSolver
+from openmdao.solvers.linear.algebraic_precon import AlgebraicPreconditioner
 from openmdao.solvers.linesearch.backtracking import ArmijoGoldsteinLS
 from openmdao.solvers.linesearch.backtracking import BoundsEnforceLS
 from openmdao.solvers.nonlinear.nonlinear_block_gs import NonlinearBlockGS
 from openmdao.solvers.nonlinear.nonlinear_block_jac import NonlinearBlockJac
 from openmdao.solvers.nonlinear.newton import NewtonSolver
+from openmdao.solvers.nonlinear.broyden import BroydenSolver
 from openmdao.solvers.nonlinear.nonlinear_runonce import NonLinearRunOnce
+from openmdao.solvers.nonlinear.nonlinear_scc import NonlinearSCC
 
 # Surrogate Models
 from openmdao.surrogate_models.kriging import KrigingSurrogate, FloatKrigingSurrogate
@@ -52,7 +55,7 @@ from openmdao.devtools.viewconns import view_connections
 
 # Derivative Specification
 from openmdao.jacobians.assembled_jacobian import AssembledJacobian, \
-    DenseJacobian, COOJacobian, CSRJacobian, CSCJacobian
+    DenseJacobian, COOJacobian, CSRJacobian, CSCJacobian, BlockJacobian
 
 # Drivers
 try:
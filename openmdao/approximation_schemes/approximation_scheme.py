@@ -1,14 +1,221 @@
 """Base class used to define the interface for derivative approximation schemes."""
 from __future__ import print_function, division
 
+import multiprocessing
+import os
+import threading
+
+import numpy as np
+from scipy.sparse import csc_matrix
+from six import iteritems
+from six.moves import range
+
+from openmdao.recorders.recording_iteration_stack import recording_iteration_stack
+from openmdao.utils.name_maps import abs_key2rel_key
 from openmdao.utils.options_dictionary import OptionsDictionary
 
+# Function that evaluates one group of columns, inherited by forked worker processes.
+_forked_state = {}
+
+
+def _color_columns(rows, cols, shape):
+    """
+    Partition the columns of a sparsity pattern into groups that share no nonzero rows.
+
+    The columns in a group can be perturbed together, because each nonzero entry of the jacobian
+    is only affected by one of them. Columns are assigned greedily to the first compatible group.
+    Columns without nonzero entries are left out.
+
+    Parameters
+    ----------
+    rows : ndarray of int
+        Row index of each nonzero entry.
+    cols : ndarray of int
+        Column index of each nonzero entry.
+    shape : (int, int)
+        Shape of the jacobian.
+
+    Returns
+    -------
+    [ndarray, ...]
+        Column indices of each group.
+    """
+    nrows, ncols = shape
+    pattern = csc_matrix((np.ones(rows.size, dtype=bool), (rows, cols)), shape=shape)
+    indptr = pattern.indptr
+    indices = pattern.indices
+
+    col_colors = np.full(ncols, -1, dtype=int)
+    color_rows = []
+    for icol in range(ncols):
+        col_rows = indices[indptr[icol]:indptr[icol + 1]]
+        if col_rows.size == 0:
+            continue
+
+        for icolor, used in enumerate(color_rows):
+            if not used[col_rows].any():
+                break
+        else:
+            icolor = len(color_rows)
+            used = np.zeros(nrows, dtype=bool)
+            color_rows.append(used)
+
+        used[col_rows] = True
+        col_colors[icol] = icolor
+
+    return [np.where(col_colors == icolor)[0] for icolor in range(len(color_rows))]
+
+
+def _build_coloring(subjacs, in_size):
+    """
+    Group the columns of a set of subjacs with the same wrt, and locate their entries.
+
+    Parameters
+    ----------
+    subjacs : [(str, ndarray, ndarray, bool, bool, int), ...]
+        For each subjac, the name of the of, the row and column of each of its entries, whether it
+        is declared sparse, whether its sparsity is yet to be detected, and the size of the of.
+    in_size : int
+        Size of the wrt.
+
+    Returns
+    -------
+    [ndarray, ...]
+        Indices of the wrt entries in each group, which are perturbed together.
+    [tuple, ...]
+        The given tuple for each subjac, extended with the indices of its entries in each group
+        and their rows.
+    """
+    if any(rows.size == out_size * in_size > 0 for _, rows, _, _, _, out_size in subjacs):
+        # Every pair of columns shares a row of a dense subjac.
+        colors = [np.array([idx]) for idx in range(in_size)]
+    else:
+        offset = 0
+        all_rows = [np.zeros(0, dtype=int)]
+        all_cols = [np.zeros(0, dtype=int)]
+        for of, rows, cols, declared, detect, out_size in subjacs:
+            all_rows.append(rows + offset)
+            all_cols.append(cols)
+            offset += out_size
+
+        colors = _color_columns(np.concatenate(all_rows), np.concatenate(all_cols),
+                                (offset, in_size))
+
+    col_colors = np.empty(in_size, dtype=int)
+    for icolor, color in enumerate(colors):
+        col_colors[color] = icolor
+
+    colored_subjacs = []
+    for subjac in subjacs:
+        rows, cols = subjac[1:3]
+        entry_colors = col_colors[cols]
+        color_entries = []
+        for icolor in range(len(colors)):
+            entries = np.where(entry_colors == icolor)[0]
+            color_entries.append((entries, rows[entries]))
+        colored_subjacs.append(subjac + (color_entries,))
+
+    return colors, colored_subjacs
+
+
+def _run_forked_color(icolor):
+    """
+    Evaluate a group of columns in a forked worker process.
+
+    Points evaluated in worker processes are not recorded.
+
+    Parameters
+    ----------
+    icolor : int
+        Index of the group.
+
+    Returns
+    -------
+    (int, [ndarray, ...])
+        The index of the group and the values of its entries in each subjac.
+    """
+    recording_iteration_stack.reset([('_approx_worker', 0)])
+    return icolor, _forked_state['run_color'](icolor)
+
+
+def _can_fork():
+    """
+    Return True if worker processes can safely be forked from the current process.
+
+    A forked process only has a copy of the calling thread, so any lock held by another thread,
+    e.g., a thread of the shared thread pools or the writer thread of an asynchronous recorder,
+    stays locked forever in the worker.
+
+    Returns
+    -------
+    bool
+        True if the platform can fork and no other thread is alive.
+    """
+    return hasattr(os, 'fork') and threading.active_count() == 1
+
+
+def _run_forked(run_color, icolors, num_procs):
+    """
+    Evaluate groups of columns on a pool of forked worker processes.
+
+    Parameters
+    ----------
+    run_color : function
+        Function that evaluates one group of columns, given its index.
+    icolors : [int, ...]
+        Indices of the groups.
+    num_procs : int
+        Number of worker processes.
+
+    Returns
+    -------
+    [(int, [ndarray, ...]), ...]
+        The index of each group and the values of its entries in each subjac.
+    """
+    try:
+        context = multiprocessing.get_context('fork')
+    except AttributeError:
+        # Python 2 always forks on POSIX systems.
+        context = multiprocessing
+
+    # The workers are forked with the current state of the system.
+    _forked_state['run_color'] = run_color
+    pool = context.Pool(min(num_procs, len(icolors)))
+    try:
+        return pool.map(_run_forked_color, icolors)
+    finally:
+        pool.terminate()
+        _forked_state.clear()
+
 
 class ApproximationScheme(object):
     """
     Base class used to define the interface for derivative approximation schemes.
+
+    Attributes
+    ----------
+    _colorings : dict
+        Column groups and subjac sparsity for each set of approximations with the same wrt and
+        options, computed at the first approximation after setup.
+    _results_cache : dict
+        Scratch buffers holding the data of the results vector while it is perturbed, keyed by
+        vector type and by whether they hold the imaginary part, allocated once after setup.
+    _approx_point : ndarray or None
+        Inputs and outputs of the system when the saved total derivatives were approximated.
+    _approx_values : dict
+        Column groups and subjac values of the total derivatives approximated at _approx_point,
+        for each set of approximations with the same wrt and options.
     """
 
+    def __init__(self):
+        """
+        Initialize the ApproximationScheme.
+        """
+        self._colorings = {}
+        self._results_cache = {}
+        self._approx_point = None
+        self._approx_values = {}
+
     def add_approximation(self, abs_key, kwargs):
         """
         Use this approximation scheme to approximate the derivative d(of)/d(wrt).
@@ -39,28 +246,377 @@ class ApproximationScheme(object):
         """
         raise NotImplementedError()
 
+    def _setup(self):
+        """
+        Forget what is only valid until the next setup of the system.
+        """
+        pass
+
     def _init_approximations(self):
         """
         Perform any necessary setup for the approximation scheme.
         """
-        pass
+        self._colorings = {}
+        self._results_cache = {}
+        self._approx_point = None
+        self._approx_values = {}
+
+    def _check_point(self, system):
+        """
+        Forget the saved total derivatives if the inputs or outputs of the system have changed.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        """
+        point = np.concatenate((system._inputs.get_data(), system._outputs.get_data()))
+
+        changed = self._approx_point is None or not np.array_equal(point, self._approx_point)
+        if system.comm.size > 1:
+            changed = any(system.comm.allgather(changed))
+
+        if changed:
+            self._approx_point = point
+            self._approx_values = {}
+
+    def _reuse_approximations(self, system, jac, key, wrt, in_size, approximations):
+        """
+        Store the saved total derivatives of a set of approximations, if there are any.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        jac : dict-like
+            Object that stores the approximated subjacs.
+        key : tuple
+            Key of the set of approximations.
+        wrt : str
+            Absolute name of the variable that the derivatives are taken with respect to.
+        in_size : int
+            Size of wrt.
+        approximations : [(str, str, dict), ...]
+            The (of, wrt, options) of each approximation in the set.
+
+        Returns
+        -------
+        bool
+            True if the saved total derivatives were used.
+        """
+        saved = self._approx_values.get(key)
+        if saved is None:
+            return False
+
+        coloring, values, tols = saved
+        if [subjac[0] for subjac in coloring[1]] != [of for of, _, _ in approximations]:
+            return False
+
+        self._set_approximations(system, jac, key, wrt, in_size, coloring, values, tols)
+        return True
+
+    def _get_coloring(self, system, key, wrt, in_size, approximations):
+        """
+        Return the column groups and the sparsity of the subjacs for a set of approximations.
+
+        Subjacs declared with rows and cols only have those entries approximated. The other
+        subjacs are dense, unless the 'detect_sparsity' option is set, in which case their
+        nonzero entries are found from the first (dense) approximation and reused afterwards.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        key : tuple
+            Key of the set of approximations.
+        wrt : str
+            Absolute name of the variable that the derivatives are taken with respect to.
+        in_size : int
+            Size of wrt.
+        approximations : [(str, str, dict), ...]
+            The (of, wrt, options) of each approximation in the set.
+
+        Returns
+        -------
+        tuple
+            Column groups and subjac sparsity, as returned by _build_coloring.
+        """
+        coloring = self._colorings.get(key)
+        if coloring is not None:
+            return coloring
+
+        subjacs = []
+        for of, _, options in approximations:
+            out_size = np.prod(system._var_abs2meta['output'][of]['shape'])
+            rows = options.get('rows')
+
+            if rows is not None:
+                subjacs.append((of, np.asarray(rows, dtype=int),
+                                np.asarray(options['cols'], dtype=int), True, False, out_size))
+            else:
+                subjacs.append((of, np.repeat(np.arange(out_size), in_size),
+                                np.tile(np.arange(in_size), out_size), False,
+                                options.get('detect_sparsity', False), out_size))
+
+        coloring = _build_coloring(subjacs, in_size)
+        if not any(subjac[4] for subjac in subjacs):
+            self._colorings[key] = coloring
+
+        return coloring
+
+    def _compute_colors(self, system, run_color, coloring, num_par_fd, deriv_type):
+        """
+        Evaluate every group of columns, in parallel if requested, and collect the subjac values.
+
+        With num_par_fd greater than 1, the groups are split among the procs of the system's
+        communicator when running under MPI, which is only done for components that are not
+        distributed, since each proc must hold the whole component. Total derivatives are
+        evaluated serially under MPI, since every proc takes part in each run of the model.
+        Without MPI, the groups are evaluated on num_par_fd forked worker processes, unless other
+        threads are running in this process.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        run_color : function
+            Function that evaluates one group of columns, given its index, and returns the values
+            of its entries in each subjac.
+        coloring : tuple
+            Column groups and subjac sparsity, as returned by _get_coloring.
+        num_par_fd : int
+            Number of groups to evaluate concurrently.
+        deriv_type : str
+            One of 'total' or 'partial', indicating if total or partial derivatives are being
+            approximated.
+
+        Returns
+        -------
+        [ndarray, ...]
+            Approximated value of each entry of each subjac.
+        """
+        colors, subjacs = coloring
+        icolors = list(range(len(colors)))
+        comm = system.comm
+
+        parallel = num_par_fd > 1 and len(icolors) > 1
+
+        if parallel and comm.size > 1 and deriv_type == 'partial' and not system.distributed:
+            results = [(icolor, run_color(icolor)) for icolor in icolors[comm.rank::comm.size]]
+            results = [result for proc_results in comm.allgather(results)
+                       for result in proc_results]
+        elif parallel and comm.size == 1 and _can_fork():
+            results = _run_forked(run_color, icolors, num_par_fd)
+        else:
+            results = [(icolor, run_color(icolor)) for icolor in icolors]
+
+        values = [np.zeros(subjac[1].size) for subjac in subjacs]
+        for icolor, color_values in results:
+            for subjac, subjac_values, entry_values in zip(subjacs, values, color_values):
+                subjac_values[subjac[6][icolor][0]] = entry_values
+
+        return values
 
-    def _run_point(self, system, input_deltas, deriv_type='partial'):
+    def _set_approximations(self, system, jac, key, wrt, in_size, coloring, values, tols=None):
+        """
+        Store the approximated subjacs, and the detected sparsity of the subjacs if requested.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        jac : dict-like
+            Object that stores the approximated subjacs.
+        key : tuple
+            Key of the set of approximations.
+        wrt : str
+            Absolute name of the variable that the derivatives are taken with respect to.
+        in_size : int
+            Size of wrt.
+        coloring : tuple
+            Column groups and subjac sparsity, as returned by _get_coloring.
+        values : [ndarray, ...]
+            Approximated value of each entry of each subjac.
+        tols : [float, ...] or None
+            Magnitude up to which an entry of each subjac is considered zero when detecting its
+            sparsity. If None, only exact zeros are.
+        """
+        if tols is None:
+            tols = [0.0] * len(values)
+
+        subjacs = []
+        for subjac, subjac_values, tol in zip(coloring[1], values, tols):
+            of, rows, cols, declared, detect, out_size = subjac[:6]
+            rel_key = abs_key2rel_key(system, (of, wrt))
+
+            if declared:
+                jac[rel_key] = subjac_values
+            else:
+                dense = np.zeros((out_size, in_size))
+                dense[rows, cols] = subjac_values
+                jac[rel_key] = dense
+
+            if detect:
+                nonzero = np.where(np.abs(subjac_values) > tol)[0]
+                rows, cols = rows[nonzero], cols[nonzero]
+            subjacs.append((of, rows, cols, declared, False, out_size))
+
+        if key not in self._colorings:
+            # Color again with the detected sparsity, and reuse it until the next setup.
+            self._colorings[key] = _build_coloring(subjacs, in_size)
+
+    def _save_results(self, results_vec, imag=False):
+        """
+        Copy the data of the results vector into a scratch buffer.
+
+        Parameters
+        ----------
+        results_vec : Vector
+            The outputs for total derivatives, or the residuals for partial derivatives. The
+            inputs are also saved for total derivatives.
+        imag : bool
+            If True, copy the imaginary part of the data instead.
+
+        Returns
+        -------
+        dict
+            The buffer, keyed by varset.
+        """
+        data = results_vec._imag_data if imag else results_vec._data
+        key = (results_vec._typ, imag)
+
+        cache = self._results_cache.get(key)
+        if cache is None:
+            cache = self._results_cache[key] = {set_name: np.empty_like(set_data)
+                                                for set_name, set_data in iteritems(data)}
+
+        for set_name, set_data in iteritems(data):
+            cache[set_name][:] = set_data
+
+        return cache
+
+    def _restore_results(self, results_vec, cache, imag=False):
+        """
+        Copy the data saved by _save_results back into the results vector.
+
+        Parameters
+        ----------
+        results_vec : Vector
+            The outputs for total derivatives, or the residuals for partial derivatives.
+        cache : dict
+            The buffer returned by _save_results.
+        imag : bool
+            If True, restore the imaginary part of the data instead.
+        """
+        data = results_vec._imag_data if imag else results_vec._data
+
+        for set_name, set_data in iteritems(data):
+            set_data[:] = cache[set_name]
+
+    def _can_batch(self, system, wrt, deriv_type):
+        """
+        Return whether the perturbed points can be evaluated with compute_batch of the system.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        wrt : str
+            Absolute name of the variable that the derivatives are taken with respect to.
+        deriv_type : str
+            One of 'total' or 'partial', indicating if total or partial derivatives are being
+            approximated.
+
+        Returns
+        -------
+        bool
+            True if the system is a batched component and wrt is one of its inputs.
+        """
+        return (deriv_type == 'partial' and getattr(system, 'batched', False) and
+                wrt in system._var_abs2meta['input'])
+
+    def _run_batch(self, system, wrt, points, imag=False):
+        """
+        Evaluate all of the perturbed points with a single call to compute_batch of the system.
+
+        Parameters
+        ----------
+        system : ExplicitComponent
+            Component on which the execution is run.
+        wrt : str
+            Absolute name of the input that is perturbed.
+        points : [(ndarray, float or ndarray), ...]
+            Indices of wrt and delta of each point.
+        imag : bool
+            If True, perturb the imaginary part of the inputs (complex step).
+
+        Returns
+        -------
+        dict
+            Residuals of the outputs at the points, keyed by absolute output name, as arrays with
+            one row per point.
+        """
+        num_points = len(points)
+        dtype = complex if imag else float
+        abs2prom = system._var_abs2prom
+
+        inputs = {}
+        for abs_name in system._var_abs_names['input']:
+            val = system._inputs._views[abs_name]
+            inputs[abs2prom['input'][abs_name]] = batch = np.empty((num_points,) + val.shape,
+                                                                   dtype=dtype)
+            batch[:] = val
+
+            if abs_name == wrt:
+                batch_flat = batch.reshape((num_points, val.size))
+                for ipoint, (idxs, delta) in enumerate(points):
+                    batch_flat[ipoint, idxs] += 1j * delta if imag else delta
+
+        outputs = {}
+        for abs_name in system._var_abs_names['output']:
+            val = system._outputs._views[abs_name]
+            outputs[abs2prom['output'][abs_name]] = np.zeros((num_points,) + val.shape,
+                                                             dtype=dtype)
+
+        system.compute_batch(inputs, outputs)
+
+        # Explicit residuals are the difference between the current and the computed outputs.
+        results = {}
+        for abs_name in system._var_abs_names['output']:
+            batch = outputs[abs2prom['output'][abs_name]].reshape((num_points, -1))
+            if imag:
+                results[abs_name] = -batch.imag
+            else:
+                results[abs_name] = system._outputs._views_flat[abs_name] - batch
+
+        return results
+
+    def _run_point(self, system, input_deltas, out_slices, cache, deriv_type='partial'):
         """
         Alter the specified inputs by the given deltas, runs the system, and returns the results.
 
+        For total derivatives, the outputs are restored after the run so that every point starts
+        from the same state. Every run recomputes all of the residuals, so for partial derivatives
+        the caller restores them once all of the points have been run.
+
         Parameters
         ----------
+        system : System
+            System on which the execution is run.
         input_deltas : list
             List of (input name, indices, delta) tuples, where input name is an absolute name.
+        out_slices : [(str, ndarray), ...]
+            Absolute name and flat indices of each of the results of interest.
+        cache : dict
+            Data of the outputs before the run, as returned by _save_results.
         deriv_type : str
             One of 'total' or 'partial', indicating if total or partial derivatives are being
             approximated.
 
         Returns
         -------
-        Vector
-            Copy of the results from running the perturbed system.
+        [ndarray, ...]
+            Copy of each of the results of interest from running the perturbed system.
         """
         # TODO: MPI
 
@@ -82,12 +638,9 @@ class ApproximationScheme(object):
             else:
                 inputs._views_flat[in_name][idxs] += delta
 
-        # TODO: Grab only results of interest
-        cache = results_vec._clone()
         run_model()
 
-        results = results_vec._clone()
-        results_vec.set_vec(cache)
+        results = [results_vec._views_flat[name][idxs] for name, idxs in out_slices]
 
         for in_name, idxs, delta in input_deltas:
             if in_name in outputs._views_flat:
@@ -95,4 +648,7 @@ class ApproximationScheme(object):
             else:
                 inputs._views_flat[in_name][idxs] -= delta
 
+        if deriv_type == 'total':
+            self._restore_results(results_vec, cache)
+
         return results
@@ -4,15 +4,15 @@ from __future__ import division, print_function
 import numpy as np
 from collections import namedtuple
 from itertools import groupby
-from six.moves import range
 
 from openmdao.approximation_schemes.approximation_scheme import ApproximationScheme
-from openmdao.utils.name_maps import abs_key2rel_key
 
 
 DEFAULT_CS_OPTIONS = {
     'step': 1e-15,
     'form': 'forward',
+    'detect_sparsity': False,
+    'num_par_fd': 1,
 }
 
 
@@ -85,7 +85,7 @@ class ComplexStep(ApproximationScheme):
         # group adjacent items with identical keys.
         self._exec_list.sort(key=self._key_fun)
 
-        # TODO: Automatic sparse FD by constructing a graph of variable dependence?
+        super(ComplexStep, self)._init_approximations()
 
     def compute_approximations(self, system, jac=None, deriv_type='partial'):
         """
@@ -114,9 +114,18 @@ class ComplexStep(ApproximationScheme):
         else:
             raise ValueError('deriv_type must be one of "total" or "partial"')
 
+        if deriv_type == 'total':
+            self._check_point(system)
+
         # Turn on complex step.
         system._inputs._vector_info._under_complex_step = True
 
+        cache = self._save_results(current_vec)
+        imag_cache = self._save_results(current_vec, imag=True)
+        if deriv_type == 'total':
+            input_cache = self._save_results(system._inputs)
+            input_imag_cache = self._save_results(system._inputs, imag=True)
+
         for key, approximations in groupby(self._exec_list, self._key_fun):
             # groupby (along with this key function) will group all 'of's that have the same wrt and
             # step size.
@@ -129,52 +138,83 @@ class ComplexStep(ApproximationScheme):
             elif wrt in system._var_abs2meta['output']:
                 in_size = np.prod(system._var_abs2meta['output'][wrt]['shape'])
 
-            outputs = []
-
-            # Note: If access to `approximations` is required again in the future, we will need to
-            # throw it in a list first. The groupby iterator only works once.
-            for approx_tuple in approximations:
-                of = approx_tuple[0]
-                # TODO: Sparse derivatives
-                out_size = np.prod(system._var_abs2meta['output'][of]['shape'])
-                outputs.append((of, np.zeros((out_size, in_size))))
+            # Total derivatives are only approximated again when the point has changed.
+            approximations = list(approximations)
+            if deriv_type == 'total' and self._reuse_approximations(system, jac, key, wrt,
+                                                                    in_size, approximations):
+                continue
+
+            # Columns that do not affect the same entries of any subjac are perturbed together,
+            # and only the declared (or detected) nonzero entries are computed.
+            colors, subjacs = self._get_coloring(system, key, wrt, in_size, approximations)
+            num_par_fd = max(options.get('num_par_fd', 1) for _, _, options in approximations)
+
+            fact = 1.0 / delta
+            if deriv_type == 'total':
+                # Sign difference between output and resids
+                fact = -fact
+
+            if self._can_batch(system, wrt, deriv_type):
+                # Evaluate every group of columns in a single call.
+                batch = self._run_batch(system, wrt, [(color, delta) for color in colors],
+                                        imag=True)
+                num_par_fd = 1
+
+                def run_point(icolor, out_slices):
+                    return [batch[of][icolor, rows] for of, rows in out_slices]
+            else:
+                def run_point(icolor, out_slices):
+                    input_delta = [(wrt, colors[icolor], delta)]
+                    return self._run_point_complex(system, input_delta, out_slices,
+                                                   (cache, imag_cache), deriv_type)
 
-            for idx in range(in_size):
+            def run_color(icolor):
                 # Run the Finite Difference
-                input_delta = [(wrt, idx, delta)]
-                result = self._run_point_complex(system, input_delta, deriv_type)
+                out_slices = [(subjac[0], subjac[6][icolor][1]) for subjac in subjacs]
+                results = run_point(icolor, out_slices)
 
-                for of, subjac in outputs:
-                    fact = 1.0 / delta
-                    if deriv_type == 'total':
-                        # Sign difference between output and resids
-                        fact = -fact
+                return [result * fact for result in results]
 
-                    subjac[:, idx] = result._imag_views_flat[of] * fact
+            values = self._compute_colors(system, run_color, (colors, subjacs), num_par_fd,
+                                          deriv_type)
+            self._restore_results(current_vec, cache)
+            self._restore_results(current_vec, imag_cache, imag=True)
+            if deriv_type == 'total':
+                # The solves also leave the perturbed values in the inputs.
+                self._restore_results(system._inputs, input_cache)
+                self._restore_results(system._inputs, input_imag_cache, imag=True)
 
-            for of, subjac in outputs:
-                rel_key = abs_key2rel_key(system, (of, wrt))
-                jac[rel_key] = subjac
+            self._set_approximations(system, jac, key, wrt, in_size, (colors, subjacs), values)
+            if deriv_type == 'total':
+                self._approx_values[key] = ((colors, subjacs), values, None)
 
         # Turn off complex step.
         system._inputs._vector_info._under_complex_step = False
 
-    def _run_point_complex(self, system, input_deltas, deriv_type='partial'):
+    def _run_point_complex(self, system, input_deltas, out_slices, cache,
+                           deriv_type='partial'):
         """
         Perturb the system inputs with a complex step, runs, and returns the results.
 
         Parameters
         ----------
+        system : System
+            System on which the execution is run.
         input_deltas : list
             List of (input name, indices, delta) tuples, where input name is an absolute name.
+        out_slices : [(str, ndarray), ...]
+            Absolute name and flat indices of each of the results of interest.
+        cache : (dict, dict)
+            Real and imaginary data of the outputs before the run, as returned by _save_results.
         deriv_type : str
             One of 'total' or 'partial', indicating if total or partial derivatives are being
             approximated.
 
         Returns
         -------
-        Vector
-            Copy of the results from running the perturbed system.
+        [ndarray, ...]
+            Copy of the imaginary part of each of the results of interest from running the
+            perturbed system.
         """
         # TODO: MPI
 
@@ -196,13 +236,9 @@ class ComplexStep(ApproximationScheme):
             else:
                 inputs._imag_views_flat[in_name][idxs] += delta
 
-        # TODO: A full clone here (and below) is overkill.
-        cache = results_vec._clone(initialize_views=True)
         run_model()
 
-        # TODO: Grab only results of interest
-        results = results_vec._clone(initialize_views=True)
-        results_vec.set_vec(cache)
+        results = [results_vec._imag_views_flat[name][idxs] for name, idxs in out_slices]
 
         for in_name, idxs, delta in input_deltas:
             if in_name in outputs._imag_views_flat:
@@ -210,4 +246,8 @@ class ComplexStep(ApproximationScheme):
             else:
                 inputs._imag_views_flat[in_name][idxs] -= delta
 
+        if deriv_type == 'total':
+            self._restore_results(results_vec, cache[0])
+            self._restore_results(results_vec, cache[1], imag=True)
+
         return results
@@ -4,10 +4,8 @@ from __future__ import division, print_function
 import numpy as np
 from collections import namedtuple
 from itertools import groupby
-from six.moves import range
 
 from openmdao.approximation_schemes.approximation_scheme import ApproximationScheme
-from openmdao.utils.name_maps import abs_key2rel_key
 
 
 FDForm = namedtuple('FDForm', ['deltas', 'coeffs', 'current_coeff'])
@@ -17,6 +15,8 @@ DEFAULT_FD_OPTIONS = {
     'form': 'forward',
     'order': None,
     'step_calc': 'abs',
+    'detect_sparsity': False,
+    'num_par_fd': 1,
 }
 
 DEFAULT_ORDER = {
@@ -80,6 +80,9 @@ class FiniteDifference(ApproximationScheme):
         A list of which derivatives (in execution order) to compute.
         The entries are of the form (of, wrt, fd_options), where of and wrt are absolute names
         and fd_options is a dictionary.
+    _auto_steps : dict
+        Steps estimated for the columns of each set of approximations with step_calc 'auto',
+        reused until the next setup.
     """
 
     def __init__(self):
@@ -88,6 +91,7 @@ class FiniteDifference(ApproximationScheme):
         """
         super(FiniteDifference, self).__init__()
         self._exec_list = []
+        self._auto_steps = {}
 
     def add_approximation(self, abs_key, kwargs):
         """
@@ -135,7 +139,13 @@ class FiniteDifference(ApproximationScheme):
         # group adjacent items with identical keys.
         self._exec_list.sort(key=self._key_fun)
 
-        # TODO: Automatic sparse FD by constructing a graph of variable dependence?
+        super(FiniteDifference, self)._init_approximations()
+
+    def _setup(self):
+        """
+        Forget the estimated steps.
+        """
+        self._auto_steps = {}
 
     def compute_approximations(self, system, jac=None, deriv_type='partial'):
         """
@@ -164,6 +174,12 @@ class FiniteDifference(ApproximationScheme):
         else:
             raise ValueError('deriv_type must be one of "total" or "partial"')
 
+        cache = self._save_results(current_vec)
+
+        if deriv_type == 'total':
+            self._check_point(system)
+            input_cache = self._save_results(system._inputs)
+
         for key, approximations in groupby(self._exec_list, self._key_fun):
             # groupby (along with this key function) will group all 'of's that have the same wrt and
             # step size.
@@ -178,6 +194,21 @@ class FiniteDifference(ApproximationScheme):
             # as deltas = [-2, -1, 1, 2] * h, coeffs = [1/12, -2/3, 2/3 , -1/12] * 1/h,
             # current_coeff = 0.
             fd_form = _generate_fd_coeff(form, order)
+            approximations = list(approximations)
+
+            if wrt in system._var_abs2meta['input']:
+                in_size = np.prod(system._var_abs2meta['input'][wrt]['shape'])
+            elif wrt in system._var_abs2meta['output']:
+                in_size = np.prod(system._var_abs2meta['output'][wrt]['shape'])
+
+            # Total derivatives are only approximated again when the point has changed.
+            if deriv_type == 'total' and self._reuse_approximations(system, jac, key, wrt,
+                                                                    in_size, approximations):
+                continue
+
+            # Columns that do not affect the same entries of any subjac are perturbed together,
+            # and only the declared (or detected) nonzero entries are computed.
+            colors, subjacs = self._get_coloring(system, key, wrt, in_size, approximations)
 
             if step_calc == 'rel':
                 if wrt in system._outputs._views_flat:
@@ -186,49 +217,174 @@ class FiniteDifference(ApproximationScheme):
                     scale = np.linalg.norm(system._inputs._views_flat[wrt])
                 step *= scale
 
-            deltas = fd_form.deltas * step
-            coeffs = fd_form.coeffs / step
-            current_coeff = fd_form.current_coeff / step
+            # The step of each column of wrt
+            if step_calc == 'auto':
+                steps = self._get_auto_steps(system, key, in_size, (colors, subjacs), cache,
+                                             deriv_type)
+            else:
+                steps = np.full(in_size, step)
+
+            deltas = fd_form.deltas
+            coeffs = fd_form.coeffs
+            current_coeff = fd_form.current_coeff
+            num_par_fd = max(options.get('num_par_fd', 1) for _, _, options in approximations)
+
+            if deriv_type == 'total':
+                # Sign difference between output and resids. This arises from the definitions
+                # in the unified derivatives equations.
+                # For ExplicitComponent: resid = output(n-1) - output(n)
+                # so dresid/d* = - doutput/d*
+                coeffs = -coeffs
+                current_coeff = -current_coeff
+
+            # Only the entries of interest of the results are extracted from each run, and
+            # combined with their current values.
+            currents = [current_vec._views_flat[subjac[0]].copy() for subjac in subjacs]
+
+            if self._can_batch(system, wrt, deriv_type):
+                # Evaluate every point of every group of columns in a single call.
+                batch = self._run_batch(system, wrt, [(color, delta * steps[color])
+                                                      for color in colors for delta in deltas])
+                num_par_fd = 1
+
+                def run_point(icolor, idelta, out_slices):
+                    ipoint = icolor * len(deltas) + idelta
+                    return [batch[of][ipoint, rows] for of, rows in out_slices]
+            else:
+                def run_point(icolor, idelta, out_slices):
+                    color = colors[icolor]
+                    input_delta = [(wrt, color, deltas[idelta] * steps[color])]
+                    return self._run_point(system, input_delta, out_slices, cache, deriv_type)
+
+            def run_color(icolor):
+                out_slices = [(subjac[0], subjac[6][icolor][1]) for subjac in subjacs]
+                results = [current_coeff * current[rows]
+                           for current, (_, rows) in zip(currents, out_slices)]
 
-            if wrt in system._var_abs2meta['input']:
-                in_size = np.prod(system._var_abs2meta['input'][wrt]['shape'])
-            elif wrt in system._var_abs2meta['output']:
-                in_size = np.prod(system._var_abs2meta['output'][wrt]['shape'])
+                # Run the Finite Difference
+                for idelta, coeff in enumerate(coeffs):
+                    point = run_point(icolor, idelta, out_slices)
+                    for result, point_result in zip(results, point):
+                        result += coeff * point_result
+
+                # Each entry is divided by the step of its column.
+                return [result / steps[subjac[2][subjac[6][icolor][0]]]
+                        for result, subjac in zip(results, subjacs)]
+
+            values = self._compute_colors(system, run_color, (colors, subjacs), num_par_fd,
+                                          deriv_type)
+            self._restore_results(current_vec, cache)
+            if deriv_type == 'total':
+                # The solves also leave the perturbed values in the inputs.
+                self._restore_results(system._inputs, input_cache)
+
+            # When detecting the sparsity, differences within round-off of the outputs are zero.
+            tols = [100. * np.finfo(float).eps / np.abs(steps).min() *
+                    max(1.0, np.linalg.norm(system._outputs._views_flat[subjac[0]], np.inf))
+                    if subjac[4] else 0.0 for subjac in subjacs]
+
+            self._set_approximations(system, jac, key, wrt, in_size, (colors, subjacs), values,
+                                     tols)
+            if deriv_type == 'total':
+                self._approx_values[key] = ((colors, subjacs), values, tols)
+
+    def _get_auto_steps(self, system, key, in_size, coloring, cache, deriv_type):
+        """
+        Estimate the steps that balance the truncation and round-off errors of a difference.
+
+        The second (for forward and backward differences) or third (for central differences)
+        derivative of the results along each column of wrt is estimated with a few extra runs
+        per group of columns, using a step that is accurate for that difference. The step of
+        each column is then chosen to minimize the sum of the truncation error and the round-off
+        error, which is taken relative to the magnitude of the outputs that the column affects.
+        The estimates are reused until the next setup.
 
-            result = system._outputs._clone(True)
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        key : tuple
+            Key of the set of approximations, (wrt, form, order, step, step_calc).
+        in_size : int
+            Size of wrt.
+        coloring : tuple
+            Column groups and subjac sparsity, as returned by _get_coloring.
+        cache : dict
+            Data of the results vector before the runs, as returned by _save_results.
+        deriv_type : str
+            One of 'total' or 'partial', indicating if total or partial derivatives are being
+            approximated.
 
-            outputs = []
+        Returns
+        -------
+        ndarray
+            The estimated step of each column of wrt.
+        """
+        steps = self._auto_steps.get(key)
+        if steps is not None:
+            return steps
 
-            # Note: If access to `approximations` is required again in the future, we will need to
-            # throw it in a list first. The groupby iterator only works once.
-            for approx_tuple in approximations:
-                of = approx_tuple[0]
-                # TODO: Sparse derivatives
-                out_size = np.prod(system._var_abs2meta['output'][of]['shape'])
-                outputs.append((of, np.zeros((out_size, in_size))))
+        wrt, form = key[:2]
+        colors, subjacs = coloring
+        eps = np.finfo(float).eps
+        outputs = system._outputs._views_flat
 
-            for idx in range(in_size):
-                if current_coeff:
-                    result.set_vec(current_vec)
-                    result *= current_coeff
-                else:
-                    result.set_const(0.)
+        if wrt in outputs:
+            typical = np.maximum(1.0, np.abs(outputs[wrt]))
+        else:
+            typical = np.maximum(1.0, np.abs(system._inputs._views_flat[wrt]))
 
-                # Run the Finite Difference
-                for delta, coeff in zip(deltas, coeffs):
-                    input_delta = [(wrt, idx, delta)]
-                    result.add_scal_vec(coeff, self._run_point(system, input_delta, deriv_type))
-
-                if deriv_type == 'total':
-                    # Sign difference between output and resids. This arises from the definitions
-                    # in the unified derivatives equations.
-                    # For ExplicitComponent: resid = output(n-1) - output(n)
-                    # so dresid/d* = - doutput/d*
-                    result *= -1.0
-
-                for of, subjac in outputs:
-                    subjac[:, idx] = result._views_flat[of]
-
-            for of, subjac in outputs:
-                rel_key = abs_key2rel_key(system, (of, wrt))
-                jac[rel_key] = subjac
+        if deriv_type == 'total':
+            current_vec = system._outputs
+        else:
+            current_vec = system._residuals
+        currents = [current_vec._views_flat[subjac[0]].copy() for subjac in subjacs]
+
+        if form == 'central':
+            # The third difference, divided by 2 * h**3.
+            h = eps ** (1. / 5.) * typical
+            power = 3
+            deltas, coeffs, current_coeff = [2., 1., -1., -2.], [.5, -1., 1., -.5], 0.
+        else:
+            # The second difference, divided by h**2.
+            h = eps ** (1. / 4.) * typical
+            power = 2
+            deltas, coeffs, current_coeff = [1., -1.], [1., 1.], -2.
+
+        # Largest estimated derivative, and magnitude of the outputs, in each column.
+        derivs = np.zeros(in_size)
+        scales = np.ones(in_size)
+
+        for icolor, color in enumerate(colors):
+            out_slices = [(subjac[0], subjac[6][icolor][1]) for subjac in subjacs]
+            diffs = [current_coeff * current[rows]
+                     for current, (_, rows) in zip(currents, out_slices)]
+
+            for delta, coeff in zip(deltas, coeffs):
+                point = self._run_point(system, [(wrt, color, delta * h[color])], out_slices,
+                                        cache, deriv_type)
+                for diff, point_result in zip(diffs, point):
+                    diff += coeff * point_result
+
+            for subjac, diff, (of, rows) in zip(subjacs, diffs, out_slices):
+                cols = subjac[2][subjac[6][icolor][0]]
+                np.maximum.at(derivs, cols, np.abs(diff) / h[cols] ** power)
+                np.maximum.at(scales, cols, np.abs(outputs[of][rows]))
+
+        err = eps * scales
+        if form == 'central':
+            # The truncation error is h**2 / 6 times the third derivative, and the round-off error
+            # is err / h. The third difference has a round-off error of about 3 * err / h**3.
+            derivs = np.maximum(derivs, 3. * err / h ** 3)
+            steps = (3. * err / derivs) ** (1. / 3.)
+        else:
+            # The truncation error is h / 2 times the second derivative, and the round-off error
+            # is 2 * err / h. The second difference has a round-off error of about 4 * err / h**2.
+            derivs = np.maximum(derivs, 4. * err / h ** 2)
+            steps = 2. * np.sqrt(err / derivs)
+
+        # Every run recomputes the residuals, so put them back for the approximation.
+        self._restore_results(current_vec, cache)
+
+        self._auto_steps[key] = steps
+        return steps
@@ -12,6 +12,7 @@ from six import string_types
 from six.moves import range
 
 from openmdao.core.explicitcomponent import ExplicitComponent
+from openmdao.vectors.vector import Vector
 
 # regex to check for variable names.
 VAR_RGX = re.compile('([_a-zA-Z]\w*[ ]*\(?)')
@@ -52,7 +53,7 @@ class ExecComp(ExplicitComponent):
     A component defined by an expression string.
     """
 
-    def __init__(self, exprs, **kwargs):
+    def __init__(self, exprs, vectorize=False, **kwargs):
         r"""
         Create a <Component> using only an expression string.
 
@@ -69,6 +70,12 @@ class ExecComp(ExplicitComponent):
             An assignment statement or iter of them. These express how the
             outputs are calculated based on the inputs.
 
+        vectorize : bool
+            If True, the expressions are assumed to be elementwise, so the
+            partial of each array output with respect to each array input of
+            the same size is declared diagonal, and computed with a single
+            complex step of all of the entries of the input.
+
         \*\*kwargs : dict of named args
             Initial values of variables can be set by setting a named
             arg with the var name.  If the value is a dict it is assumed
@@ -114,8 +121,14 @@ class ExecComp(ExplicitComponent):
             exprs = [exprs]
 
         self._exprs = exprs[:]
-        self._codes = None
+        self._func = None
+        self._arg_names = []
+        self._out_names = []
+        self._arg_abs_names = []
+        self._out_abs_names = []
         self._kwargs = kwargs
+        self._vectorize = vectorize
+        self._diag_partials = set()
 
     def setup(self):
         """
@@ -166,17 +179,54 @@ class ExecComp(ExplicitComponent):
             else:
                 self.add_input(var, val, **meta)
 
-        self._codes = self._compile_exprs(self._exprs)
+        self._diag_partials = set()
+        if self._vectorize:
+            sizes = {var: np.prod(self._var_rel2data_io[var]['metadata']['shape'])
+                     for var in allvars}
+            for out in sorted(outs):
+                for inp in sorted(allvars - outs):
+                    if sizes[out] == sizes[inp] > 1:
+                        arange = np.arange(sizes[out])
+                        self.declare_partials(out, inp, rows=arange, cols=arange)
+                        self._diag_partials.add((out, inp))
+
+        prefix = self.pathname + '.' if self.pathname else ''
+        self._arg_names = sorted(allvars)
+        self._out_names = sorted(outs)
+        self._arg_abs_names = [(prefix + var, var in outs) for var in self._arg_names]
+        self._out_abs_names = [prefix + var for var in self._out_names]
+
+        self._func = self._compile_exprs(self._exprs)
 
     def _compile_exprs(self, exprs):
-        compiled = []
-        for i, expr in enumerate(exprs):
+        """
+        Compile the expressions into one function of the variables that returns the outputs.
+
+        Parameters
+        ----------
+        exprs : list of str
+            The assignment statements.
+
+        Returns
+        -------
+        function
+            Function taking the values of the variables in sorted order, and returning the
+            values of the outputs in sorted order.
+        """
+        for expr in exprs:
             try:
-                compiled.append(compile(expr, expr, 'exec'))
+                compile(expr, expr, 'exec')
             except Exception:
                 raise RuntimeError("%s: failed to compile expression '%s'." %
-                                   (self.pathname, exprs[i]))
-        return compiled
+                                   (self.pathname, expr))
+
+        lines = ['def _exec_comp_func(%s):' % ', '.join(self._arg_names)]
+        lines.extend('    %s' % expr.strip() for expr in exprs)
+        lines.append('    return (%s)' % ''.join('%s, ' % name for name in self._out_names))
+
+        namespace = {}
+        exec(compile('\n'.join(lines), '; '.join(exprs), 'exec'), _expr_dict, namespace)
+        return namespace['_exec_comp_func']
 
     def _parse_for_out_vars(self, s):
         vnames = set([x.strip() for x in re.findall(VAR_RGX, s)
@@ -207,7 +257,7 @@ class ExecComp(ExplicitComponent):
         Return state as a dict.
         """
         state = self.__dict__.copy()
-        del state['_codes']
+        del state['_func']
         return state
 
     def __setstate__(self, state):
@@ -215,7 +265,7 @@ class ExecComp(ExplicitComponent):
         Restore state from `state`.
         """
         self.__dict__.update(state)
-        self._codes = self._compile_exprs(self._exprs)
+        self._func = self._compile_exprs(self._exprs)
 
     def compute(self, inputs, outputs):
         """
@@ -229,8 +279,23 @@ class ExecComp(ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        for expr in self._codes:
-            exec(expr, _expr_dict, _IODict(outputs, inputs))
+        if isinstance(inputs, Vector) and not inputs._vector_info._under_complex_step:
+            # Pass the views of the variables directly, which avoids the lookups by name.
+            in_views = inputs._views
+            out_views = outputs._views
+            results = self._func(*[out_views[abs_name] if is_out else in_views[abs_name]
+                                   for abs_name, is_out in self._arg_abs_names])
+
+            for abs_name, val in zip(self._out_abs_names, results):
+                view = out_views[abs_name]
+                if val is not view:
+                    view[:] = val
+        else:
+            iodict = _IODict(outputs, inputs)
+            results = self._func(*[iodict[name] for name in self._arg_names])
+
+            for name, val in zip(self._out_names, results):
+                outputs[name] = val
 
     def compute_partials(self, inputs, outputs, partials):
         """
@@ -253,6 +318,9 @@ class ExecComp(ExplicitComponent):
 
         for param in inputs:
 
+            diag_names = [u for u in out_names if (u, param) in self._diag_partials]
+            dense_names = [u for u in out_names if (u, param) not in self._diag_partials]
+
             pwrap = _TmpDict(inputs)
 
             pval = inputs[param]
@@ -266,6 +334,24 @@ class ExecComp(ExplicitComponent):
                 idx_iter = (None,)
                 psize = 1
 
+            if diag_names:
+                # Each entry of these outputs only depends on the same entry of the param, so
+                # stepping all of the entries at once gives the whole diagonal.
+                pwrap[param] += step
+
+                uwrap = _TmpDict(outputs, return_complex=True)
+
+                self._residuals.set_const(0.0)
+                self.compute(pwrap, uwrap)
+
+                for u in diag_names:
+                    partials[(u, param)] = imag(uwrap[u] / self.complex_stepsize).flatten()
+
+                pwrap[param] -= step
+
+                if not dense_names:
+                    continue
+
             for i, idx in enumerate(idx_iter):
                 # set a complex param value
                 if idx is None:
@@ -279,7 +365,7 @@ class ExecComp(ExplicitComponent):
                 self._residuals.set_const(0.0)
                 self.compute(pwrap, uwrap)
 
-                for u in out_names:
+                for u in dense_names:
                     jval = imag(uwrap[u] / self.complex_stepsize)
                     if (u, param) not in partials:  # create the dict entry
                         partials[(u, param)] = np.zeros((jval.size, psize))
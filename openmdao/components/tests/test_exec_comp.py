@@ -208,6 +208,24 @@ class TestExecComp(unittest.TestCase):
         assert_rel_error(self, data['comp'][('y','x')]['rel error'][1], 0.0, 1e-5)
         assert_rel_error(self, data['comp'][('y','x')]['rel error'][2], 0.0, 1e-5)
 
+    def test_chained_exprs(self):
+        prob = Problem(model=Group())
+        C1 = prob.model.add_subsystem('C1', ExecComp(['y=2.0*x', 'z[1]=y[0]+1.', 'w=sum(z)'],
+                                                     x=np.array([1., 2.]), y=np.zeros(2),
+                                                     z=np.zeros(2)))
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        # later expressions see the outputs computed by earlier ones
+        assert_rel_error(self, C1._outputs['y'], [2., 4.], 1e-15)
+        assert_rel_error(self, C1._outputs['z'], [0., 3.], 1e-15)
+        assert_rel_error(self, C1._outputs['w'], 3.0, 1e-15)
+
+        data = prob.check_partials(out_stream=None)
+        assert_rel_error(self, data['C1'][('w', 'x')]['abs error'][0], 0.0, 1e-5)
+
     def test_complex_step(self):
         prob = Problem(model=Group())
         C1 = prob.model.add_subsystem('C1', ExecComp(['y=2.0*x+1.'], x=2.0))
@@ -301,6 +319,34 @@ class TestExecComp(unittest.TestCase):
 
         assert_rel_error(self, C1.jacobian['y','x'], expect, 0.00001)
 
+    def test_vectorize(self):
+        prob = Problem(model=Group())
+        prob.model.add_subsystem('p1', IndepVarComp('x', np.arange(1.0, 6.0)))
+        prob.model.add_subsystem('p2', IndepVarComp('a', 3.0))
+        C1 = prob.model.add_subsystem('C1', ExecComp(['y=2.0*x**2 + a*sin(x)', 'z=numpy.sum(x)'],
+                                                     vectorize=True,
+                                                     x=np.ones(5), y=np.zeros(5)))
+        prob.model.connect('p1.x', 'C1.x')
+        prob.model.connect('p2.a', 'C1.a')
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        # only the array output and input of the same size are diagonal
+        self.assertEqual(C1._diag_partials, set([('y', 'x')]))
+        assert_rel_error(self, C1._subjacs_info['C1.y', 'C1.x']['rows'], np.arange(5), 1e-15)
+
+        x = np.arange(1.0, 6.0)
+        J = prob.compute_total_derivs(['C1.y', 'C1.z'], ['p1.x', 'p2.a'])
+        assert_rel_error(self, J['C1.y', 'p1.x'], np.diag(4.0 * x + 3.0 * np.cos(x)), 1e-10)
+        assert_rel_error(self, J['C1.y', 'p2.a'], np.sin(x).reshape((5, 1)), 1e-10)
+        assert_rel_error(self, J['C1.z', 'p1.x'], np.ones((1, 5)), 1e-10)
+
+        data = prob.check_partials(out_stream=None)
+        for key in [('y', 'x'), ('y', 'a'), ('z', 'x')]:
+            assert_rel_error(self, data['C1'][key]['abs error'][0], 0.0, 1e-5)
+
 
 if __name__ == "__main__":
     unittest.main()
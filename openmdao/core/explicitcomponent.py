@@ -6,6 +6,7 @@ import inspect
 
 import numpy as np
 from six import itervalues, iteritems
+from six.moves import range
 from itertools import product
 
 from openmdao.core.component import Component
@@ -18,8 +19,17 @@ from openmdao.recorders.recording_iteration_stack import Recording
 class ExplicitComponent(Component):
     """
     Class to inherit from when all output variables are explicit.
+
+    Attributes
+    ----------
+    batched : bool
+        Class attribute that subclasses set to True when compute_batch evaluates the points with
+        vectorized operations, so that the approximations of their partial derivatives evaluate
+        all of the perturbed points of an input in a single call.
     """
 
+    batched = False
+
     def __init__(self, **kwargs):
         """
         Check if we are matrix-free.
@@ -329,6 +339,35 @@ class ExplicitComponent(Component):
         """
         pass
 
+    def compute_batch(self, inputs, outputs):
+        """
+        Compute outputs for a batch of inputs. The model is assumed to be in an unscaled state.
+
+        This is only called when the batched attribute is True, to evaluate the points of the
+        finite difference and complex step approximations of the partial derivatives all at once.
+        Every variable has an additional leading axis that holds the points. By default, compute
+        is called for each point.
+
+        Parameters
+        ----------
+        inputs : dict
+            unscaled, dimensional input variables of shape (num_points,) + shape, keyed by name.
+        outputs : dict
+            unscaled, dimensional output variables of shape (num_points,) + shape, keyed by name,
+            to be filled in.
+        """
+        num_points = len(next(itervalues(inputs)))
+
+        for ipoint in range(num_points):
+            point_inputs = {name: val[ipoint] for name, val in iteritems(inputs)}
+            point_outputs = {name: val[ipoint] for name, val in iteritems(outputs)}
+
+            self.compute(point_inputs, point_outputs)
+
+            # compute may either fill in the given arrays or replace them.
+            for name, val in iteritems(point_outputs):
+                outputs[name][ipoint] = val
+
     def compute_partials(self, inputs, outputs, partials):
         """
         Compute sub-jacobian parts. The model is assumed to be in an unscaled state.
@@ -18,7 +18,7 @@ from openmdao.proc_allocators.proc_allocator import ProcAllocationError
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.solvers.nonlinear.nonlinear_runonce import NonLinearRunOnce
 from openmdao.solvers.linear.linear_runonce import LinearRunOnce
-from openmdao.utils.array_utils import convert_neg
+from openmdao.utils.array_utils import convert_neg, ravel_src_indices
 from openmdao.utils.general_utils import warn_deprecation
 from openmdao.utils.units import is_compatible
 
@@ -730,13 +730,7 @@ class Group(System):
                         src_indices = src_indices.flatten()
                         src_indices = convert_neg(src_indices, global_size_out)
                     else:
-                        # TODO: this duplicates code found
-                        # in System._setup_scaling.
-                        entries = [list(range(x)) for x in shape_in]
-                        cols = np.vstack(src_indices[i] for i in product(*entries))
-                        dimidxs = [convert_neg(cols[:, i], global_shape_out[i])
-                                   for i in range(cols.shape[1])]
-                        src_indices = np.ravel_multi_index(dimidxs, global_shape_out)
+                        src_indices = ravel_src_indices(src_indices, global_shape_out)
 
                 # 1. Compute the output indices
                 output_inds = np.zeros(src_indices.shape[0], int)
@@ -1234,7 +1228,8 @@ class Group(System):
             self._nonlinear_solver._linearize()
 
         if self._linear_solver is not None and do_ln:
-            self._linear_solver._linearize()
+            with self._linear_solver._telemetry._phase('linearize'):
+                self._linear_solver._linearize()
 
     def approx_total_derivs(self, method='fd', **kwargs):
         """
@@ -1262,6 +1257,11 @@ class Group(System):
         self._owns_approx_jac = True
         self._owns_approx_jac_meta = dict(kwargs)
 
+        # The new scheme has no approximations yet, so they must be set up again for the
+        # derivatives that are requested next.
+        self._owns_approx_of = None
+        self._owns_approx_wrt = None
+
     def _setup_jacobians(self, jacobian=None, recurse=True):
         """
         Set and populate jacobians down through the system tree.
@@ -1283,6 +1283,8 @@ class Group(System):
         if self._owns_approx_jac:
             method = list(self._approx_schemes.keys())[0]
             approx = self._approx_schemes[method]
+            approx._exec_list = []
+            saved = approx._approx_point, approx._approx_values
             pro2abs = self._var_allprocs_prom2abs_list
 
             if self._owns_approx_of:
@@ -1347,6 +1349,11 @@ class Group(System):
 
             approx._init_approximations()
 
+            if not recurse:
+                # Only the requested derivatives have changed (see Problem), so the derivatives
+                # that were approximated at the current point can still be used.
+                approx._approx_point, approx._approx_values = saved
+
             self._jacobian._system = self
             self._jacobian._initialize()
 
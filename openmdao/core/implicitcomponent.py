@@ -178,7 +178,8 @@ class ImplicitComponent(Component):
             self._nonlinear_solver._linearize()
 
         if self._linear_solver is not None and do_ln:
-            self._linear_solver._linearize()
+            with self._linear_solver._telemetry._phase('linearize'):
+                self._linear_solver._linearize()
 
     def apply_nonlinear(self, inputs, outputs, residuals):
         """
@@ -22,6 +22,7 @@ from openmdao.error_checking.check_config import check_config
 from openmdao.recorders.recording_iteration_stack import recording_iteration_stack
 from openmdao.utils.general_utils import warn_deprecation
 from openmdao.utils.mpi import MPI, FakeComm
+from openmdao.utils.thread_utils import close_thread_pools
 from openmdao.vectors.default_vector import DefaultVector
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -240,6 +241,14 @@ class Problem(object):
         """
         self.driver.cleanup()
 
+        # Close the recorders of the systems and solvers so that buffered records are written.
+        for system in self.model.system_iter(include_self=True, recurse=True):
+            system._rec_mgr.close()
+            for slot, solver in system._get_solvers():
+                solver._rec_mgr.close()
+
+        close_thread_pools()
+
     def setup(self, vector_class=DefaultVector, check=True, logger=None, mode='auto',
               force_alloc_complex=False):
         """
@@ -734,20 +743,13 @@ class Problem(object):
         # This cuts out the middleman by grabbing the Jacobian directly after linearization.
         if approx:
 
-            # Re-initialize so that it is clean.
-            if model._approx_schemes:
-                method = list(model._approx_schemes.keys())[0]
-                model.approx_total_derivs(method=method)
-            else:
-                model.approx_total_derivs(method='fd')
-
-            # Initialization based on driver (or user) -requested "of" and "wrt".
-            if not model._owns_approx_jac or model._owns_approx_of != set(of) \
-               or model._owns_approx_wrt != set(wrt):
+            # Initialization based on driver (or user) -requested "of" and "wrt". This is only
+            # redone when they change, so that the approximations keep what they cached.
+            if model._owns_approx_of != set(of) or model._owns_approx_wrt != set(wrt):
                 model._owns_approx_of = set(of)
                 model._owns_approx_wrt = set(wrt)
 
-            model._setup_jacobians(recurse=False)
+                model._setup_jacobians(recurse=False)
 
             model._linearize()
             approx_jac = model._jacobian._subjacs
@@ -904,6 +906,18 @@ class Problem(object):
 
         self.model._set_solver_print(level=level, depth=depth, type_=type_)
 
+    def get_solver_telemetry(self):
+        """
+        Return the timing and iteration statistics of all solvers in the model.
+
+        Returns
+        -------
+        dict
+            Statistics of each solver keyed by the pathname of its system and its slot,
+            e.g., ('sub', 'nonlinear_solver.linesearch'). See System.get_solver_telemetry.
+        """
+        return self.model.get_solver_telemetry()
+
 
 def _assemble_derivative_data(derivative_data, rel_error_tol, abs_error_tol, out_stream,
                               compact_print, system_list, global_options):
@@ -6,15 +6,14 @@ from collections import OrderedDict, Iterable
 from fnmatch import fnmatchcase
 import sys
 import inspect
-from itertools import product
 
-from six import iteritems, string_types
-from six.moves import range
+from six import iteritems, itervalues, string_types
 
 import numpy as np
 
 from openmdao.jacobians.dictionary_jacobian import DictionaryJacobian
-from openmdao.jacobians.assembled_jacobian import AssembledJacobian, DenseJacobian
+from openmdao.jacobians.assembled_jacobian import AssembledJacobian
+from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.proc_allocators.default_allocator import DefaultAllocator
 
 from openmdao.utils.general_utils import \
@@ -23,7 +22,7 @@ from openmdao.recorders.recording_manager import RecordingManager
 from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.units import convert_units
-from openmdao.utils.array_utils import convert_neg
+from openmdao.utils.array_utils import convert_neg, ravel_src_indices
 from openmdao.utils.record_util import create_local_meta
 
 
@@ -180,6 +179,9 @@ class System(object):
         Overrides aproximation inputs.
     _owns_approx_of : set or None
         Overrides aproximation outputs.
+    _solve_nonlinear_state : [ndarray, ...] or None
+        Copies of the nonlinear input and output data after the last call of
+        _solve_nonlinear_if_changed that ran _solve_nonlinear.
     _subjacs_info : OrderedDict of dict
         Sub-jacobian metadata for each (output, input) pair added using
         declare_partials. Members of each pair may be glob patterns.
@@ -298,6 +300,8 @@ class System(object):
         self._owns_approx_wrt = None
         self._owns_approx_of = None
 
+        self._solve_nonlinear_state = None
+
         self._design_vars = {}
         self._responses = {}
         self._rec_mgr = RecordingManager()
@@ -668,6 +672,10 @@ class System(object):
         self._setup_partials(recurse=recurse)
         self._setup_jacobians(recurse=recurse)
 
+        for sub in self.system_iter(recurse=recurse, include_self=True):
+            for approximation in itervalues(sub._approx_schemes):
+                approximation._setup()
+
         # If full or reconf setup, reset this system's variables to initial values.
         if setup_mode in ('full', 'reconf'):
             self.set_initial_values()
@@ -1039,7 +1047,6 @@ class System(object):
                 shape_out = meta_out['shape']
                 units_out = meta_out['units']
                 distrib_out = meta_out['distributed']
-                shape_in = meta_in['shape']
                 units_in = meta_in['units']
 
                 ref = meta_out['ref']
@@ -1055,11 +1062,7 @@ class System(object):
                                 src_indices = src_indices.flatten()
                                 src_indices = convert_neg(src_indices, src_indices.size)
                             else:
-                                entries = [list(range(x)) for x in shape_in]
-                                cols = np.vstack(src_indices[i] for i in product(*entries))
-                                dimidxs = [convert_neg(cols[:, i], global_shape_out[i])
-                                           for i in range(cols.shape[1])]
-                                src_indices = np.ravel_multi_index(dimidxs, global_shape_out)
+                                src_indices = ravel_src_indices(src_indices, global_shape_out)
 
                         # TODO: if either ref or ref0 are not scalar and the output is
                         # distributed, we need to do a scatter
@@ -1163,10 +1166,11 @@ class System(object):
         if jacobian is not None:
             # this means that somewhere above us is an AssembledJacobian. If
             # we have a nonlinear solver that uses derivatives, this is
-            # currently an error if the AssembledJacobian is not a DenseJacobian.
-            # In a future story we'll add support for sparse AssembledJacobians.
+            # currently an error if the AssembledJacobian is not dense ('auto' will pick a dense
+            # matrix in that case). In a future story we'll add support for sparse
+            # AssembledJacobians.
             if self._nonlinear_solver is not None and self._nonlinear_solver.supports['gradients']:
-                if not isinstance(jacobian, DenseJacobian):
+                if jacobian.options['matrix_class'] not in (DenseMatrix, 'auto'):
                     raise RuntimeError("System '%s' has a solver of type '%s'"
                                        "but a sparse AssembledJacobian has been set in a "
                                        "higher level system." %
@@ -1699,6 +1703,74 @@ class System(object):
             if subsys.nonlinear_solver is not None and type_ != 'LN':
                 subsys.nonlinear_solver._set_solver_print(level=level, type_=type_)
 
+    def _get_solvers(self):
+        """
+        Return the solvers of this system, including the solvers nested in them.
+
+        Solvers that are shared, such as the linear solver used by a Newton solver, are only
+        returned once.
+
+        Returns
+        -------
+        [(str, <Solver>), ...]
+            Slot and instance of each solver, where the slot of a nested solver is prefixed with
+            the slot of the solver that contains it (e.g., 'nonlinear_solver.linesearch').
+        """
+        solvers = []
+        seen = set()
+
+        # The linear solver is visited first so that it keeps its own slot when it is also used
+        # by the nonlinear solver.
+        stack = [(slot, solver) for slot, solver in (('nonlinear_solver', self._nonlinear_solver),
+                                                     ('linear_solver', self._linear_solver))
+                 if solver is not None]
+
+        while stack:
+            slot, solver = stack.pop()
+            if id(solver) in seen:
+                continue
+            seen.add(id(solver))
+            solvers.append((slot, solver))
+            stack.extend(('.'.join((slot, name)), subsolver)
+                         for name, subsolver in reversed(solver._get_subsolvers()))
+
+        return solvers
+
+    def get_solver_telemetry(self, recurse=True):
+        """
+        Return the timing and iteration statistics of the solvers in this system.
+
+        Parameters
+        ----------
+        recurse : bool
+            If True, include the solvers of all subsystems on this proc.
+
+        Returns
+        -------
+        dict
+            Statistics of each solver, as returned by its get_telemetry method, keyed by the
+            pathname of the system and the slot of the solver (e.g., ('sub', 'linear_solver')).
+        """
+        telemetry = OrderedDict()
+        for system in self.system_iter(include_self=True, recurse=recurse):
+            for slot, solver in system._get_solvers():
+                telemetry[system.pathname, slot] = solver.get_telemetry()
+
+        return telemetry
+
+    def reset_solver_telemetry(self, recurse=True):
+        """
+        Set the timing and iteration statistics of the solvers in this system to zero.
+
+        Parameters
+        ----------
+        recurse : bool
+            If True, also reset the solvers of all subsystems on this proc.
+        """
+        for system in self.system_iter(include_self=True, recurse=recurse):
+            for slot, solver in system._get_solvers():
+                solver._telemetry.reset()
+
     @property
     def proc_allocator(self):
         """
@@ -2565,6 +2637,48 @@ class System(object):
 
         return False, 0., 0.
 
+    def _get_nonlinear_state(self):
+        """
+        Return the arrays holding the nonlinear input and output data of this system.
+
+        Returns
+        -------
+        [ndarray, ...]
+            The data arrays, including the imaginary parts under complex step.
+        """
+        arrays = []
+        for vec in (self._inputs, self._outputs):
+            arrays.extend(vec._data[set_name] for set_name in sorted(vec._data))
+            if vec._vector_info._under_complex_step:
+                arrays.extend(vec._imag_data[set_name] for set_name in sorted(vec._imag_data))
+        return arrays
+
+    def _solve_nonlinear_if_changed(self):
+        """
+        Run _solve_nonlinear unless the inputs and outputs are unchanged since the last run.
+
+        The inputs and outputs are compared bit for bit with their values at the end of the last
+        run started from this method. If they match, running again would reproduce the same outputs
+        (assuming the system is a deterministic function of them), so the run is skipped. Outputs
+        are compared as well as inputs because other solvers, such as Newton, may modify them.
+
+        Returns
+        -------
+        bool
+            True if _solve_nonlinear was run.
+        """
+        state = self._solve_nonlinear_state
+        if state is not None:
+            arrays = self._get_nonlinear_state()
+            if len(arrays) == len(state) and \
+                    all(np.array_equal(new, old) for new, old in zip(arrays, state)):
+                return False
+
+        self._solve_nonlinear_state = None
+        self._solve_nonlinear()
+        self._solve_nonlinear_state = [data.copy() for data in self._get_nonlinear_state()]
+        return True
+
     def check_config(self, logger):
         """
         Perform optional error checks.
@@ -15,6 +15,7 @@ from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, Sel
 from openmdao.test_suite.components.sellar_feature import SellarNoDerivativesCS
 from openmdao.test_suite.components.simple_comps import DoubleArrayComp
 from openmdao.test_suite.components.unit_conv import SrcComp, TgtCompC, TgtCompF, TgtCompK
+from openmdao.utils.thread_utils import get_thread_pool, close_thread_pools
 
 try:
     from openmdao.parallel_api import PETScVector
@@ -202,12 +203,16 @@ class TestGroupFiniteDifference(unittest.TestCase):
 
         prob.setup(check=False)
         prob.run_model()
+        residuals = model._residuals.get_data()
         model.run_linearize()
 
         Jfd = comp.jacobian._subjacs
         assert_rel_error(self, Jfd['sub.comp.x', 'sub.comp.rhs'], -np.eye(2), 1e-6)
         assert_rel_error(self, Jfd['sub.comp.x', 'sub.comp.x'], comp.mtx, 1e-6)
 
+        # The perturbed residuals are not left behind.
+        assert_rel_error(self, model._residuals.get_data(), residuals, 1e-15)
+
     def test_around_newton(self):
         # For a group that is set to FD that has a Newton solver, make sure it doesn't
         # try to FD itself while solving.
@@ -242,6 +247,10 @@ class TestGroupFiniteDifference(unittest.TestCase):
 
         assert_rel_error(self, Jfd['comp.x', 'p_rhs.rhs'], [[1.01020408, -0.01020408], [-0.01020408,  1.01020408]], 1e-5)
 
+        # The outputs are restored after each perturbation.
+        assert_rel_error(self, prob['p_rhs.rhs'], [2., 4.], 1e-15)
+        assert_rel_error(self, prob['comp.x'], [1.97959184, 4.02040816], 1e-5)
+
     def test_step_size(self):
         # Test makes sure option metadata propagates to the fd function
         prob = Problem()
@@ -747,6 +756,569 @@ class TestComponentComplexStep(unittest.TestCase):
         assert_rel_error(self, derivs['comp.y1', 'px.x'][3][3], 1.0/2.34, 1e-6)
 
 
+class SparseComp(ExplicitComponent):
+    """Elementwise outputs y = x**2 plus a sum z = sum(x), counting the compute calls."""
+
+    def initialize(self):
+        self.metadata.declare('size', default=10)
+        self.metadata.declare('method', default='fd')
+        self.metadata.declare('declare', default=True)
+
+    def setup(self):
+        size = self.metadata['size']
+        self.add_input('x', np.arange(1.0, size + 1.0))
+        self.add_output('y', np.zeros(size))
+        self.add_output('z', 0.0)
+
+        if self.metadata['declare']:
+            self.declare_partials('y', 'x', rows=np.arange(size), cols=np.arange(size))
+            self.approx_partials('*', 'x', method=self.metadata['method'])
+        else:
+            self.approx_partials('*', 'x', method=self.metadata['method'],
+                                 detect_sparsity=True)
+
+        self.num_computes = 0
+
+    def compute(self, inputs, outputs):
+        self.num_computes += 1
+        outputs['y'] = inputs['x'] ** 2
+        outputs['z'] = np.sum(inputs['x'])
+
+
+class TestSparseApproximation(unittest.TestCase):
+
+    def _setup(self, model, comp):
+        prob = Problem(model)
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, comp.metadata['size'] + 1.0)))
+        model.add_subsystem('comp', comp)
+        model.connect('p.x', 'comp.x')
+        prob.setup(check=False)
+        prob.run_model()
+        return prob
+
+    def _check_totals(self, prob, size):
+        x = np.arange(1.0, size + 1.0)
+        derivs = prob.compute_total_derivs(of=['comp.y', 'comp.z'], wrt=['p.x'])
+        assert_rel_error(self, derivs['comp.y', 'p.x'], np.diag(2.0 * x), 1e-5)
+        assert_rel_error(self, derivs['comp.z', 'p.x'], np.ones((1, size)), 1e-5)
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_declared(self, method):
+        size = 10
+        comp = SparseComp(size=size, method=method)
+        prob = self._setup(Group(), comp)
+
+        comp.num_computes = 0
+        self._check_totals(prob, size)
+
+        # z depends on every entry of x, so the columns of y can't be perturbed together.
+        self.assertEqual(comp.num_computes, size)
+
+        # the sparse subjac holds the declared entries only
+        subjac = comp._jacobian._subjacs['comp.y', 'comp.x']
+        assert_rel_error(self, subjac[0], -2.0 * np.arange(1.0, size + 1.0), 1e-5)
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_declared_diagonal(self, method):
+
+        class DiagComp(ExplicitComponent):
+
+            def setup(self):
+                self.add_input('x', np.arange(1.0, 11.0))
+                self.add_output('y', np.zeros(10))
+                self.declare_partials('y', 'x', rows=np.arange(10), cols=np.arange(10))
+                self.approx_partials('y', 'x', method=method)
+                self.num_computes = 0
+
+            def compute(self, inputs, outputs):
+                self.num_computes += 1
+                outputs['y'] = inputs['x'] ** 2
+
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 11.0)))
+        comp = model.add_subsystem('comp', DiagComp())
+        model.connect('p.x', 'comp.x')
+        prob.setup(check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+
+        assert_rel_error(self, derivs['comp.y', 'p.x'], np.diag(2.0 * np.arange(1.0, 11.0)), 1e-5)
+        # all entries of x are perturbed at once
+        self.assertEqual(comp.num_computes, 1)
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_detect_sparsity(self, method):
+
+        class BlockComp(ExplicitComponent):
+
+            def setup(self):
+                self.add_input('x', np.arange(1.0, 13.0))
+                self.add_output('y', np.zeros(6))
+                self.approx_partials('y', 'x', method=method, detect_sparsity=True)
+                self.num_computes = 0
+
+            def compute(self, inputs, outputs):
+                self.num_computes += 1
+                x = inputs['x']
+                outputs['y'] = x[::2] * x[1::2]
+
+        prob = Problem()
+        model = prob.model
+        x = np.arange(1.0, 13.0)
+        model.add_subsystem('p', IndepVarComp('x', x))
+        comp = model.add_subsystem('comp', BlockComp())
+        model.connect('p.x', 'comp.x')
+        prob.setup(check=False)
+        prob.run_model()
+
+        expected = np.zeros((6, 12))
+        expected[np.arange(6), np.arange(0, 12, 2)] = x[1::2]
+        expected[np.arange(6), np.arange(1, 12, 2)] = x[::2]
+
+        # The first approximation is dense and finds the nonzero entries.
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        assert_rel_error(self, derivs['comp.y', 'p.x'], expected, 1e-5)
+        self.assertEqual(comp.num_computes, 12)
+
+        # Later ones perturb the even and the odd entries of x together.
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        assert_rel_error(self, derivs['comp.y', 'p.x'], expected, 1e-5)
+        self.assertEqual(comp.num_computes, 2)
+
+        # The sparsity is detected again after setup.
+        prob.setup(check=False)
+        prob.run_model()
+        comp.num_computes = 0
+        prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        self.assertEqual(comp.num_computes, 12)
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_group_detect_sparsity(self, method):
+        size = 8
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, size + 1.0)))
+        sub = model.add_subsystem('sub', Group())
+        sub.add_subsystem('comp', ExecComp('y = 3.0 * x ** 2', x=np.ones(size), y=np.ones(size)))
+        model.connect('p.x', 'sub.comp.x')
+        sub.approx_total_derivs(method=method, detect_sparsity=True)
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        expected = np.diag(6.0 * np.arange(1.0, size + 1.0))
+        for i in range(2):
+            derivs = prob.compute_total_derivs(of=['sub.comp.y'], wrt=['p.x'])
+            assert_rel_error(self, derivs['sub.comp.y', 'p.x'], expected, 1e-5)
+
+        colors, subjacs = list(sub._approx_schemes[method]._colorings.values())[0]
+        self.assertEqual(len(colors), 1)
+
+
+class WigglyComp(ExplicitComponent):
+    """y = 1e-3 * sin(1e3 * x), whose large curvature calls for small finite difference steps."""
+
+    def initialize(self):
+        self.metadata.declare('form', default='forward')
+        self.metadata.declare('step_calc', default='auto')
+
+    def setup(self):
+        self.add_input('x', np.array([0.1, 0.2, 0.3]))
+        self.add_output('y', np.zeros(3))
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3))
+        self.approx_partials('y', 'x', method='fd', form=self.metadata['form'],
+                             step_calc=self.metadata['step_calc'])
+        self.num_computes = 0
+
+    def compute(self, inputs, outputs):
+        self.num_computes += 1
+        outputs['y'] = 1e-3 * np.sin(1e3 * inputs['x'])
+
+
+class TestAutoStep(unittest.TestCase):
+
+    def _run(self, form, step_calc):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.array([0.1, 0.2, 0.3])))
+        comp = model.add_subsystem('comp', WigglyComp(form=form, step_calc=step_calc))
+        model.connect('p.x', 'comp.x')
+        prob.setup(check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        error = np.abs(np.diag(derivs['comp.y', 'p.x']) - np.cos([100., 200., 300.])).max()
+
+        return prob, comp, error
+
+    @parameterized.expand(['forward', 'backward', 'central'])
+    def test_auto_step(self, form):
+        _, _, abs_error = self._run(form, 'abs')
+        prob, comp, auto_error = self._run(form, 'auto')
+
+        self.assertLess(auto_error, 1e-5)
+        self.assertLess(auto_error, abs_error / 10.)
+
+        # the step is estimated once, with a few extra runs
+        num_points = 2 if form == 'central' else 1
+        num_extra = 4 if form == 'central' else 2
+        self.assertEqual(comp.num_computes, num_points + num_extra)
+
+        comp.num_computes = 0
+        prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        self.assertEqual(comp.num_computes, num_points)
+        self.assertEqual(len(comp._approx_schemes['fd']._auto_steps), 1)
+
+        # and again after the next setup
+        prob.setup(check=False)
+        prob.run_model()
+        self.assertEqual(len(comp._approx_schemes['fd']._auto_steps), 0)
+
+    def test_auto_step_per_column(self):
+        """Each column gets its own step, even when wrt has entries of very different scales."""
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.array([0.1, 1.0e4])))
+        comp = model.add_subsystem('comp', ExecComp('y = 1e-3 * sin(1e3 * x[0]) + 1e-3 * x[1]**2',
+                                                    x=np.ones(2)))
+        comp.approx_partials('y', 'x', method='fd', step_calc='auto')
+        model.connect('p.x', 'comp.x')
+        prob.setup(check=False)
+        prob.run_model()
+
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        assert_rel_error(self, derivs['comp.y', 'p.x'], np.array([[np.cos(100.), 20.]]), 1e-5)
+
+        steps = list(comp._approx_schemes['fd']._auto_steps.values())[0]
+        self.assertGreater(steps[1], 100. * steps[0])
+
+    def test_auto_step_kept_for_new_totals(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.array([0.1, 0.2, 0.3])))
+        model.add_subsystem('comp', WigglyComp(step_calc='abs'))
+        model.add_subsystem('comp2', ExecComp('z = 2.0 * x', x=np.ones(3), z=np.ones(3)))
+        model.connect('p.x', 'comp.x')
+        model.connect('p.x', 'comp2.x')
+        model.linear_solver = ScipyIterativeSolver()
+        model.approx_total_derivs(method='fd', step_calc='auto')
+        prob.setup(check=False)
+        prob.run_model()
+
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        assert_rel_error(self, np.diag(derivs['comp.y', 'p.x']), np.cos([100., 200., 300.]),
+                         1e-5)
+        auto_steps = model._approx_schemes['fd']._auto_steps
+        steps = list(auto_steps.values())
+        self.assertEqual(len(steps), 1)
+
+        # Other derivatives do not estimate the steps again.
+        derivs = prob.compute_total_derivs(of=['comp.y', 'comp2.z'], wrt=['p.x'])
+        assert_rel_error(self, derivs['comp2.z', 'p.x'], 2.0 * np.eye(3), 1e-6)
+        self.assertIs(model._approx_schemes['fd']._auto_steps, auto_steps)
+        self.assertIs(list(auto_steps.values())[0], steps[0])
+
+
+class CountingComp(ExplicitComponent):
+    """Dense y = A.dot(x) with approximated partials, counting compute calls in this process."""
+
+    def initialize(self):
+        self.metadata.declare('method', default='fd')
+        self.metadata.declare('num_par_fd', default=1)
+
+    def setup(self):
+        self.add_input('x', np.arange(1.0, 7.0))
+        self.add_output('y', np.zeros(4))
+        self.mtx = np.arange(24.0).reshape((4, 6))
+        self.approx_partials('y', 'x', method=self.metadata['method'],
+                             num_par_fd=self.metadata['num_par_fd'])
+        self.num_computes = 0
+
+    def compute(self, inputs, outputs):
+        self.num_computes += 1
+        outputs['y'] = self.mtx.dot(inputs['x'])
+
+
+class TestReuseApproximation(unittest.TestCase):
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_model_totals(self, method):
+
+        class ExactComp(CountingComp):
+
+            def setup(self):
+                self.add_input('x', np.arange(1.0, 7.0))
+                self.add_output('y', np.zeros(4))
+                self.mtx = np.arange(24.0).reshape((4, 6))
+                self.declare_partials('y', 'x', val=self.mtx)
+                self.num_computes = 0
+
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 7.0)))
+        model.add_subsystem('p2', IndepVarComp('w', 2.0))
+        comp = model.add_subsystem('comp', ExactComp())
+        model.add_subsystem('c2', ExecComp('z = w * y', y=np.ones(4), z=np.ones(4)))
+        model.connect('p.x', 'comp.x')
+        model.connect('comp.y', 'c2.y')
+        model.connect('p2.w', 'c2.w')
+        model.linear_solver = ScipyIterativeSolver()
+        model.approx_total_derivs(method=method)
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['c2.z'], wrt=['p.x'])
+        assert_rel_error(self, derivs['c2.z', 'p.x'], 2.0 * comp.mtx, 1e-5)
+        self.assertGreater(comp.num_computes, 0)
+
+        # nothing is run again at the same point
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['c2.z'], wrt=['p.x'])
+        assert_rel_error(self, derivs['c2.z', 'p.x'], 2.0 * comp.mtx, 1e-5)
+        self.assertEqual(comp.num_computes, 0)
+
+        # only the new column is approximated when another wrt is requested
+        derivs = prob.compute_total_derivs(of=['c2.z'], wrt=['p.x', 'p2.w'])
+        assert_rel_error(self, derivs['c2.z', 'p2.w'],
+                         comp.mtx.dot(np.arange(1.0, 7.0)).reshape((4, 1)), 1e-5)
+        self.assertEqual(comp.num_computes, 1)
+
+        # but everything is once the point changes
+        prob['p2.w'] = 3.0
+        prob.run_model()
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['c2.z'], wrt=['p.x', 'p2.w'])
+        assert_rel_error(self, derivs['c2.z', 'p.x'], 3.0 * comp.mtx, 1e-5)
+        self.assertGreater(comp.num_computes, 1)
+
+    def test_model_totals_change_method(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 4.0)))
+        model.add_subsystem('comp', ExecComp('y = x**3', x=np.ones(3), y=np.ones(3)))
+        model.connect('p.x', 'comp.x')
+        model.linear_solver = ScipyIterativeSolver()
+        model.approx_total_derivs(method='cs')
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        x = np.arange(1.0, 4.0)
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        assert_rel_error(self, derivs['comp.y', 'p.x'], np.diag(3.0 * x ** 2), 1e-12)
+
+        # The new method and options are used for the same derivatives at the same point.
+        model.approx_total_derivs(method='fd', step=1e-2)
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        assert_rel_error(self, np.diag(derivs['comp.y', 'p.x']),
+                         3.0 * x ** 2 + 3.0e-2 * x + 1e-4, 1e-8)
+
+        model.approx_total_derivs(method='fd', step=1e-3)
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        assert_rel_error(self, np.diag(derivs['comp.y', 'p.x']),
+                         3.0 * x ** 2 + 3.0e-3 * x + 1e-6, 1e-8)
+
+
+class TestParallelApproximation(unittest.TestCase):
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_forked_partials(self, method):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 7.0)))
+        comp = model.add_subsystem('comp', CountingComp(method=method, num_par_fd=3))
+        model.connect('p.x', 'comp.x')
+        prob.setup(check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+
+        assert_rel_error(self, derivs['comp.y', 'p.x'], comp.mtx, 1e-5)
+
+        # the perturbed points all ran in worker processes
+        self.assertEqual(comp.num_computes, 0)
+
+        # and the state of the model is unchanged
+        assert_rel_error(self, prob['comp.y'], comp.mtx.dot(np.arange(1.0, 7.0)), 1e-12)
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_forked_totals(self, method):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 7.0)))
+        sub = model.add_subsystem('sub', Group())
+        comp = sub.add_subsystem('comp', CountingComp())
+        sub.add_subsystem('c2', ExecComp('z = 2.0 * y', y=np.ones(4), z=np.ones(4)))
+        sub.connect('comp.y', 'c2.y')
+        model.connect('p.x', 'sub.comp.x')
+        model.linear_solver = ScipyIterativeSolver()
+        sub.approx_total_derivs(method=method, num_par_fd=2)
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        derivs = prob.compute_total_derivs(of=['sub.c2.z'], wrt=['p.x'])
+
+        assert_rel_error(self, derivs['sub.c2.z', 'p.x'], 2.0 * comp.mtx, 1e-5)
+        assert_rel_error(self, prob['sub.c2.z'], 2.0 * comp.mtx.dot(np.arange(1.0, 7.0)), 1e-12)
+
+    def test_no_fork_with_threads(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 7.0)))
+        comp = model.add_subsystem('comp', CountingComp(method='fd', num_par_fd=3))
+        model.connect('p.x', 'comp.x')
+        prob.setup(check=False)
+        prob.run_model()
+
+        # Forking while the thread pool is alive could deadlock the workers, so the points are
+        # evaluated serially instead.
+        get_thread_pool(2)
+        try:
+            comp.num_computes = 0
+            derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+        finally:
+            close_thread_pools()
+
+        assert_rel_error(self, derivs['comp.y', 'p.x'], comp.mtx, 1e-5)
+        self.assertGreater(comp.num_computes, 0)
+
+    def test_worker_error(self):
+
+        class FailingComp(CountingComp):
+
+            def compute(self, inputs, outputs):
+                if inputs['x'][2] != 3.0:
+                    raise RuntimeError('Bad point.')
+                super(FailingComp, self).compute(inputs, outputs)
+
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 7.0)))
+        model.add_subsystem('comp', FailingComp(num_par_fd=2))
+        model.connect('p.x', 'comp.x')
+        prob.setup(check=False)
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+
+        self.assertEqual(str(cm.exception), 'Bad point.')
+
+
+class BatchedComp(ExplicitComponent):
+    """Elementwise y = a * x**2 + sin(z) that evaluates the approximation points in one batch."""
+
+    batched = True
+
+    def initialize(self):
+        self.metadata.declare('method', default='fd')
+
+    def setup(self):
+        self.add_input('x', np.arange(1.0, 4.0))
+        self.add_input('z', np.array([0.5, 1.0, 1.5]))
+        self.add_input('a', 2.0)
+        self.add_output('y', np.zeros(3))
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3))
+        self.approx_partials('y', '*', method=self.metadata['method'])
+        self.num_computes = 0
+        self.batch_sizes = []
+
+    def compute(self, inputs, outputs):
+        self.num_computes += 1
+        outputs['y'] = inputs['a'] * inputs['x'] ** 2 + np.sin(inputs['z'])
+
+    def compute_batch(self, inputs, outputs):
+        self.batch_sizes.append(inputs['x'].shape[0])
+        outputs['y'] = inputs['a'] * inputs['x'] ** 2 + np.sin(inputs['z'])
+
+
+class TestBatchedApproximation(unittest.TestCase):
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_batched_partials(self, method):
+        prob = Problem()
+        model = prob.model
+        p = model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 4.0)))
+        p.add_output('z', np.array([0.5, 1.0, 1.5]))
+        p.add_output('a', 2.0)
+        comp = model.add_subsystem('comp', BatchedComp(method=method))
+        model.connect('p.x', 'comp.x')
+        model.connect('p.z', 'comp.z')
+        model.connect('p.a', 'comp.a')
+        prob.setup(check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x', 'p.z', 'p.a'])
+
+        x = np.arange(1.0, 4.0)
+        assert_rel_error(self, derivs['comp.y', 'p.x'], np.diag(4.0 * x), 1e-5)
+        assert_rel_error(self, derivs['comp.y', 'p.z'], np.diag(np.cos([0.5, 1.0, 1.5])), 1e-5)
+        assert_rel_error(self, derivs['comp.y', 'p.a'], (x ** 2).reshape((3, 1)), 1e-5)
+
+        # one call per input, with one point per group of columns
+        self.assertEqual(comp.num_computes, 0)
+        self.assertEqual(sorted(comp.batch_sizes), [1, 1, 3])
+
+        assert_rel_error(self, prob['comp.y'], 2.0 * x ** 2 + np.sin([0.5, 1.0, 1.5]), 1e-12)
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_default_compute_batch(self, method):
+
+        class LoopComp(CountingComp):
+            batched = True
+
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 7.0)))
+        comp = model.add_subsystem('comp', LoopComp(method=method))
+        model.connect('p.x', 'comp.x')
+        prob.setup(check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+
+        # compute is called once for each point
+        assert_rel_error(self, derivs['comp.y', 'p.x'], comp.mtx, 1e-6)
+        self.assertEqual(comp.num_computes, 6)
+        self.assertFalse(CountingComp.batched)
+
+
+@unittest.skipUnless(PETScVector, "PETSc is required.")
+class TestParallelApproximationMPI(unittest.TestCase):
+
+    N_PROCS = 2
+
+    @parameterized.expand(['fd', 'cs'])
+    def test_partials(self, method):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', np.arange(1.0, 7.0)))
+        comp = model.add_subsystem('comp', CountingComp(method=method, num_par_fd=2))
+        model.connect('p.x', 'comp.x')
+        prob.setup(vector_class=PETScVector, check=False)
+        prob.run_model()
+
+        comp.num_computes = 0
+        derivs = prob.compute_total_derivs(of=['comp.y'], wrt=['p.x'])
+
+        assert_rel_error(self, derivs['comp.y', 'p.x'], comp.mtx, 1e-5)
+
+        # each proc ran half of the points
+        self.assertEqual(comp.num_computes, 3)
+
+
 class ApproxTotalsFeature(unittest.TestCase):
 
     def test_basic(self):
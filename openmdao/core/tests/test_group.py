@@ -467,6 +467,27 @@ class TestGroup(unittest.TestCase):
                                                     [7., 4.]]))
         assert_rel_error(self, p['C1.y'], 42.)
 
+    def test_connect_src_indices_noflat_3d(self):
+        p = Problem(model=Group())
+        p.model.add_subsystem('indep', IndepVarComp('x', np.arange(60.).reshape((3, 4, 5))))
+        p.model.add_subsystem('C1', ExecComp('y=x*2.0', x=np.zeros((4, 5)), y=np.zeros((4, 5))))
+
+        # connect C1.x to the last (3rd) slice of indep.x, using negative indices
+        src_indices = np.empty((4, 5, 3), dtype=int)
+        src_indices[:, :, 0] = -1
+        src_indices[:, :, 1] = np.arange(4)[:, np.newaxis]
+        src_indices[:, :, 2] = np.arange(5) - 5
+        p.model.connect('indep.x', 'C1.x', src_indices=src_indices)
+
+        p.set_solver_print(level=0)
+        p.setup()
+        p.run_model()
+        assert_rel_error(self, p['C1.y'], 2.0 * np.arange(40., 60.).reshape((4, 5)))
+
+        # the declared src_indices are left untouched
+        meta = p.model._var_abs2meta['input']['C1.x']
+        self.assertEqual(np.min(meta['src_indices']), -5)
+
     def test_promote_not_found1(self):
         p = Problem(model=Group())
         p.model.add_subsystem('indep', IndepVarComp('x', np.ones(5)),
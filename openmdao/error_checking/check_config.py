@@ -144,6 +144,39 @@ def get_sccs(group, comps_only=False):
     return sccs
 
 
+def get_scc_blocks(group):
+    """
+    Return the subsystems of the given Group partitioned into strongly connected components.
+
+    Unlike get_sccs, every subsystem is included, even if it has no connections, and the
+    components are ordered so that each one only depends on those before it. Ties are broken by
+    the original order of the subsystems, so a Group that is already in dataflow order keeps it.
+
+    Parameters
+    ----------
+    group : <Group>
+        The Group whose subsystems are partitioned.
+
+    Returns
+    -------
+    list of lists of int
+        Indices into group._subsystems_allprocs of the subsystems in each strongly connected
+        component, in execution order.
+    """
+    subsystems = group._subsystems_allprocs
+    sys2idx = {s.pathname: i for i, s in enumerate(subsystems)}
+
+    graph = compute_sys_graph(group, group._conn_global_abs_in2out)
+    graph.add_nodes_from(sys2idx)
+
+    dag = nx.condensation(graph)
+    members = {node: sorted(sys2idx[name] for name in dag.nodes[node]['members'])
+               for node in dag}
+
+    order = nx.lexicographical_topological_sort(dag, key=lambda node: members[node][0])
+    return [members[node] for node in order]
+
+
 def _check_dataflow(group, logger):
     """
     Report any cycles and out of order Systems to the logger.
@@ -4,7 +4,7 @@ from six.moves import range
 
 from openmdao.api import Problem, Group, IndepVarComp, ExecComp
 from openmdao.devtools.testutil import TestLogger
-from openmdao.error_checking.check_config import get_sccs
+from openmdao.error_checking.check_config import get_sccs, get_scc_blocks
 
 
 class MyComp(ExecComp):
@@ -117,7 +117,7 @@ class TestCheckConfig(unittest.TestCase):
         sccs = [sorted(s) for s in get_sccs(root, comps_only=True) if len(s) > 1]
         self.assertEqual([['C4', 'G1.C1', 'G1.C2']], sccs)
 
-    def test_multi_cycles(self):
+    def _multi_cycles_problem(self):
         p = Problem(model=Group())
         root = p.model
 
@@ -152,6 +152,11 @@ class TestCheckConfig(unittest.TestCase):
         root.connect("N3.z", "C2.b")
         root.connect("C11.z", "C3.b")
 
+        return p
+
+    def test_multi_cycles(self):
+        p = self._multi_cycles_problem()
+
         testlogger = TestLogger()
         p.setup(logger=testlogger)
 
@@ -163,6 +168,17 @@ class TestCheckConfig(unittest.TestCase):
         self.assertEqual(warnings[2], "System 'C2' executes out-of-order with respect to its source systems ['N3']")
         self.assertEqual(warnings[3], "System 'C3' executes out-of-order with respect to its source systems ['C11']")
 
+    def test_get_scc_blocks(self):
+        p = self._multi_cycles_problem()
+        p.setup(logger=TestLogger())
+        root = p.model
+
+        # Every subsystem is in one block, and the blocks are in dataflow order.
+        names = [s.name for s in root._subsystems_allprocs]
+        blocks = [[names[i] for i in block] for block in get_scc_blocks(root)]
+        self.assertEqual(blocks, [['indep'], ['N1'], ['C13', 'C12', 'C11'], ['N2'],
+                                  ['C23', 'C22', 'C21'], ['N3'], ['C3', 'C2', 'C1']])
+
 
 if __name__ == "__main__":
     unittest.main()
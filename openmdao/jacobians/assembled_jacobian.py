@@ -2,13 +2,18 @@
 from __future__ import division
 
 import sys
+from collections import OrderedDict
+
 import numpy as np
+from six import iteritems
 
 from openmdao.jacobians.jacobian import Jacobian
+from openmdao.matrices.matrix import Matrix
 from openmdao.matrices.dense_matrix import DenseMatrix
 from openmdao.matrices.coo_matrix import COOMatrix
 from openmdao.matrices.csr_matrix import CSRMatrix
 from openmdao.matrices.csc_matrix import CSCMatrix
+from openmdao.matrices.block_matrix import BlockMatrix
 from openmdao.utils.units import get_conversion
 
 SUBJAC_META_DEFAULTS = {
@@ -35,6 +40,10 @@ class AssembledJacobian(Jacobian):
     _keymap : dict
         Mapping of original (output, input) key to (output, source) in cases
         where the input has src_indices.
+    _matrix_class : type
+        <Matrix> class actually used, which is chosen during setup if matrix_class is 'auto'.
+    _mem_info : dict or None
+        Sparsity and projected memory usage of the internal matrix, computed during setup.
     """
 
     def __init__(self, **kwargs):
@@ -52,12 +61,20 @@ class AssembledJacobian(Jacobian):
 
         super(AssembledJacobian, self).__init__()
         self.options.declare('matrix_class', default=DenseMatrix,
-                             desc='<Matrix> class to use in this <Jacobian>.')
+                             desc="<Matrix> class to use in this <Jacobian>, or 'auto' to "
+                                  "pick the format that needs the least memory for the "
+                                  "declared partials and the attached linear solver.")
+        self.options.declare('matvec_threads', type_=int, default=1, lower=1,
+                             desc='Number of threads used for matrix-vector products with '
+                                  'sparse matrices. Useful for large Jacobians with iterative '
+                                  'linear solvers.')
         self.options.update(kwargs)
         self._view_ranges = {}
         self._int_mtx = None
         self._ext_mtx = {}
         self._keymap = {}
+        self._matrix_class = None
+        self._mem_info = None
 
     def _get_var_range(self, abs_name, type_):
         """
@@ -98,8 +115,14 @@ class AssembledJacobian(Jacobian):
         abs2meta_in = system._var_abs2meta['input']
         abs2meta_out = system._var_abs2meta['output']
 
-        self._int_mtx = int_mtx = self.options['matrix_class'](system.comm)
-        ext_mtx = self.options['matrix_class'](system.comm)
+        matrix_class = self.options['matrix_class']
+        if matrix_class == 'auto':
+            # Just collect the sub-jacobians until we know which format to use.
+            int_mtx = Matrix(system.comm)
+            ext_mtx = Matrix(system.comm)
+        else:
+            int_mtx = matrix_class(system.comm)
+            ext_mtx = matrix_class(system.comm)
 
         out_ranges = {}
         for abs_name in system._var_allprocs_abs_names['output']:
@@ -204,6 +227,24 @@ class AssembledJacobian(Jacobian):
         sizes = system._var_sizes
         iproc = system.comm.rank
         out_size = np.sum(sizes['output'][iproc, :])
+        block_ranges = [self._view_ranges[s.pathname][:2] for s in system._subsystems_myproc]
+        block_names = [s.pathname for s in system._subsystems_myproc]
+
+        self._mem_info = self._get_mem_info(int_mtx, out_size, block_ranges)
+
+        if matrix_class == 'auto':
+            matrix_class = self._choose_matrix_class()
+            int_mtx = self._convert_matrix(int_mtx, matrix_class)
+            ext_mtx = self._convert_matrix(ext_mtx, matrix_class)
+
+        self._matrix_class = matrix_class
+        self._mem_info['matrix_class'] = matrix_class.__name__
+        self._int_mtx = int_mtx
+        int_mtx._num_threads = ext_mtx._num_threads = self.options['matvec_threads']
+
+        # Block matrices store one diagonal block per subsystem.
+        if isinstance(int_mtx, BlockMatrix):
+            int_mtx._set_block_ranges(block_ranges, block_names)
 
         int_mtx._build(out_size, out_size)
         if ext_mtx._submats:
@@ -214,6 +255,126 @@ class AssembledJacobian(Jacobian):
 
         self._ext_mtx[system.pathname] = ext_mtx
 
+    def _convert_matrix(self, mtx, matrix_class):
+        """
+        Return a new matrix of the given class containing the sub-jacobians declared in mtx.
+
+        Parameters
+        ----------
+        mtx : <Matrix>
+            Matrix holding the declared sub-jacobians.
+        matrix_class : type
+            <Matrix> class to convert to.
+
+        Returns
+        -------
+        <Matrix>
+            The new matrix.
+        """
+        new_mtx = matrix_class(mtx._comm)
+        new_mtx._submats = mtx._submats
+        return new_mtx
+
+    def _get_mem_info(self, int_mtx, out_size, block_ranges):
+        """
+        Compute the sparsity of the internal matrix and the memory each <Matrix> class needs.
+
+        Parameters
+        ----------
+        int_mtx : <Matrix>
+            Matrix holding the declared sub-jacobians.
+        out_size : int
+            Number of rows and cols in the matrix.
+        block_ranges : [(int, int), ...]
+            Start and end row of the diagonal block of each subsystem.
+
+        Returns
+        -------
+        dict
+            Sparsity and projected memory usage of the internal matrix.
+        """
+        subjac_nnz = int_mtx._get_submat_nnz()
+        nnz = sum(subjac_nnz.values())
+
+        block_sizes = [end - start for start, end in block_ranges]
+        nbytes = OrderedDict()
+        for mtx_class in (DenseMatrix, COOMatrix, CSRMatrix, CSCMatrix, BlockMatrix):
+            nbytes[mtx_class.__name__] = mtx_class._get_projected_bytes(nnz, out_size, out_size,
+                                                                        block_sizes)
+
+        return {
+            'shape': (out_size, out_size),
+            'nnz': nnz,
+            'fill_ratio': nnz / (out_size * out_size) if out_size > 0 else 0.0,
+            'subjac_nnz': subjac_nnz,
+            'bytes': nbytes,
+            'matrix_class': None,
+        }
+
+    def _choose_matrix_class(self):
+        """
+        Pick the <Matrix> class needing the least memory that the linear solver can use.
+
+        Returns
+        -------
+        type
+            The chosen <Matrix> class.
+        """
+        from openmdao.solvers.linear.direct import DirectSolver
+
+        system = self._system
+
+        # Subsystems that take their own views of this jacobian require a dense matrix.
+        for s in system.system_iter(local=True, recurse=True):
+            if s._views_assembled_jac:
+                return DenseMatrix
+
+        # DirectSolver factors the matrix with splu, which works in CSC format, whereas
+        # iterative solvers only need fast products, which CSR gives us.
+        if isinstance(system._linear_solver, DirectSolver):
+            candidates = (DenseMatrix, CSCMatrix)
+        else:
+            candidates = (DenseMatrix, CSRMatrix)
+
+        nbytes = self._mem_info['bytes']
+        return min(candidates, key=lambda mtx_class: nbytes[mtx_class.__name__])
+
+    def memory_report(self, out_stream=sys.stdout):
+        """
+        Write a report of the sparsity and projected memory usage of this jacobian.
+
+        Parameters
+        ----------
+        out_stream : file-like
+            Where to send the report.
+
+        Returns
+        -------
+        dict
+            Sparsity and projected memory usage of the internal matrix.
+        """
+        info = self._mem_info
+        if info is None:
+            raise RuntimeError("Memory usage of the jacobian is not available until "
+                               "after setup.")
+
+        if out_stream is not None:
+            system = self._system
+            header = "Jacobian memory report for '%s'" % (system.pathname or 'model')
+            lines = [header, '-' * len(header)]
+            lines.append("shape: %d x %d" % info['shape'])
+            lines.append("nonzeros: %d (fill ratio %.4g)" % (info['nnz'], info['fill_ratio']))
+            lines.append("matrix class: %s" % info['matrix_class'])
+            lines.append("projected bytes:")
+            for name, nbytes in iteritems(info['bytes']):
+                lines.append("    %-12s %d" % (name, nbytes))
+            lines.append("nonzeros per sub-jacobian:")
+            for key in sorted(info['subjac_nnz']):
+                lines.append("    %s wrt %s: %d" % (key[0], key[1], info['subjac_nnz'][key]))
+            out_stream.write('\n'.join(lines) + '\n')
+
+        return info
+
     def _init_view(self, system):
         """
         Determine the _ext_mtx for a sub-view of the assemble jacobian.
@@ -227,7 +388,8 @@ class AssembledJacobian(Jacobian):
         abs2meta_out = system._var_abs2meta['output']
         ranges = self._view_ranges[system.pathname]
 
-        ext_mtx = self.options['matrix_class'](system.comm)
+        ext_mtx = self._matrix_class(system.comm)
+        ext_mtx._num_threads = self.options['matvec_threads']
 
         in_ranges = {}
         src_indices_dict = {}
@@ -351,7 +513,7 @@ class DenseJacobian(AssembledJacobian):
         **kwargs : dict
             options dictionary.
         """
-        super(DenseJacobian, self, **kwargs).__init__()
+        super(DenseJacobian, self).__init__(**kwargs)
         self.options['matrix_class'] = DenseMatrix
 
 
@@ -369,7 +531,7 @@ class COOJacobian(AssembledJacobian):
         **kwargs : dict
             options dictionary.
         """
-        super(COOJacobian, self, **kwargs).__init__()
+        super(COOJacobian, self).__init__(**kwargs)
         self.options['matrix_class'] = COOMatrix
 
 
@@ -387,7 +549,7 @@ class CSRJacobian(AssembledJacobian):
         **kwargs : dict
             options dictionary.
         """
-        super(CSRJacobian, self, **kwargs).__init__()
+        super(CSRJacobian, self).__init__(**kwargs)
         self.options['matrix_class'] = CSRMatrix
 
 
@@ -405,5 +567,23 @@ class CSCJacobian(AssembledJacobian):
         **kwargs : dict
             options dictionary.
         """
-        super(CSCJacobian, self, **kwargs).__init__()
+        super(CSCJacobian, self).__init__(**kwargs)
         self.options['matrix_class'] = CSCMatrix
+
+
+class BlockJacobian(AssembledJacobian):
+    """
+    Assemble sparse global <Jacobian> with one dense diagonal block per subsystem.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(BlockJacobian, self).__init__(**kwargs)
+        self.options['matrix_class'] = BlockMatrix
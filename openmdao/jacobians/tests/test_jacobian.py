@@ -5,7 +5,7 @@ import unittest
 from parameterized import parameterized
 
 from six import assertRaisesRegex
-from six.moves import range
+from six.moves import range, cStringIO as StringIO
 
 import numpy as np
 from scipy.sparse import coo_matrix, csr_matrix
@@ -13,11 +13,15 @@ from scipy.sparse import coo_matrix, csr_matrix
 from openmdao.api import IndepVarComp, Group, Problem, \
                          ExplicitComponent, ImplicitComponent, ExecComp, \
                          NewtonSolver, ScipyIterativeSolver, \
-                         DenseJacobian, CSRJacobian, CSCJacobian, COOJacobian
+                         DenseJacobian, CSRJacobian, CSCJacobian, COOJacobian, \
+                         BlockJacobian, AssembledJacobian, DirectSolver
 from openmdao.devtools.testutil import assert_rel_error
+from openmdao.matrices.dense_matrix import DenseMatrix
+from openmdao.matrices.csr_matrix import CSRMatrix
+from openmdao.matrices.csc_matrix import CSCMatrix
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
-     SellarDis2withDerivatives
+     SellarDis2withDerivatives, SellarDerivatives
 
 
 class MyExplicitComp(ExplicitComponent):
@@ -141,6 +145,21 @@ class ExplicitSetItemComp(ExplicitComponent):
         partials['out', 'in'] = self._constructor(self._value)
 
 
+class DiagScaleComp(ExplicitComponent):
+    def __init__(self, size):
+        super(DiagScaleComp, self).__init__()
+        self.size = size
+
+    def setup(self):
+        self.add_input('x', np.ones(self.size))
+        self.add_output('y', np.ones(self.size))
+        arange = np.arange(self.size)
+        self.declare_partials('y', 'x', rows=arange, cols=arange, val=3.0)
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = 3.0 * inputs['x']
+
+
 def arr2list(arr):
     """Convert a numpy array to a 'sparse' list."""
     data = []
@@ -189,7 +208,7 @@ def _test_func_name(func, num, param):
 class TestJacobian(unittest.TestCase):
 
     @parameterized.expand(itertools.product(
-        [DenseJacobian, CSRJacobian, CSCJacobian, COOJacobian],
+        [DenseJacobian, CSRJacobian, CSCJacobian, COOJacobian, BlockJacobian],
         [np.array, coo_matrix, csr_matrix, inverted_coo, inverted_csr, arr2list, arr2revlist],
         [False, True],  # not nested, nested
         [0, 1],  # extra calls to linearize
@@ -214,6 +233,26 @@ class TestJacobian(unittest.TestCase):
         self._check_fwd(self.prob, fwd_check)
         self._check_rev(self.prob, rev_check)
 
+    @parameterized.expand([(CSRJacobian,), (CSCJacobian,), (COOJacobian,), (BlockJacobian,)],
+                          testcase_func_name=lambda f, n, p: 'test_threaded_matvec_' +
+                          p.args[0].__name__)
+    def test_threaded_matvec(self, jacobian_class):
+        self._setup_model(lambda: jacobian_class(matvec_threads=3), np.array, True, 1)
+
+        fwd_check = np.array([1.0, 1.0, 1.0, 1.0, 1.0, -24., -74., -8.])
+        rev_check = np.array([-35., -5., 9., -63., -3., 1., -6., 1.])
+
+        jac = self.prob.model.get_subsystem('G1')._jacobian
+        self.assertEqual(jac._int_mtx._num_threads, 3)
+
+        self._check_fwd(self.prob, fwd_check)
+        self._check_rev(self.prob, rev_check)
+
+        # the slabs must pick up new values after the next linearization
+        self.prob.model.run_linearize()
+        self._check_fwd(self.prob, fwd_check)
+        self._check_rev(self.prob, rev_check)
+
     def _setup_model(self, jac_class, comp_jac_class, nested, lincalls):
         self.prob = prob = Problem(model=Group())
         if nested:
@@ -322,6 +361,211 @@ class TestJacobian(unittest.TestCase):
         self.assertEqual(jac_out.dtype, expected_dtype)
         assert_rel_error(self, jac_out, np.atleast_2d(expected).reshape(expected_shape), 1e-15)
 
+    def _block_solve_model(self, cycle):
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+        model.add_subsystem('obj_cmp', ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+        if cycle:
+            model.connect('y2', 'd1.y2')
+
+        model.jacobian = BlockJacobian()
+        model.linear_solver = DirectSolver()
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        model.run_linearize()
+
+        return model._jacobian._int_mtx
+
+    def test_block_matrix_triangular_solve(self):
+        # Feed-forward model, so the block matrix is block lower triangular.
+        mtx = self._block_solve_model(cycle=False)
+
+        self.assertEqual(len(mtx._block_ranges), 5)
+        self.assertTrue(mtx._block_lower)
+        self.assertTrue(mtx._is_block_triangular())
+
+        full = mtx._matrix.toarray()
+        b = np.arange(1.0, full.shape[0] + 1.0)
+
+        # A single sweep is exact in both modes.
+        for mode, mat in [('fwd', full), ('rev', full.T)]:
+            x, niter = mtx._block_gs_solve(b, mode)
+            self.assertEqual(niter, 1)
+            assert_rel_error(self, x, np.linalg.solve(mat, b), 1e-12)
+
+    def test_block_matrix_jacobi_solve(self):
+        mtx = self._block_solve_model(cycle=True)
+
+        full = mtx._matrix.toarray()
+        b = np.arange(1.0, full.shape[0] + 1.0)
+
+        diag = np.zeros(full.shape)
+        for start, stop in mtx._block_ranges:
+            diag[start:stop, start:stop] = full[start:stop, start:stop]
+
+        for mode, mat in [('fwd', diag), ('rev', diag.T)]:
+            assert_rel_error(self, mtx._block_jacobi_solve(b, mode), np.linalg.solve(mat, b),
+                             1e-12)
+
+    def test_block_matrix_singular_block(self):
+        mtx = self._block_solve_model(cycle=True)
+
+        mtx._matrix.data[mtx._diag_map[2][0]] = 0.0
+        mtx._stale = True
+
+        with self.assertRaises(RuntimeError) as cm:
+            mtx._block_jacobi_solve(np.ones(mtx._matrix.shape[0]), 'fwd')
+
+        self.assertEqual(str(cm.exception), "The diagonal block of subsystem 'd1' is singular.")
+
+    def test_block_matrix_sparse_blocks(self):
+        # Large diagonal blocks are factored without ever forming them densely.
+        size = 2000
+        prob = Problem()
+        model = prob.model = Group()
+        model.add_subsystem('px', IndepVarComp('x', np.ones(size)))
+        model.add_subsystem('c1', DiagScaleComp(size))
+        model.add_subsystem('c2', DiagScaleComp(size))
+        model.connect('px.x', 'c1.x')
+        model.connect('c1.y', 'c2.x')
+        model.jacobian = BlockJacobian()
+        model.linear_solver = DirectSolver()
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        model.run_linearize()
+
+        mtx = model._jacobian._int_mtx
+        b = np.arange(1.0, 3 * size + 1.0)
+        x = mtx._block_jacobi_solve(b, 'fwd')
+        assert_rel_error(self, x, b, 1e-15)
+
+        self.assertEqual(len(mtx._diag_lus), 3)
+        for lu in mtx._diag_lus:
+            self.assertEqual(lu.shape, (size, size))
+            self.assertLessEqual(lu.nnz, 2 * size)
+
+    def test_block_matrix_gs_solve(self):
+        # Coupled model, so block Gauss-Seidel needs to iterate.
+        mtx = self._block_solve_model(cycle=True)
+
+        self.assertFalse(mtx._is_block_triangular())
+
+        full = mtx._matrix.toarray()
+        b = np.arange(1.0, full.shape[0] + 1.0)
+
+        for mode, mat in [('fwd', full), ('rev', full.T)]:
+            x, niter = mtx._block_gs_solve(b, mode, maxiter=50, atol=1e-14, rtol=1e-14)
+            self.assertGreater(niter, 1)
+            assert_rel_error(self, x, np.linalg.solve(mat, b), 1e-10)
+
+    def test_block_jacobian_direct_solver(self):
+        # The block matrix is a CSC matrix, so it also works with DirectSolver.
+        prob = Problem()
+        prob.model = SellarDerivatives(nonlinear_solver=NewtonSolver(),
+                                       linear_solver=DirectSolver())
+        prob.model.jacobian = BlockJacobian()
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+    def _auto_model(self, linear_solver, size=20):
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('px', IndepVarComp('x', np.ones(size)))
+        model.add_subsystem('c1', DiagScaleComp(size))
+        model.add_subsystem('c2', DiagScaleComp(size))
+        model.connect('px.x', 'c1.x')
+        model.connect('c1.y', 'c2.x')
+
+        model.jacobian = AssembledJacobian(matrix_class='auto')
+        model.linear_solver = linear_solver
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        return prob
+
+    def test_auto_matrix_class(self):
+        size = 20
+        for linear_solver, matrix_class in [(DirectSolver(), CSCMatrix),
+                                            (ScipyIterativeSolver(), CSRMatrix)]:
+            prob = self._auto_model(linear_solver, size)
+            jac = prob.model._jacobian
+            self.assertIs(type(jac._int_mtx), matrix_class)
+
+            J = prob.compute_total_derivs(of=['c2.y'], wrt=['px.x'])
+            assert_rel_error(self, J['c2.y', 'px.x'], 9.0 * np.eye(size), 1e-10)
+
+        # Even for a model as small as Sellar, the sparse format needs less memory.
+        prob = Problem()
+        prob.model = SellarDerivatives(nonlinear_solver=NewtonSolver(),
+                                       linear_solver=DirectSolver())
+        prob.model.jacobian = AssembledJacobian(matrix_class='auto')
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        self.assertIs(type(prob.model._jacobian._int_mtx), CSCMatrix)
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+
+    def test_auto_matrix_class_with_view(self):
+        # A subsystem with a Newton solver views the jacobian, which requires a dense matrix.
+        prob = self._auto_model(ScipyIterativeSolver())
+        self.assertIs(type(prob.model._jacobian._int_mtx), CSRMatrix)
+
+        prob = Problem()
+        model = prob.model = Group()
+        model.add_subsystem('px', IndepVarComp('x', np.ones(20)))
+        G1 = model.add_subsystem('G1', Group())
+        G1.add_subsystem('c1', DiagScaleComp(20))
+        G1.nonlinear_solver = NewtonSolver()
+        model.connect('px.x', 'G1.c1.x')
+        model.jacobian = AssembledJacobian(matrix_class='auto')
+        prob.setup(check=False)
+
+        self.assertIs(type(model._jacobian._int_mtx), DenseMatrix)
+
+    def test_memory_report(self):
+        size = 20
+        prob = self._auto_model(DirectSolver(), size)
+        jac = prob.model._jacobian
+
+        stream = StringIO()
+        info = jac.memory_report(out_stream=stream)
+
+        # identity for each of the 3 outputs plus the two connected diagonal partials
+        self.assertEqual(info['shape'], (3 * size, 3 * size))
+        self.assertEqual(info['nnz'], 5 * size)
+        assert_rel_error(self, info['fill_ratio'], 5.0 / (9 * size), 1e-10)
+        self.assertEqual(info['subjac_nnz']['c2.y', 'c2.x'], size)
+        self.assertEqual(info['bytes']['DenseMatrix'], 9 * size * size * 8)
+        self.assertEqual(info['bytes']['CSCMatrix'], 5 * size * 12 + (3 * size + 1) * 4)
+        self.assertEqual(info['matrix_class'], 'CSCMatrix')
+
+        text = stream.getvalue()
+        self.assertIn("Jacobian memory report for 'model'", text)
+        self.assertIn("matrix class: CSCMatrix", text)
+        self.assertIn("c2.y wrt c2.x: %d" % size, text)
+
+        with assertRaisesRegex(self, RuntimeError, "not available until after setup"):
+            AssembledJacobian().memory_report()
+
     def test_component_assembled_jac(self):
         prob = Problem()
         model = prob.model = Group()
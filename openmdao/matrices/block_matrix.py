@@ -0,0 +1,353 @@
+"""Define the BlockMatrix class."""
+from __future__ import division
+
+import numpy as np
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import splu
+
+from six.moves import range
+
+from openmdao.matrices.csc_matrix import CSCMatrix
+
+
+class BlockMatrix(CSCMatrix):
+    """
+    Sparse matrix partitioned into diagonal blocks that follow the system hierarchy.
+
+    The full matrix is stored in Compressed Col Storage format, so it can be used anywhere a
+    <CSCMatrix> can. In addition, each diagonal block (one per subsystem of the system that owns
+    the <AssembledJacobian>) is factored separately with a sparse LU, and the off-diagonal
+    coupling is kept as a sparse matrix. This allows block Jacobi and block Gauss-Seidel solves
+    that never require a factorization of the global matrix. A single block Gauss-Seidel sweep
+    is block forward (or back) substitution, so it is exact if the blocks are triangular.
+
+    Attributes
+    ----------
+    _block_ranges : [(int, int), ...] or None
+        Start and end row (and col) of each diagonal block.
+    _block_names : dict
+        Name of the subsystem of each diagonal block, keyed by its range.
+    _diag_lus : [<scipy.sparse.linalg.SuperLU>, ...]
+        Sparse LU factorization of each diagonal block.
+    _offdiag : <scipy.sparse.csc_matrix>
+        The matrix with all diagonal block entries removed.
+    _offdiag_slabs : dict
+        Row slabs of the off-diagonal coupling for each block, keyed by mode.
+    _diag_map : [(ndarray, ndarray, ndarray), ...]
+        For each block, the data indices and the local rows and cols of its entries.
+    _offdiag_mask : ndarray
+        Mask of the data entries that lie outside the diagonal blocks.
+    _block_lower : bool
+        True if all off-diagonal coupling lies below the diagonal blocks (feed-forward).
+    _block_upper : bool
+        True if all off-diagonal coupling lies above the diagonal blocks (feed-back).
+    _stale : bool
+        True if the matrix data has changed since the blocks were last extracted.
+    """
+
+    def __init__(self, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        """
+        super(BlockMatrix, self).__init__(comm)
+        self._block_ranges = None
+        self._block_names = {}
+        self._diag_lus = []
+        self._offdiag = None
+        self._offdiag_slabs = {}
+        self._diag_map = []
+        self._offdiag_mask = None
+        self._block_lower = True
+        self._block_upper = True
+        self._stale = True
+
+    def _set_block_ranges(self, ranges, names):
+        """
+        Set the row/col ranges of the diagonal blocks.
+
+        Any part of the matrix not covered by the given ranges becomes a block of its own.
+
+        Parameters
+        ----------
+        ranges : [(int, int), ...]
+            Start and end index of each block, e.g., the view ranges of each subsystem.
+        names : [str, ...]
+            Name of each block, used in error messages.
+        """
+        self._block_names = {rng: name for rng, name in zip(ranges, names)}
+        self._block_ranges = sorted(rng for rng in ranges if rng[1] > rng[0])
+
+    @classmethod
+    def _get_projected_bytes(cls, nnz, num_rows, num_cols, block_sizes=()):
+        """
+        Return the number of bytes this matrix type needs to store the given matrix.
+
+        Parameters
+        ----------
+        nnz : int
+            number of nonzeros in the matrix.
+        num_rows : int
+            number of rows in the matrix.
+        num_cols : int
+            number of cols in the matrix.
+        block_sizes : iterable of int
+            sizes of the diagonal blocks, for matrix types that store them separately.
+
+        Returns
+        -------
+        int
+            projected number of bytes.
+        """
+        # the full CSC matrix, plus the sparse LU factors of the diagonal blocks, which hold at
+        # most all of the nonzeros before fill-in, and their row and col permutations
+        nbytes = 2 * super(BlockMatrix, cls)._get_projected_bytes(nnz, num_rows, num_cols)
+        for size in block_sizes:
+            nbytes += 2 * size * np.dtype(np.int32).itemsize
+        return nbytes
+
+    def _build(self, num_rows, num_cols):
+        """
+        Allocate the matrix.
+
+        Parameters
+        ----------
+        num_rows : int
+            number of rows in the matrix.
+        num_cols : int
+            number of cols in the matrix.
+        """
+        super(BlockMatrix, self)._build(num_rows, num_cols)
+
+        # Without block ranges (e.g., for the rectangular external matrix), this is just a CSC.
+        if self._block_ranges is None:
+            return
+
+        # Make sure the blocks tile the whole diagonal.
+        ranges = []
+        end = 0
+        for start, stop in self._block_ranges:
+            if start > end:
+                ranges.append((end, start))
+            ranges.append((start, stop))
+            end = stop
+        if end < num_rows:
+            ranges.append((end, num_rows))
+        self._block_ranges = ranges
+
+        mtx = self._matrix
+        starts = np.array([rng[0] for rng in ranges], dtype=int)
+
+        rows = mtx.indices
+        cols = np.repeat(np.arange(num_cols), np.diff(mtx.indptr))
+        row_blk = np.searchsorted(starts, rows, side='right') - 1
+        col_blk = np.searchsorted(starts, cols, side='right') - 1
+
+        on_diag = row_blk == col_blk
+        self._offdiag_mask = np.logical_not(on_diag)
+
+        self._diag_map = []
+        for iblk, (start, stop) in enumerate(ranges):
+            idxs = np.nonzero(np.logical_and(on_diag, row_blk == iblk))[0]
+            self._diag_map.append((idxs, rows[idxs] - start, cols[idxs] - start))
+
+        off_rows = row_blk[self._offdiag_mask]
+        off_cols = col_blk[self._offdiag_mask]
+        self._block_lower = bool(np.all(off_rows > off_cols))
+        self._block_upper = bool(np.all(off_rows < off_cols))
+
+        self._diag_lus = []
+        self._stale = True
+
+    def _update_submat(self, key, jac):
+        """
+        Update the values of a sub-jacobian.
+
+        Parameters
+        ----------
+        key : (int, int)
+            the global output and input variable indices.
+        jac : ndarray or scipy.sparse or tuple
+            the sub-jacobian, the same format with which it was declared.
+        """
+        super(BlockMatrix, self)._update_submat(key, jac)
+        self._stale = True
+
+    def _update_blocks(self):
+        """
+        Extract the diagonal blocks and off-diagonal coupling, and factor the diagonal blocks.
+        """
+        if not self._stale:
+            return
+
+        mtx = self._matrix
+        data = mtx.data
+
+        self._diag_lus = []
+        for (idxs, rows, cols), rng in zip(self._diag_map, self._block_ranges):
+            size = rng[1] - rng[0]
+            blk = csc_matrix((data[idxs], (rows, cols)), shape=(size, size))
+            try:
+                self._diag_lus.append(splu(blk))
+            except RuntimeError:
+                if rng in self._block_names:
+                    name = "of subsystem '%s'" % self._block_names[rng]
+                else:
+                    name = "for rows %d to %d" % rng
+                raise RuntimeError("The diagonal block %s is singular." % name)
+
+        self._offdiag = csc_matrix((data * self._offdiag_mask, mtx.indices, mtx.indptr),
+                                   shape=mtx.shape)
+        self._offdiag_slabs = {}
+        self._stale = False
+
+    def _get_offdiag_slabs(self, mode):
+        """
+        Return the off-diagonal row slab of each block for the given mode.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        [<scipy.sparse.csr_matrix>, ...]
+            Off-diagonal rows of each block of the matrix (fwd) or its transpose (rev).
+        """
+        if mode not in self._offdiag_slabs:
+            if mode == 'fwd':
+                offdiag = self._offdiag.tocsr()
+            else:
+                offdiag = self._offdiag.T.tocsr()
+            self._offdiag_slabs[mode] = [offdiag[start:stop]
+                                         for start, stop in self._block_ranges]
+
+        return self._offdiag_slabs[mode]
+
+    def _block_sweep(self, b, x, mode):
+        """
+        Perform one block Gauss-Seidel sweep in place.
+
+        Parameters
+        ----------
+        b : ndarray[:]
+            right-hand side.
+        x : ndarray[:]
+            current solution, updated in place.
+        mode : str
+            'fwd' or 'rev'.
+        """
+        trans = 'N' if mode == 'fwd' else 'T'
+        slabs = self._get_offdiag_slabs(mode)
+        ranges = self._block_ranges
+
+        # The transpose of a block lower triangular matrix is block upper triangular, so sweep
+        # in whichever order makes a single pass exact for feed-forward (or feed-back) models.
+        if mode == 'fwd':
+            lower, upper = self._block_lower, self._block_upper
+        else:
+            lower, upper = self._block_upper, self._block_lower
+
+        if upper and not lower:
+            order = range(len(ranges) - 1, -1, -1)
+        else:
+            order = range(len(ranges))
+
+        for iblk in order:
+            start, stop = ranges[iblk]
+            rhs = b[start:stop] - slabs[iblk].dot(x)
+            x[start:stop] = self._diag_lus[iblk].solve(rhs, trans=trans)
+
+    def _is_block_triangular(self):
+        """
+        Return True if the block structure is triangular so a single sweep is exact.
+
+        Returns
+        -------
+        bool
+            True if all off-diagonal coupling lies on one side of the diagonal blocks.
+        """
+        return self._block_lower or self._block_upper
+
+    def _block_jacobi_solve(self, b, mode):
+        """
+        Solve with the diagonal blocks only, ignoring the coupling between them.
+
+        Parameters
+        ----------
+        b : ndarray[:]
+            right-hand side.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        ndarray[:]
+            solution vector.
+        """
+        self._update_blocks()
+
+        trans = 'N' if mode == 'fwd' else 'T'
+        x = np.empty(b.size)
+        for (start, stop), lu in zip(self._block_ranges, self._diag_lus):
+            x[start:stop] = lu.solve(b[start:stop], trans=trans)
+        return x
+
+    def _block_gs_solve(self, b, mode, x0=None, maxiter=10, atol=1e-10, rtol=1e-10):
+        """
+        Solve using block Gauss-Seidel iteration over the diagonal blocks.
+
+        From a zero initial guess, a single sweep is exact if the matrix is block triangular and
+        is a fixed linear operator otherwise, which is suitable for preconditioning.
+
+        Parameters
+        ----------
+        b : ndarray[:]
+            right-hand side.
+        mode : str
+            'fwd' or 'rev'.
+        x0 : ndarray[:] or None
+            initial guess. Zero is used if None.
+        maxiter : int
+            maximum number of sweeps.
+        atol : float
+            absolute tolerance on the residual norm.
+        rtol : float
+            relative tolerance on the residual norm.
+
+        Returns
+        -------
+        ndarray[:]
+            solution vector.
+        int
+            number of sweeps performed.
+        """
+        self._update_blocks()
+
+        if x0 is None:
+            x = np.zeros(b.size)
+            norm0 = np.linalg.norm(b)
+        else:
+            x = np.array(x0, dtype=float)
+            norm0 = np.linalg.norm(b - self._prod(x, mode, None))
+        if norm0 == 0.0:
+            return x, 0
+
+        norm = norm0
+        niter = 0
+        while niter < maxiter and norm > atol and norm / norm0 > rtol:
+            self._block_sweep(b, x, mode)
+            niter += 1
+
+            # A single sweep solves a block triangular system exactly.
+            if self._is_block_triangular() or niter == maxiter:
+                break
+
+            norm = np.linalg.norm(b - self._prod(x, mode, None))
+
+        return x, niter
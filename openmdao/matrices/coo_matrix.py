@@ -7,14 +7,117 @@ from scipy.sparse import coo_matrix, csr_matrix
 
 from six import iteritems
 
-from openmdao.matrices.matrix import Matrix, _compute_index_map, sparse_types
+from openmdao.matrices.matrix import Matrix, _compute_index_map, _get_index_bytes, \
+    sparse_types
+from openmdao.utils.thread_utils import get_thread_pool, in_worker_thread
+
+
+def _row_slabs(mtx, num_slabs):
+    """
+    Split a CSR matrix into row slabs with roughly equal numbers of nonzeros.
+
+    The slabs share their data arrays with the original matrix, so in-place updates of its data
+    are seen by the slabs.
+
+    Parameters
+    ----------
+    mtx : <scipy.sparse.csr_matrix>
+        The matrix to split.
+    num_slabs : int
+        Number of slabs.
+
+    Returns
+    -------
+    [<scipy.sparse.csr_matrix>, ...]
+        Row slabs of the matrix.
+    """
+    indptr = mtx.indptr
+    nrows, ncols = mtx.shape
+    bounds = np.searchsorted(indptr, np.linspace(0, indptr[-1], num_slabs + 1))
+    bounds = np.unique(np.clip(bounds, 0, nrows))
+    bounds[0] = 0
+    bounds[-1] = nrows
+
+    slabs = []
+    for row1, row2 in zip(bounds[:-1], bounds[1:]):
+        ind1, ind2 = indptr[row1], indptr[row2]
+        slabs.append(csr_matrix((mtx.data[ind1:ind2], mtx.indices[ind1:ind2],
+                                 indptr[row1:row2 + 1] - ind1),
+                                shape=(row2 - row1, ncols)))
+    return slabs
+
+
+def _slab_dot(args):
+    """
+    Multiply one row slab by a vector; run in a worker thread.
+
+    Parameters
+    ----------
+    args : (<scipy.sparse.csr_matrix>, ndarray)
+        The row slab and the incoming vector.
+
+    Returns
+    -------
+    ndarray
+        The product of the slab with the vector.
+    """
+    slab, vec = args
+    return slab.dot(vec)
 
 
 class COOMatrix(Matrix):
     """
     Sparse matrix in Coordinate list format.
+
+    Attributes
+    ----------
+    _matrix_T : object or None
+        Cached transpose of _matrix, sharing its data array.
+    _slabs : dict
+        Row slabs for the threaded product, keyed by mode.
+    _slabs_stale : bool
+        True if the data has changed since the row slabs were built.
     """
 
+    def __init__(self, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        """
+        super(COOMatrix, self).__init__(comm)
+        self._matrix_T = None
+        self._slabs = {}
+        self._slabs_stale = True
+
+    @classmethod
+    def _get_projected_bytes(cls, nnz, num_rows, num_cols, block_sizes=()):
+        """
+        Return the number of bytes this matrix type needs to store the given matrix.
+
+        Parameters
+        ----------
+        nnz : int
+            number of nonzeros in the matrix.
+        num_rows : int
+            number of rows in the matrix.
+        num_cols : int
+            number of cols in the matrix.
+        block_sizes : iterable of int
+            sizes of the diagonal blocks, for matrix types that store them separately.
+
+        Returns
+        -------
+        int
+            projected number of bytes.
+        """
+        # data, row and col arrays
+        idx_bytes = _get_index_bytes(nnz, num_rows, num_cols)
+        return nnz * (np.dtype(float).itemsize + 2 * idx_bytes)
+
     def _build_sparse(self, num_rows, num_cols):
         """
         Allocate the data, rows, and cols for the sparse matrix.
@@ -33,6 +136,9 @@ class COOMatrix(Matrix):
         """
         counter = 0
 
+        # Any row slabs belong to the previous allocation.
+        self._slabs_stale = True
+
         submats = self._submats
         metadata = self._metadata
         pre_metadata = {}
@@ -76,9 +182,8 @@ class COOMatrix(Matrix):
                 subrows = rows[ind1:ind2]
                 subcols = cols[ind1:ind2]
 
-                for i, row in enumerate(rowrange):
-                    subrows[i * ncols: (i + 1) * ncols] = row
-                    subcols[i * ncols: (i + 1) * ncols] = colrange
+                subrows[:] = np.repeat(rowrange, ncols)
+                subcols[:] = np.tile(colrange, rowrange.size)
 
                 rows[ind1:ind2] += irow
                 cols[ind1:ind2] += icol
@@ -160,6 +265,53 @@ class COOMatrix(Matrix):
         if factor is not None:
             self._matrix.data[idxs] *= factor
 
+        self._slabs_stale = True
+
+    def _get_transpose(self):
+        """
+        Return the transpose of the matrix.
+
+        The transpose shares its data array with the matrix, so it only needs to be rebuilt when
+        the matrix itself is reallocated.
+
+        Returns
+        -------
+        object
+            The transposed scipy sparse matrix.
+        """
+        if self._matrix_T is None or self._matrix_T.data is not self._matrix.data:
+            self._matrix_T = self._matrix.T
+        return self._matrix_T
+
+    def _get_slabs(self, mode):
+        """
+        Return row slabs of the matrix (fwd) or its transpose (rev) for the threaded product.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        [<scipy.sparse.csr_matrix>, ...]
+            Row slabs.
+        """
+        if self._slabs_stale:
+            self._slabs = {}
+            self._slabs_stale = False
+
+        if mode not in self._slabs:
+            mtx = self._matrix if mode == 'fwd' else self._get_transpose()
+
+            # Slabs of a CSR matrix are views, but any other format has to be converted, which
+            # is why the slabs are rebuilt (once per linearization) after the data changes.
+            if not isinstance(mtx, csr_matrix):
+                mtx = mtx.tocsr()
+            self._slabs[mode] = _row_slabs(mtx, self._num_threads)
+
+        return self._slabs[mode]
+
     def _prod(self, in_vec, mode, ranges):
         """
         Perform a matrix vector product.
@@ -178,7 +330,13 @@ class COOMatrix(Matrix):
         ndarray[:]
             vector resulting from the product.
         """
+        if self._num_threads > 1 and not in_worker_thread():
+            # Row-partitioned product; the scipy kernels release the GIL.
+            pool = get_thread_pool(self._num_threads)
+            slabs = self._get_slabs(mode)
+            return np.concatenate(pool.map(_slab_dot, [(slab, in_vec) for slab in slabs]))
+
         if mode == 'fwd':
             return self._matrix.dot(in_vec)
         elif mode == 'rev':
-            return self._matrix.T.dot(in_vec)
+            return self._get_transpose().dot(in_vec)
@@ -5,6 +5,7 @@ from scipy.sparse import coo_matrix
 from six import iteritems
 
 from openmdao.matrices.coo_matrix import COOMatrix
+from openmdao.matrices.matrix import _get_index_bytes
 
 
 class CSRMatrix(COOMatrix):
@@ -12,6 +13,31 @@ class CSRMatrix(COOMatrix):
     Sparse matrix in Compressed Row Storage format.
     """
 
+    @classmethod
+    def _get_projected_bytes(cls, nnz, num_rows, num_cols, block_sizes=()):
+        """
+        Return the number of bytes this matrix type needs to store the given matrix.
+
+        Parameters
+        ----------
+        nnz : int
+            number of nonzeros in the matrix.
+        num_rows : int
+            number of rows in the matrix.
+        num_cols : int
+            number of cols in the matrix.
+        block_sizes : iterable of int
+            sizes of the diagonal blocks, for matrix types that store them separately.
+
+        Returns
+        -------
+        int
+            projected number of bytes.
+        """
+        # data and col arrays, plus a row pointer array
+        idx_bytes = _get_index_bytes(nnz, num_rows, num_cols)
+        return nnz * (np.dtype(float).itemsize + idx_bytes) + (num_rows + 1) * idx_bytes
+
     def _build(self, num_rows, num_cols):
         """
         Allocate the matrix.
@@ -10,6 +10,29 @@ class DenseMatrix(Matrix):
     Dense global matrix.
     """
 
+    @classmethod
+    def _get_projected_bytes(cls, nnz, num_rows, num_cols, block_sizes=()):
+        """
+        Return the number of bytes this matrix type needs to store the given matrix.
+
+        Parameters
+        ----------
+        nnz : int
+            number of nonzeros in the matrix.
+        num_rows : int
+            number of rows in the matrix.
+        num_cols : int
+            number of cols in the matrix.
+        block_sizes : iterable of int
+            sizes of the diagonal blocks, for matrix types that store them separately.
+
+        Returns
+        -------
+        int
+            projected number of bytes.
+        """
+        return num_rows * num_cols * np.dtype(float).itemsize
+
     def _build(self, num_rows, num_cols):
         """
         Allocate the matrix.
@@ -1,6 +1,7 @@
 """Define the base Matrix class."""
 from __future__ import division
 import numpy as np
+from six import iteritems
 from scipy.sparse import coo_matrix, csr_matrix, csc_matrix
 
 # scipy sparse types allowed to be subjacs
@@ -23,6 +24,8 @@ class Matrix(object):
         dictionary of sub-jacobian data keyed by (out_ind, in_ind).
     _metadata : dict
         implementation-specific data for the sub-jacobians.
+    _num_threads : int
+        Number of threads to use for matrix-vector products, if supported.
     """
 
     def __init__(self, comm):
@@ -38,6 +41,7 @@ class Matrix(object):
         self._matrix = None
         self._submats = {}
         self._metadata = {}
+        self._num_threads = 1
 
     def _add_submat(self, key, info, irow, icol, src_indices, shape, factor=None):
         """
@@ -89,6 +93,54 @@ class Matrix(object):
         """
         pass
 
+    def _get_submat_nnz(self):
+        """
+        Return the number of nonzeros expected in each declared sub-jacobian.
+
+        Returns
+        -------
+        dict
+            Number of nonzeros keyed by sub-jacobian key.
+        """
+        nnz = {}
+        for key, (info, irow, icol, src_indices, shape, factor) in iteritems(self._submats):
+            rows = info['rows']
+            val = info['value']
+
+            if not info['dependent']:
+                nnz[key] = 0
+            elif rows is not None:
+                nnz[key] = len(rows)
+            elif isinstance(val, sparse_types):
+                nnz[key] = val.nnz
+            else:
+                nnz[key] = int(np.prod(shape))
+
+        return nnz
+
+    @classmethod
+    def _get_projected_bytes(cls, nnz, num_rows, num_cols, block_sizes=()):
+        """
+        Return the number of bytes this matrix type needs to store the given matrix.
+
+        Parameters
+        ----------
+        nnz : int
+            number of nonzeros in the matrix.
+        num_rows : int
+            number of rows in the matrix.
+        num_cols : int
+            number of cols in the matrix.
+        block_sizes : iterable of int
+            sizes of the diagonal blocks, for matrix types that store them separately.
+
+        Returns
+        -------
+        int or None
+            projected number of bytes, or None if unknown for this matrix type.
+        """
+        return None
+
     def _prod(self, vec, mode, ranges):
         """
         Perform a matrix vector product.
@@ -110,6 +162,29 @@ class Matrix(object):
         pass
 
 
+def _get_index_bytes(nnz, num_rows, num_cols):
+    """
+    Return the size of the integer type scipy uses to index a sparse matrix.
+
+    Parameters
+    ----------
+    nnz : int
+        number of nonzeros in the matrix.
+    num_rows : int
+        number of rows in the matrix.
+    num_cols : int
+        number of cols in the matrix.
+
+    Returns
+    -------
+    int
+        number of bytes per index.
+    """
+    if max(nnz, num_rows, num_cols) < np.iinfo(np.int32).max:
+        return np.dtype(np.int32).itemsize
+    return np.dtype(np.int64).itemsize
+
+
 def _compute_index_map(jrows, jcols, irow, icol, src_indices):
     """
     Return row/column indices to map sub-jacobian to global jac.
@@ -134,17 +209,10 @@ def _compute_index_map(jrows, jcols, irow, icol, src_indices):
         Row indices, column indices, and indices of columns matching
         src_indices.
     """
-    icols = []
-    idxs = []
-
-    for i, idx in enumerate(src_indices):
-        # pull out columns that match each index
-        idxarr = np.nonzero(jcols == i)[0]
-        idxs.append(idxarr)
-        icols.append(np.full(idxarr.shape, idx, dtype=int))
-
-    idxs = np.hstack(idxs)
-    icols = np.hstack(icols) + icol
+    # A stable sort groups the entries by column, in the same order as the columns of the
+    # sub-jacobian, i.e., the order of src_indices.
+    idxs = np.argsort(jcols, kind='mergesort')
+    icols = np.asarray(src_indices)[jcols[idxs]] + icol
     irows = jrows[idxs] + irow
 
     return (irows, icols, idxs)
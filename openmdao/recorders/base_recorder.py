@@ -3,7 +3,9 @@ Class definition for BaseRecorder, the base class for all recorders.
 """
 from fnmatch import fnmatchcase
 import sys
+import threading
 from six import StringIO
+from six.moves import queue
 
 from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.general_utils import warn_deprecation
@@ -44,6 +46,12 @@ class BaseRecorder(object):
         Tells recorder whether to record the output of a Solver.
     options['record_solver_derivatives'] :  bool(False)
         Tells recorder whether to record the derivatives of a Solver.
+    options['record_solver_telemetry'] :  bool(False)
+        Tells recorder whether to record the timing and iteration statistics of a Solver.
+    options['asynchronous'] :  bool(False)
+        Tells recorder whether to serialize and write the recorded data on a background thread.
+    options['queue_size'] :  int(100)
+        Maximum number of records waiting for the background thread.
     options['includes'] :  list of strings("*")
         Patterns for variables to include in recording.
     options['excludes'] :  list of strings('')
@@ -61,6 +69,12 @@ class BaseRecorder(object):
         Filtered subset of solver variables to record, based on includes/excludes.
     _filtered_system : dict
         Filtered subset of system variables to record, based on includes/excludes.
+    _queue : Queue or None
+        Calls waiting for the background thread, when recording asynchronously.
+    _writer : Thread or None
+        Background thread that serializes and writes the recorded data.
+    _writer_error : Exception or None
+        First error raised on the background thread, re-raised when the recorder is closed.
 
     """
 
@@ -76,6 +90,12 @@ class BaseRecorder(object):
         self.options.declare('excludes', type_=list, default=[],
                              desc='Patterns for vars to exclude in recording '
                                   '(processed post-includes)')
+        self.options.declare('asynchronous', type_=bool, default=False,
+                             desc='Set to True to serialize and write the recorded data on a '
+                                  'background thread')
+        self.options.declare('queue_size', type_=int, default=100, lower=1,
+                             desc='Maximum number of records waiting for the background thread. '
+                                  'Recording blocks while the queue is full.')
 
         # Old options that will be deprecated
         self.options.declare('record_unknowns', type_=bool, default=False,
@@ -113,6 +133,9 @@ class BaseRecorder(object):
                              desc='Set to True to record output at the solver level')
         self.options.declare('record_solver_residuals', type_=bool, default=False,
                              desc='Set to True to record residuals at the solver level')
+        self.options.declare('record_solver_telemetry', type_=bool, default=False,
+                             desc='Set to True to record timing and iteration statistics at the '
+                                  'solver level')
 
         self.out = None
 
@@ -124,6 +147,10 @@ class BaseRecorder(object):
         self._filtered_system = {}
         self._filtered_solver = {}
 
+        self._queue = None
+        self._writer = None
+        self._writer_error = None
+
     def startup(self, object_requesting_recording):
         """
         Prepare for a new run and calculate inclusion lists.
@@ -289,6 +316,67 @@ class BaseRecorder(object):
         """
         self._counter += 1
 
+    def _submit(self, func, *args, **kwargs):
+        """
+        Call a function that serializes and writes recorded data.
+
+        When recording asynchronously, the call is queued for the background thread instead. The
+        arguments must then be copies of the recorded data, since the model keeps running.
+
+        Parameters
+        ----------
+        func : callable
+            Function to call.
+        *args : list
+            Positional arguments of the function.
+        **kwargs : dict
+            Keyword arguments of the function.
+        """
+        if not self.options['asynchronous']:
+            func(*args, **kwargs)
+            return
+
+        if self._writer is None:
+            self._queue = queue.Queue(self.options['queue_size'])
+            self._writer = threading.Thread(target=self._run_writer)
+            self._writer.daemon = True
+            self._writer.start()
+
+        # blocks while the queue is full, so the model cannot run ahead of the writer indefinitely
+        self._queue.put((func, args, kwargs))
+
+    def _run_writer(self):
+        """
+        Make the queued calls on the background thread until None is received.
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            # After an error, keep emptying the queue so that the recording thread doesn't block.
+            if self._writer_error is None:
+                func, args, kwargs = item
+                try:
+                    func(*args, **kwargs)
+                except Exception as err:
+                    self._writer_error = err
+
+    def _stop_writer(self):
+        """
+        Wait until the queued calls are done, stop the background thread, and raise its error.
+        """
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+
+        err = self._writer_error
+        if err is not None:
+            self._writer_error = None
+            raise err
+
     def close(self):
         """
         Close `out` unless it's ``sys.stdout``, ``sys.stderr``, or StringIO.
@@ -296,6 +384,8 @@ class BaseRecorder(object):
         Note that a closed recorder will do nothing in :meth:`record`, and
         closing a closed recorder also does nothing.
         """
+        self._stop_writer()
+
         # Closing a StringIO deletes its contents.
         if self.out not in (None, sys.stdout, sys.stderr):
             if not isinstance(self.out, StringIO):
@@ -211,8 +211,10 @@ class OpenMDAOServerRecorder(BaseRecorder):
         driver_iteration = json.dumps(driver_iteration_dict)
         global_iteration = json.dumps(global_iteration_dict)
         
-        requests.post(_endpoint + '/' + self._case_id + '/driver_iterations', data=driver_iteration, headers=self._headers)
-        requests.post(_endpoint + '/' + self._case_id + '/global_iterations', data=global_iteration, headers=self._headers)
+        self._submit(requests.post, _endpoint + '/' + self._case_id + '/driver_iterations',
+                     data=driver_iteration, headers=self._headers)
+        self._submit(requests.post, _endpoint + '/' + self._case_id + '/global_iterations',
+                     data=global_iteration, headers=self._headers)
 
     def record_iteration_system(self, object_requesting_recording, metadata, method):
         """
@@ -339,8 +341,10 @@ class OpenMDAOServerRecorder(BaseRecorder):
         system_iteration = json.dumps(system_iteration_dict)
         global_iteration = json.dumps(global_iteration_dict)
 
-        requests.post(_endpoint + '/' + self._case_id + '/system_iterations', data=system_iteration, headers=self._headers)
-        requests.post(_endpoint + '/' + self._case_id + '/global_iterations', data=global_iteration, headers=self._headers)
+        self._submit(requests.post, _endpoint + '/' + self._case_id + '/system_iterations',
+                     data=system_iteration, headers=self._headers)
+        self._submit(requests.post, _endpoint + '/' + self._case_id + '/global_iterations',
+                     data=global_iteration, headers=self._headers)
 
     def record_iteration_solver(self, object_requesting_recording, metadata, **kwargs):
         """
@@ -442,8 +446,10 @@ class OpenMDAOServerRecorder(BaseRecorder):
         solver_iteration = json.dumps(solver_iteration_dict)
         global_iteration = json.dumps(global_iteration_dict)
 
-        requests.post(_endpoint + '/' + self._case_id + '/solver_iterations', data=solver_iteration, headers=self._headers)
-        requests.post(_endpoint + '/' + self._case_id + '/global_iterations', data=global_iteration, headers=self._headers)
+        self._submit(requests.post, _endpoint + '/' + self._case_id + '/solver_iterations',
+                     data=solver_iteration, headers=self._headers)
+        self._submit(requests.post, _endpoint + '/' + self._case_id + '/global_iterations',
+                     data=global_iteration, headers=self._headers)
 
     def record_metadata(self, object_requesting_recording):
         """
@@ -480,7 +486,8 @@ class OpenMDAOServerRecorder(BaseRecorder):
         }
         driver_metadata = json.dumps(driver_metadata_dict)
 
-        requests.post(_endpoint + '/' + self._case_id + '/driver_metadata', data=driver_metadata, headers=self._headers)
+        self._submit(requests.post, _endpoint + '/' + self._case_id + '/driver_metadata',
+                     data=driver_metadata, headers=self._headers)
 
     def record_metadata_system(self, object_requesting_recording):
         """
@@ -500,7 +507,8 @@ class OpenMDAOServerRecorder(BaseRecorder):
         }
         system_metadata = json.dumps(system_metadata_dict)
         
-        requests.post(_endpoint + '/' + self._case_id + '/system_metadata', data=system_metadata, headers=self._headers)
+        self._submit(requests.post, _endpoint + '/' + self._case_id + '/system_metadata',
+                     data=system_metadata, headers=self._headers)
 
     def record_metadata_solver(self, object_requesting_recording):
         """
@@ -532,13 +540,14 @@ class OpenMDAOServerRecorder(BaseRecorder):
         }
         solver_metadata = json.dumps(solver_metadata_dict)
 
-        requests.post(_endpoint + '/' + self._case_id + '/solver_metadata', data=solver_metadata, headers=self._headers)
+        self._submit(requests.post, _endpoint + '/' + self._case_id + '/solver_metadata',
+                     data=solver_metadata, headers=self._headers)
 
     def close(self):
         """
-        Close.
+        Wait until the queued requests are sent.
         """
-        pass
+        self._stop_writer()
 
     def convert_to_list(self, obj):
         if isinstance(obj, np.ndarray):
@@ -1,6 +1,111 @@
 """Management of iteration stack for recording."""
 
-recording_iteration_stack = []
+import threading
+
+
+class _RecordingIterationStack(threading.local):
+    """
+    List-like stack of (name, iter_count) tuples, kept separately for each thread.
+
+    Subsystems that are solved concurrently on worker threads each push and pop their own
+    entries, so their iteration coordinates are not mixed up.
+
+    Attributes
+    ----------
+    _items : [(str, int), ...]
+        The entries of the stack for the current thread.
+    """
+
+    def __init__(self):
+        """
+        Initialize the stack for the current thread.
+        """
+        self._items = []
+
+    def append(self, item):
+        """
+        Push an entry onto the stack.
+
+        Parameters
+        ----------
+        item : (str, int)
+            Name and iteration count.
+        """
+        self._items.append(item)
+
+    def pop(self):
+        """
+        Pop the last entry off the stack.
+
+        Returns
+        -------
+        (str, int)
+            Name and iteration count.
+        """
+        return self._items.pop()
+
+    def reset(self, items=()):
+        """
+        Replace the entries of the stack, e.g., with those of the thread that started a task.
+
+        Parameters
+        ----------
+        items : iterable of (str, int)
+            The new entries.
+        """
+        self._items = list(items)
+
+    def __getitem__(self, index):
+        """
+        Return the entry at the given index.
+
+        Parameters
+        ----------
+        index : int or slice
+            Index into the stack.
+
+        Returns
+        -------
+        (str, int) or list
+            The entry or entries.
+        """
+        return self._items[index]
+
+    def __iter__(self):
+        """
+        Iterate over the entries from the bottom of the stack.
+
+        Returns
+        -------
+        iterator
+            Iterator over the entries.
+        """
+        return iter(self._items)
+
+    def __reversed__(self):
+        """
+        Iterate over the entries from the top of the stack.
+
+        Returns
+        -------
+        iterator
+            Iterator over the entries.
+        """
+        return reversed(self._items)
+
+    def __len__(self):
+        """
+        Return the number of entries.
+
+        Returns
+        -------
+        int
+            Number of entries.
+        """
+        return len(self._items)
+
+
+recording_iteration_stack = _RecordingIterationStack()
 
 
 def print_recording_iteration_stack():
@@ -95,7 +200,7 @@ class Recording(object):
         # Determine if recording is justified.
         do_recording = True
         for stack_item in recording_iteration_stack:
-            if stack_item[0] in ('_iter_get_norm', '_compute_total_derivs'):
+            if stack_item[0] in ('_iter_get_norm', '_compute_total_derivs', '_approx_worker'):
                 do_recording = False
                 break
 
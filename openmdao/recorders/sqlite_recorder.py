@@ -4,6 +4,8 @@ Class definition for SqliteRecorder, which provides dictionary backed by SQLite.
 
 import io
 import sqlite3
+import time
+from collections import OrderedDict
 
 import numpy as np
 from six import iteritems
@@ -45,11 +47,34 @@ def blob_to_array(blob):
 
 format_version = 1
 
+# statements used to insert the iteration records, in the order in which buffered rows are written
+_insert_sql = OrderedDict([
+    ('driver_iterations', "INSERT INTO driver_iterations(id, counter, iteration_coordinate, "
+                          "timestamp, success, msg, desvars , responses , objectives , "
+                          "constraints ) VALUES(?,?,?,?,?,?,?,?,?,?)"),
+    ('system_iterations', "INSERT INTO system_iterations(id, counter, iteration_coordinate, "
+                          "timestamp, success, msg, inputs , outputs , residuals ) "
+                          "VALUES(?,?,?,?,?,?,?,?,?)"),
+    ('solver_iterations', "INSERT INTO solver_iterations(id, counter, iteration_coordinate, "
+                          "timestamp, success, msg, abs_err, rel_err, solver_output, "
+                          "solver_residuals) VALUES(?,?,?,?,?,?,?,?,?,?)"),
+    ('global_iterations', "INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)"),
+    ('solver_telemetry', "INSERT INTO solver_telemetry(counter, iteration_coordinate, "
+                         "telemetry) VALUES(?,?,?)"),
+])
+
 
 class SqliteRecorder(BaseRecorder):
     """
     Recorder that saves cases in a sqlite db.
 
+    Options
+    -------
+    options['buffer_size'] :  int(1)
+        Number of iteration records that are written to the database in a single transaction.
+    options['flush_interval'] :  float(0.0)
+        Seconds after which the buffered records are written even if the buffer is not full.
+
     Attributes
     ----------
     model_viewer_data : dict
@@ -58,6 +83,16 @@ class SqliteRecorder(BaseRecorder):
         Connection to the sqlite3 database.
     cursor
         Sqlite3 system cursor via the con.
+    _buffer : OrderedDict
+        Rows waiting to be written, keyed by table.
+    _buffer_count : int
+        Number of iteration records in the buffer.
+    _last_flush : float
+        Time at which the buffer was last written.
+    _row_ids : dict
+        Id of the last row of each iteration table, keyed by record type.
+    _wal : bool
+        True if the database has been switched to write-ahead logging.
     """
 
     def __init__(self, out):
@@ -66,10 +101,26 @@ class SqliteRecorder(BaseRecorder):
         """
         super(SqliteRecorder, self).__init__()
 
+        self.options.declare('buffer_size', type_=int, default=1, lower=1,
+                             desc='Number of iteration records that are written to the database in '
+                                  'a single transaction. Values larger than 1 also switch the '
+                                  'database to write-ahead logging.')
+        self.options.declare('flush_interval', type_=(int, float), default=0.0, lower=0.0,
+                             desc='Seconds after which the buffered records are written when the '
+                                  'next record arrives, even if the buffer is not full. '
+                                  '0 means no time limit.')
+
         self.model_viewer_data = None
 
-        # isolation_level=None causes autocommit
-        self.con = sqlite3.connect(out, isolation_level=None)
+        self._buffer = OrderedDict((table, []) for table in _insert_sql)
+        self._buffer_count = 0
+        self._last_flush = time.time()
+        self._row_ids = {'driver': 0, 'system': 0, 'solver': 0}
+        self._wal = False
+
+        # isolation_level=None causes autocommit. When recording asynchronously, the connection is
+        # only used by the background thread until the recorder is closed.
+        self.con = sqlite3.connect(out, isolation_level=None, check_same_thread=False)
 
         self.cursor = self.con.cursor()
 
@@ -89,6 +140,8 @@ class SqliteRecorder(BaseRecorder):
                             "iteration_coordinate TEXT, timestamp REAL, success INT, msg TEXT, "
                             "abs_err REAL, rel_err REAL, solver_output BLOB, "
                             "solver_residuals BLOB)")
+        self.cursor.execute("CREATE TABLE solver_telemetry(id INTEGER PRIMARY KEY, counter INT, "
+                            "iteration_coordinate TEXT, telemetry BLOB)")
 
         self.cursor.execute("CREATE TABLE driver_metadata(id TEXT PRIMARY KEY, "
                             "model_viewer_data BLOB)")
@@ -97,6 +150,63 @@ class SqliteRecorder(BaseRecorder):
         self.cursor.execute("CREATE TABLE solver_metadata(id TEXT PRIMARY KEY, solver_options BLOB,"
                             " solver_class TEXT)")
 
+    def _write_iteration(self, record_type, values, arrays, telemetry=None):
+        """
+        Add an iteration record to the buffer and write the buffer when it is due.
+
+        Parameters
+        ----------
+        record_type : str
+            'driver', 'system', or 'solver'.
+        values : tuple
+            Values of the columns of the iteration table, without the id and the BLOB columns.
+        arrays : tuple
+            Arrays to be stored in the BLOB columns of the iteration table.
+        telemetry : tuple or None
+            Counter, iteration coordinate, and statistics of the solver, if they are recorded.
+        """
+        values += tuple(array_to_blob(array) for array in arrays)
+        if telemetry is not None:
+            counter, iteration_coordinate, stats = telemetry
+            telemetry_blob = pickle.dumps(stats, pickle.HIGHEST_PROTOCOL)
+            telemetry = (counter, iteration_coordinate, sqlite3.Binary(telemetry_blob))
+
+        self._row_ids[record_type] += 1
+        row_id = self._row_ids[record_type]
+
+        buffer = self._buffer
+        buffer[record_type + '_iterations'].append((row_id,) + values)
+        buffer['global_iterations'].append((record_type, row_id))
+        if telemetry is not None:
+            buffer['solver_telemetry'].append(telemetry)
+        self._buffer_count += 1
+
+        interval = self.options['flush_interval']
+        if self._buffer_count >= self.options['buffer_size'] or \
+                (interval > 0 and time.time() - self._last_flush >= interval):
+            self._flush()
+
+    def _flush(self):
+        """
+        Write the buffered records to the database in a single transaction.
+        """
+        if self._buffer_count:
+            if not self._wal and self.options['buffer_size'] > 1:
+                # Only the commits of the buffered transactions are synced to disk.
+                self.cursor.execute("PRAGMA journal_mode=WAL")
+                self.cursor.execute("PRAGMA synchronous=NORMAL")
+                self._wal = True
+
+            self.cursor.execute("BEGIN")
+            for table, rows in iteritems(self._buffer):
+                if rows:
+                    self.cursor.executemany(_insert_sql[table], rows)
+                    del rows[:]
+            self.cursor.execute("COMMIT")
+            self._buffer_count = 0
+
+        self._last_flush = time.time()
+
     def record_iteration(self, object_requesting_recording, metadata, **kwargs):
         """
         Store the provided data in the sqlite file using the iteration coordinate for the key.
@@ -228,23 +338,13 @@ class SqliteRecorder(BaseRecorder):
                     constraints_array[name] = value
 
         print(desvars_array)
-        desvars_blob = array_to_blob(desvars_array)
-        responses_blob = array_to_blob(responses_array)
-        objectives_blob = array_to_blob(objectives_array)
-        constraints_blob = array_to_blob(constraints_array)
 
         iteration_coordinate = get_formatted_iteration_coordinate()
 
-        self.cursor.execute("INSERT INTO driver_iterations(counter, iteration_coordinate, "
-                            "timestamp, success, msg, desvars , responses , objectives , "
-                            "constraints ) VALUES(?,?,?,?,?,?,?,?,?)",
-                            (self._counter, iteration_coordinate,
-                             metadata['timestamp'], metadata['success'],
-                             metadata['msg'], desvars_blob,
-                             responses_blob, objectives_blob,
-                             constraints_blob))
-        self.con.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
-                         ('driver', self.cursor.lastrowid))
+        self._submit(self._write_iteration, 'driver',
+                     (self._counter, iteration_coordinate,
+                      metadata['timestamp'], metadata['success'], metadata['msg']),
+                     (desvars_array, responses_array, objectives_array, constraints_array))
 
     def record_iteration_system(self, object_requesting_recording, metadata):
         """
@@ -342,21 +442,12 @@ class SqliteRecorder(BaseRecorder):
                 for name, value in iteritems(resids):
                     residuals_array[name] = value
 
-        inputs_blob = array_to_blob(inputs_array)
-        outputs_blob = array_to_blob(outputs_array)
-        residuals_blob = array_to_blob(residuals_array)
-
         iteration_coordinate = get_formatted_iteration_coordinate()
 
-        self.cursor.execute("INSERT INTO system_iterations(counter, iteration_coordinate, "
-                            "timestamp, success, msg, inputs , outputs , residuals ) "
-                            "VALUES(?,?,?,?,?,?,?,?)",
-                            (self._counter, iteration_coordinate,
-                             metadata['timestamp'], metadata['success'],
-                             metadata['msg'], inputs_blob,
-                             outputs_blob, residuals_blob))
-        self.cursor.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
-                            ('system', self.cursor.lastrowid))
+        self._submit(self._write_iteration, 'system',
+                     (self._counter, iteration_coordinate,
+                      metadata['timestamp'], metadata['success'], metadata['msg']),
+                     (inputs_array, outputs_array, residuals_array))
 
     def record_iteration_solver(self, object_requesting_recording, metadata, **kwargs):
         """
@@ -374,6 +465,8 @@ class SqliteRecorder(BaseRecorder):
         relative : float
             The relative error of the Solver requesting recording. It is not cached in
             the Solver object, so we pass it in here.
+        telemetry : dict
+            Timing and iteration statistics of the Solver requesting recording.
         """
         outputs_array = residuals_array = None
 
@@ -437,22 +530,19 @@ class SqliteRecorder(BaseRecorder):
                 for name, value in iteritems(res):
                     residuals_array[name] = value
 
-        outputs_blob = array_to_blob(outputs_array)
-        residuals_blob = array_to_blob(residuals_array)
-
         iteration_coordinate = get_formatted_iteration_coordinate()
 
-        self.cursor.execute("INSERT INTO solver_iterations(counter, iteration_coordinate, "
-                            "timestamp, success, msg, abs_err, rel_err, solver_output, "
-                            "solver_residuals) VALUES(?,?,?,?,?,?,?,?,?)",
-                            (self._counter, iteration_coordinate,
-                             metadata['timestamp'],
-                             metadata['success'], metadata['msg'],
-                             abs_error, rel_error,
-                             outputs_blob, residuals_blob))
+        telemetry = kwargs.get('telemetry')
+        if self.options['record_solver_telemetry'] and telemetry is not None:
+            telemetry = (self._counter, iteration_coordinate, telemetry)
+        else:
+            telemetry = None
 
-        self.cursor.execute("INSERT INTO global_iterations(record_type, rowid) VALUES(?,?)",
-                            ('solver', self.cursor.lastrowid))
+        self._submit(self._write_iteration, 'solver',
+                     (self._counter, iteration_coordinate,
+                      metadata['timestamp'], metadata['success'], metadata['msg'],
+                      abs_error, rel_error),
+                     (outputs_array, residuals_array), telemetry)
 
     def record_metadata(self, object_requesting_recording):
         """
@@ -484,8 +574,8 @@ class SqliteRecorder(BaseRecorder):
         model_viewer_data = pickle.dumps(object_requesting_recording._model_viewer_data,
                                          pickle.HIGHEST_PROTOCOL)
 
-        self.con.execute("INSERT INTO driver_metadata(id, model_viewer_data) "
-                         "VALUES(?,?)", (driver_class, sqlite3.Binary(model_viewer_data)))
+        self._submit(self.con.execute, "INSERT INTO driver_metadata(id, model_viewer_data) "
+                     "VALUES(?,?)", (driver_class, sqlite3.Binary(model_viewer_data)))
 
     def record_metadata_system(self, object_requesting_recording):
         """
@@ -502,8 +592,9 @@ class SqliteRecorder(BaseRecorder):
         path = object_requesting_recording.pathname
         if not path:
             path = 'root'
-        self.con.execute("INSERT INTO system_metadata(id, scaling_factors) VALUES(?,?)",
-                         (path, sqlite3.Binary(scaling_factors)))
+        self._submit(self.con.execute,
+                     "INSERT INTO system_metadata(id, scaling_factors) VALUES(?,?)",
+                     (path, sqlite3.Binary(scaling_factors)))
 
     def record_metadata_solver(self, object_requesting_recording):
         """
@@ -522,12 +613,17 @@ class SqliteRecorder(BaseRecorder):
 
         solver_options = pickle.dumps(object_requesting_recording.options,
                                       pickle.HIGHEST_PROTOCOL)
-        self.con.execute(
-            "INSERT INTO solver_metadata(id, solver_options, solver_class) "
-            "VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
+        self._submit(self.con.execute,
+                     "INSERT INTO solver_metadata(id, solver_options, solver_class) "
+                     "VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
 
     def close(self):
         """
-        Close `out`.
+        Write any queued and buffered records and close `out`.
         """
-        self.con.close()
+        try:
+            self._stop_writer()
+            if self._buffer_count:
+                self._flush()
+        finally:
+            self.con.close()
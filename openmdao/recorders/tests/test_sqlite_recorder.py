@@ -20,6 +20,7 @@ from openmdao.devtools.testutil import assert_rel_error
 from openmdao.utils.record_util import format_iteration_coordinate
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 from openmdao.recorders.sqlite_recorder import format_version, blob_to_array
+from openmdao.recorders.recording_iteration_stack import recording_iteration_stack
 from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
     SellarDis2withDerivatives
 from openmdao.test_suite.components.paraboloid import Paraboloid
@@ -867,6 +868,37 @@ class TestSqliteRecorder(unittest.TestCase):
                                                  expected_rel_error, expected_solver_output,
                                                  expected_solver_residuals),), self.eps)
 
+    def test_record_solver_telemetry(self):
+        self.setup_sellar_model()
+
+        self.prob.model.nonlinear_solver = NewtonSolver()
+        self.prob.model.nonlinear_solver.add_recorder(self.recorder)
+        self.recorder.options['record_solver_telemetry'] = True
+
+        self.prob.setup(check=False)
+
+        run_driver(self.prob)
+
+        self.prob.cleanup()
+
+        con = sqlite3.connect(self.filename)
+        cur = con.cursor()
+        cur.execute("SELECT iteration_coordinate, telemetry FROM solver_telemetry")
+        rows = cur.fetchall()
+        cur.execute("SELECT iteration_coordinate FROM solver_iterations")
+        coordinates = [row[0] for row in cur.fetchall()]
+        con.close()
+
+        # one record per recorded iteration, matching the solver iterations
+        self.assertEqual([row[0] for row in rows], coordinates)
+
+        # each record holds the statistics of the solve in progress, up to the previous iteration
+        telemetry = [pickle.loads(row[1]) for row in rows]
+        self.assertEqual([len(t['linear_iterations']) for t in telemetry],
+                         list(range(len(rows))))
+        telemetry = telemetry[-1]
+        self.assertGreater(telemetry['phase_times']['linear_solve'], 0.0)
+
     def test_record_solver_nonlinear_nonlinear_run_once(self):
         self.setup_sellar_model()
 
@@ -1355,5 +1387,126 @@ class TestSqliteRecorder(unittest.TestCase):
                                                  expected_outputs, expected_residuals),), self.eps)
 
 
+class TestSqliteRecorderBuffered(unittest.TestCase):
+    def setUp(self):
+        # recording is disabled while entries of failed derivative computations are left here
+        recording_iteration_stack.reset()
+
+        self.dir = mkdtemp()
+        self.filename = os.path.join(self.dir, "sqlite_test")
+
+    def tearDown(self):
+        try:
+            rmtree(self.dir)
+        except OSError as e:
+            # If directory already deleted, keep going
+            if e.errno not in (errno.ENOENT, errno.EACCES, errno.EPERM):
+                raise e
+
+    def fetch(self, query):
+        con = sqlite3.connect(self.filename)
+        cur = con.cursor()
+        cur.execute(query)
+        rows = cur.fetchall()
+        con.close()
+        return rows
+
+    def test_buffered_solver_recording(self):
+        from openmdao.test_suite.components.sellar import SellarDerivatives
+
+        recorder = SqliteRecorder(self.filename)
+        recorder.options['buffer_size'] = 4
+        recorder.options['record_solver_telemetry'] = True
+
+        newton = NewtonSolver()
+        newton.add_recorder(recorder)
+
+        prob = Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                               linear_solver=DirectSolver()))
+        prob.model.add_recorder(recorder)
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        self.assertEqual(self.fetch("PRAGMA journal_mode")[0][0], 'wal')
+
+        # only full buffers have been written so far
+        num_records = recorder._counter
+        self.assertGreater(num_records, 4)
+        written = self.fetch("SELECT COUNT(rowid) FROM global_iterations")[0][0]
+        self.assertEqual(written, num_records - num_records % 4)
+
+        # the rest is written when the problem is cleaned up
+        prob.cleanup()
+
+        rows = self.fetch("SELECT id, record_type, rowid FROM global_iterations")
+        self.assertEqual(len(rows), num_records)
+
+        solver_ids = self.fetch("SELECT id, counter FROM solver_iterations")
+        system_ids = self.fetch("SELECT id, counter FROM system_iterations")
+        self.assertEqual(len(solver_ids) + len(system_ids), num_records)
+
+        # the global table refers to the rows of the iteration tables in recording order
+        counters = {'solver': dict(solver_ids), 'system': dict(system_ids)}
+        self.assertEqual([counters[record_type][rowid] for _, record_type, rowid in rows],
+                         list(range(1, num_records + 1)))
+
+        telemetry = self.fetch("SELECT counter FROM solver_telemetry")
+        self.assertEqual([row[0] for row in telemetry], [row[1] for row in solver_ids])
+
+    def run_sellar(self, recorder):
+        from openmdao.test_suite.components.sellar import SellarDerivatives
+
+        newton = NewtonSolver()
+        newton.add_recorder(recorder)
+
+        prob = Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                               linear_solver=DirectSolver()))
+        prob.model.add_recorder(recorder)
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+
+        for x in (1.0, 2.0, 3.0):
+            prob['x'] = x
+            prob.run_model()
+
+        prob.cleanup()
+
+    def test_asynchronous_recording(self):
+        query = "SELECT counter, iteration_coordinate, abs_err, rel_err, solver_output " \
+                "FROM solver_iterations"
+
+        recorder = SqliteRecorder(self.filename)
+        recorder.options['record_solver_output'] = True
+        self.run_sellar(recorder)
+        expected = self.fetch(query)
+        expected_system = self.fetch("SELECT counter, outputs FROM system_iterations")
+        expected_metadata = self.fetch("SELECT * FROM solver_metadata")
+
+        os.remove(self.filename)
+
+        recorder = SqliteRecorder(self.filename)
+        recorder.options['record_solver_output'] = True
+        recorder.options['asynchronous'] = True
+        recorder.options['queue_size'] = 2
+        self.run_sellar(recorder)
+
+        # the background thread has written the same records after the cleanup
+        self.assertIsNone(recorder._writer)
+        self.assertEqual(self.fetch(query), expected)
+        self.assertEqual(self.fetch("SELECT counter, outputs FROM system_iterations"),
+                         expected_system)
+        self.assertEqual(self.fetch("SELECT * FROM solver_metadata"), expected_metadata)
+
+    def test_asynchronous_error(self):
+        recorder = SqliteRecorder(self.filename)
+        recorder.options['asynchronous'] = True
+        recorder.con.close()
+
+        # errors of the background thread are raised when the recorder is closed
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.run_sellar(recorder)
+
+
 if __name__ == "__main__":
     unittest.main()
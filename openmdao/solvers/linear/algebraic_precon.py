@@ -0,0 +1,270 @@
+"""Define the AlgebraicPreconditioner class."""
+
+from __future__ import division, print_function
+
+import scipy.sparse
+import scipy.sparse.linalg
+
+from openmdao.solvers.solver import LinearSolver
+from openmdao.matrices.dense_matrix import DenseMatrix
+from openmdao.matrices.block_matrix import BlockMatrix
+from openmdao.recorders.recording_iteration_stack import Recording
+
+
+class AlgebraicPreconditioner(LinearSolver):
+    """
+    Preconditioner built directly from the assembled jacobian of the owning system.
+
+    Instead of running a recursive linear solve over the model, this approximates the inverse
+    of the jacobian with an incomplete LU factorization, sparse LU factorizations of the diagonal
+    blocks of the subsystems (block Jacobi or block Gauss-Seidel), or the inverse of the
+    diagonal. The approximation is refreshed whenever the system is linearized, and applying it
+    costs about as much as a sparse matrix-vector product. It is intended to be used as the
+    'precon' of an iterative linear solver such as ScipyIterativeSolver or PetscKSP.
+
+    Attributes
+    ----------
+    _ilu : SuperLU or None
+        Incomplete LU factorization, when method is 'ilu'.
+    _blocks : [(int, int, SuperLU), ...]
+        Range and sparse LU factorization of each diagonal block, when method is 'block_jacobi'.
+    _inv_diag : ndarray or None
+        Inverse of the diagonal of the jacobian, when method is 'diagonal'.
+    _block_mtx : <BlockMatrix> or None
+        Block matrix of the owning system, whose factored diagonal blocks are used by the block
+        methods when the system has a BlockJacobian.
+    """
+
+    SOLVER = 'LN: ALGEBRAIC'
+
+    def __init__(self, **kwargs):
+        """
+        Declare the solver option.
+
+        Parameters
+        ----------
+        **kwargs : {}
+            dictionary of options set by the instantiating class/script.
+        """
+        super(AlgebraicPreconditioner, self).__init__(**kwargs)
+
+        self._ilu = None
+        self._blocks = []
+        self._inv_diag = None
+        self._block_mtx = None
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('method', default='ilu',
+                             values=['ilu', 'block_jacobi', 'block_gs', 'diagonal'],
+                             desc='Approximation of the inverse jacobian: incomplete LU, LU of '
+                                  'the diagonal block of each subsystem, block Gauss-Seidel '
+                                  'sweeps over those blocks (requires a BlockJacobian), or the '
+                                  'inverse of the diagonal.')
+        self.options.declare('drop_tol', default=1e-4, lower=0.0,
+                             desc='Drop tolerance of the incomplete LU factorization.')
+        self.options.declare('fill_factor', default=10.0, lower=1.0,
+                             desc='Upper bound on the fill ratio of the incomplete LU '
+                                  'factorization.')
+
+        # A single block Gauss-Seidel sweep keeps the preconditioner a fixed linear operator.
+        self.options['maxiter'] = 1
+
+    def _linearize_children(self):
+        """
+        Return a flag that is True when we need to call linearize on our subsystems' solvers.
+
+        Returns
+        -------
+        boolean
+            Flag for indicating child linerization
+        """
+        return False
+
+    def _get_matrix(self):
+        """
+        Return the part of the assembled jacobian that belongs to the owning system.
+
+        Returns
+        -------
+        csc_matrix
+            Jacobian of the residuals of the owning system with respect to its outputs.
+        int
+            Offset of the owning system in the assembled jacobian.
+        """
+        system = self._system
+
+        if not (system._owns_assembled_jac or system._views_assembled_jac):
+            raise RuntimeError("The solver '%s' in system '%s' requires an assembled "
+                               "jacobian." % (self.SOLVER, system.pathname))
+
+        start, stop = system._jacobian._view_ranges[system.pathname][:2]
+        mtx = system._jacobian._int_mtx
+
+        matrix = mtx._matrix
+        size = stop - start
+
+        if isinstance(mtx, DenseMatrix):
+            return scipy.sparse.csc_matrix(matrix[start:stop, start:stop]), start
+
+        if scipy.sparse.isspmatrix_coo(matrix):
+            # COO can't be sliced, so only the entries of the owning system are converted.
+            rows, cols = matrix.row, matrix.col
+            mask = (rows >= start) & (rows < stop) & (cols >= start) & (cols < stop)
+            matrix = scipy.sparse.csc_matrix((matrix.data[mask],
+                                              (rows[mask] - start, cols[mask] - start)),
+                                             shape=(size, size))
+        elif matrix.shape != (size, size):
+            matrix = matrix[start:stop, start:stop]
+
+        # A CSC matrix is used as is, without a copy.
+        return matrix.tocsc(), start
+
+    def _get_block_matrix(self):
+        """
+        Return the block matrix of the owning system, if it owns a BlockJacobian.
+
+        Returns
+        -------
+        <BlockMatrix> or None
+            Block matrix whose diagonal blocks are the subsystems of the owning system.
+        """
+        system = self._system
+        if system._owns_assembled_jac and isinstance(system._jacobian._int_mtx, BlockMatrix):
+            return system._jacobian._int_mtx
+
+    def _linearize(self):
+        """
+        Perform factorization.
+        """
+        system = self._system
+        method = self.options['method']
+
+        self._ilu = None
+        self._blocks = []
+        self._inv_diag = None
+        self._block_mtx = None
+
+        if method in ('block_jacobi', 'block_gs'):
+            self._block_mtx = self._get_block_matrix()
+            if self._block_mtx is not None:
+                self._block_mtx._update_blocks()
+                return
+            elif method == 'block_gs':
+                raise RuntimeError("The method 'block_gs' of solver '%s' in system '%s' requires "
+                                   "a BlockJacobian." % (self.SOLVER, system.pathname))
+
+        matrix, start = self._get_matrix()
+
+        if method == 'ilu':
+            self._ilu = scipy.sparse.linalg.spilu(matrix,
+                                                  drop_tol=self.options['drop_tol'],
+                                                  fill_factor=self.options['fill_factor'])
+
+        elif method == 'block_jacobi':
+            view_ranges = system._jacobian._view_ranges
+            subsystems = system._subsystems_myproc or [system]
+
+            for subsys in subsystems:
+                block_start, block_stop = view_ranges[subsys.pathname][:2]
+                if block_stop > block_start:
+                    i1, i2 = block_start - start, block_stop - start
+                    try:
+                        lu = scipy.sparse.linalg.splu(matrix[i1:i2, i1:i2])
+                    except RuntimeError:
+                        raise RuntimeError("The diagonal block of subsystem '%s' is singular." %
+                                           subsys.pathname)
+                    self._blocks.append((i1, i2, lu))
+
+        else:
+            diag = matrix.diagonal()
+            diag[diag == 0.0] = 1.0
+            self._inv_diag = 1.0 / diag
+
+    def _apply(self, b_data, mode):
+        """
+        Multiply a vector by the approximate inverse of the jacobian.
+
+        Parameters
+        ----------
+        b_data : ndarray
+            Vector to multiply.
+        mode : str
+            'fwd' or 'rev'; the transposed jacobian is used in 'rev' mode.
+
+        Returns
+        -------
+        ndarray
+            The product.
+        """
+        method = self.options['method']
+
+        if method == 'ilu':
+            return self._ilu.solve(b_data, 'N' if mode == 'fwd' else 'T')
+
+        elif self._block_mtx is not None:
+            if method == 'block_gs':
+                options = self.options
+                return self._block_mtx._block_gs_solve(b_data, mode, maxiter=options['maxiter'],
+                                                       atol=options['atol'],
+                                                       rtol=options['rtol'])[0]
+            return self._block_mtx._block_jacobi_solve(b_data, mode)
+
+        elif method == 'block_jacobi':
+            # Entries outside of the subsystem blocks are passed through unchanged.
+            x_data = b_data.copy()
+            trans = 'N' if mode == 'fwd' else 'T'
+            for i1, i2, lu in self._blocks:
+                x_data[i1:i2] = lu.solve(b_data[i1:i2], trans=trans)
+            return x_data
+
+        return b_data * self._inv_diag
+
+    def _solve(self, vec_names, mode):
+        """
+        Run the solver.
+
+        Parameters
+        ----------
+        vec_names : [str, ...]
+            list of names of the right-hand-side vectors.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        boolean
+            Failure flag; True if failed to converge, False is successful.
+        float
+            absolute error.
+        float
+            relative error.
+        """
+        self._vec_names = vec_names
+        self._mode = mode
+
+        system = self._system
+
+        with Recording('AlgebraicPreconditioner', 0, self) as rec:
+            for vec_name in self._vec_names:
+                self._vec_name = vec_name
+                d_residuals = system._vectors['residual'][vec_name]
+                d_outputs = system._vectors['output'][vec_name]
+
+                if mode == 'fwd':
+                    x_vec = d_outputs
+                    b_vec = d_residuals
+                else:
+                    x_vec = d_residuals
+                    b_vec = d_outputs
+
+                # AssembledJacobians are unscaled.
+                with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+                    x_vec.set_data(self._apply(b_vec.get_data(), mode))
+
+                rec.abs = 0.0
+                rec.rel = 0.0
+
+        return False, 0., 0.
@@ -114,7 +114,7 @@ class DirectSolver(LinearSolver):
         # put new value in out_vec
         b_vec.get_data(out_vec)
 
-    def solve(self, vec_names, mode):
+    def _solve(self, vec_names, mode):
         """
         Run the solver.
 
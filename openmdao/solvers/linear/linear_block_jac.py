@@ -1,5 +1,6 @@
 """Define the LinearBlockJac class."""
 from openmdao.solvers.solver import BlockLinearSolver
+from openmdao.utils.thread_utils import run_threaded, get_num_threads
 
 
 class LinearBlockJac(BlockLinearSolver):
@@ -9,6 +10,16 @@ class LinearBlockJac(BlockLinearSolver):
 
     SOLVER = 'LN: LNBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('num_threads', type_=int, default=1, lower=1,
+                             desc='Number of threads used to apply and solve the subsystems '
+                                  'concurrently. This only pays off if the subsystems spend most '
+                                  'of their time in code that releases the GIL, such as numpy or '
+                                  'external codes.')
+
     def _iter_execute(self):
         """
         Perform the operations in the iteration loop.
@@ -16,28 +27,35 @@ class LinearBlockJac(BlockLinearSolver):
         system = self._system
         mode = self._mode
         vec_names = self._vec_names
+        num_threads = get_num_threads(system, self.options['num_threads'])
+        subsystems = system._subsystems_myproc
+        prefix = self._solver_info.prefix
+
+        def apply_linear(subsys):
+            scope_out, scope_in = system._get_scope(subsys)
+            subsys._apply_linear(vec_names, mode, scope_out, scope_in)
+
+        def solve_linear(subsys):
+            subsys._solve_linear(vec_names, mode)
 
         if mode == 'fwd':
             for vec_name in vec_names:
                 system._transfer(vec_name, mode)
-            for subsys in system._subsystems_myproc:
-                scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(vec_names, mode, scope_out, scope_in)
+            run_threaded(apply_linear, subsystems, num_threads)
             for vec_name in vec_names:
                 b_vec = system._vectors['residual'][vec_name]
                 b_vec *= -1.0
                 b_vec += self._rhs_vecs[vec_name]
-            for subsys in system._subsystems_myproc:
-                subsys._solve_linear(vec_names, mode)
+            run_threaded(solve_linear, subsystems, num_threads)
         elif mode == 'rev':
-            for subsys in system._subsystems_myproc:
-                scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(vec_names, mode, scope_out, scope_in)
+            run_threaded(apply_linear, subsystems, num_threads)
             for vec_name in vec_names:
                 system._transfer(vec_name, mode)
 
                 b_vec = system._vectors['output'][vec_name]
                 b_vec *= -1.0
                 b_vec += self._rhs_vecs[vec_name]
-            for subsys in system._subsystems_myproc:
-                subsys._solve_linear(vec_names, mode)
+            run_threaded(solve_linear, subsystems, num_threads)
+
+        # Concurrent subsystem solves may leave the shared prefix in any state.
+        self._solver_info.prefix = prefix
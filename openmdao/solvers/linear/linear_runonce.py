@@ -12,7 +12,7 @@ class LinearRunOnce(LinearBlockGS):
 
     SOLVER = 'LN: RUNONCE'
 
-    def solve(self, vec_names, mode):
+    def _solve(self, vec_names, mode):
         """
         Run the solver.
 
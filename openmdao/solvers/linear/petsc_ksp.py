@@ -318,7 +318,7 @@ class PetscKSP(LinearSolver):
         if self.precon is not None:
             self.precon._linearize()
 
-    def solve(self, vec_names, mode):
+    def _solve(self, vec_names, mode):
         """
         Solve the linear system for the problem in self._system.
 
@@ -348,7 +348,7 @@ class PetscKSP(LinearSolver):
 
         maxiter = options['maxiter']
         atol = options['atol']
-        rtol = options['rtol']
+        rtol = self._get_rtol()
 
         for vec_name in self._vec_names:
             self._vec_name = vec_name
@@ -3,7 +3,7 @@
 from __future__ import division, print_function
 
 import numpy as np
-from scipy.sparse.linalg import LinearOperator, gmres
+from scipy.sparse.linalg import LinearOperator, gmres, gcrotmk
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.utils.general_utils import warn_deprecation
@@ -18,6 +18,10 @@ class ScipyIterativeSolver(LinearSolver):
     ----------
     precon : Solver
         Preconditioner for linear solve. Default is None for no preconditioner.
+    _prev_solutions : dict
+        Solution of the previous solve for each (vec_name, mode), used as the next initial guess.
+    _recycle_spaces : dict
+        Recycled Krylov subspace for each (vec_name, mode), valid until the next linearization.
     """
 
     SOLVER = 'LN: SCIPY'
@@ -36,6 +40,9 @@ class ScipyIterativeSolver(LinearSolver):
         # initialize preconditioner to None
         self.precon = None
 
+        self._prev_solutions = {}
+        self._recycle_spaces = {}
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -47,6 +54,19 @@ class ScipyIterativeSolver(LinearSolver):
                              desc='Number of iterations between restarts. Larger values increase '
                                   'iteration cost, but may be necessary for convergence')
 
+        self.options.declare('warm_start', type_=bool, default=False,
+                             desc='Set to True to use the solution of the previous solve as the '
+                                  'initial guess, which helps when consecutive right-hand sides '
+                                  'are closely related.')
+
+        self.options.declare('recycle', type_=bool, default=False,
+                             desc='Set to True to solve with GCROT(m,k) (scipy gcrotmk) and carry '
+                                  'its Krylov subspace over to subsequent solves until the next '
+                                  'linearization. The solver option is ignored in this case.')
+
+        self.options.declare('recycle_size', default=10, type_=int, lower=1,
+                             desc='Number of vectors kept in the recycled Krylov subspace.')
+
         # changing the default maxiter from the base class
         self.options['maxiter'] = 1000
         self.options['atol'] = 1.0e-12
@@ -64,6 +84,9 @@ class ScipyIterativeSolver(LinearSolver):
         """
         super(ScipyIterativeSolver, self)._setup_solvers(system, depth)
 
+        self._prev_solutions = {}
+        self._recycle_spaces = {}
+
         if self.precon is not None:
             self.precon._setup_solvers(self._system, self._depth + 1)
 
@@ -101,6 +124,9 @@ class ScipyIterativeSolver(LinearSolver):
         """
         Perform any required linearization operations such as matrix factorization.
         """
+        # The recycled subspaces hold products with the old operator.
+        self._recycle_spaces = {}
+
         if self.precon is not None:
             self.precon._linearize()
 
@@ -145,7 +171,17 @@ class ScipyIterativeSolver(LinearSolver):
         res : ndarray
             the current residual vector.
         """
-        norm = np.linalg.norm(res)
+        self._monitor_norm(np.linalg.norm(res))
+
+    def _monitor_norm(self, norm):
+        """
+        Record and print the residual norm and iteration number.
+
+        Parameters
+        ----------
+        norm : float
+            the current residual norm.
+        """
         with Recording('ScipyIterativeSolver', self._iter_count, self):
             if self._iter_count == 0:
                 if norm != 0.0:
@@ -156,7 +192,7 @@ class ScipyIterativeSolver(LinearSolver):
         self._mpi_print(self._iter_count, norm, norm / self._norm0)
         self._iter_count += 1
 
-    def solve(self, vec_names, mode):
+    def _solve(self, vec_names, mode):
         """
         Run the solver.
 
@@ -184,9 +220,12 @@ class ScipyIterativeSolver(LinearSolver):
 
         maxiter = self.options['maxiter']
         atol = self.options['atol']
-        rtol = self.options['rtol']
         restart = self.options['restart']
 
+        # A forcing term is relative to the zero initial guess that comes with it.
+        warm_start = self.options['warm_start'] and self._forcing_term is None
+        recycle = self.options['recycle']
+
         for vec_name in self._vec_names:
             self._vec_name = vec_name
 
@@ -197,8 +236,14 @@ class ScipyIterativeSolver(LinearSolver):
                 x_vec = system._vectors['residual'][vec_name]
                 b_vec = system._vectors['output'][vec_name]
 
+            key = (vec_name, mode)
             x_vec_combined = x_vec.get_data()
             size = x_vec_combined.size
+
+            # Only start from the previous solution if the caller has not supplied a guess.
+            prev = self._prev_solutions.get(key) if warm_start else None
+            if prev is not None and prev.size == size and not x_vec_combined.any():
+                x_vec_combined = prev.copy()
             linop = LinearOperator((size, size), dtype=float,
                                    matvec=self._mat_vec)
 
@@ -210,11 +255,45 @@ class ScipyIterativeSolver(LinearSolver):
             else:
                 M = None
 
+            b = b_vec.get_data()
+            b_norm = 1.0
+            tol = atol
+
+            if self._forcing_term is not None:
+                # Scipy checks the initial residual against tol in absolute terms but later ones
+                # relative to the right-hand side, so solve for a unit right-hand side to make
+                # both checks relative to it, as the forcing term of a NewtonSolver requires.
+                norm = np.linalg.norm(b)
+                if norm > 0.0:
+                    b_norm = norm
+                    b /= b_norm
+                    x_vec_combined /= b_norm
+                    tol = max(self._forcing_term, atol / b_norm)
+
             self._iter_count = 0
-            x_vec.set_data(
-                solver(linop, b_vec.get_data(), M=M, restart=restart,
-                       x0=x_vec_combined, maxiter=maxiter, tol=atol,
-                       callback=self._monitor)[0])
+            if recycle:
+                def monitor(x):
+                    # gcrotmk passes the current solution rather than the residual.
+                    if self.options['iprint'] == 2:
+                        self._monitor_norm(np.linalg.norm(b - self._mat_vec(x)))
+                    else:
+                        self._monitor_norm(0.0)
+
+                # Once the subspace is full, gcrotmk keeps the newest recycle_size vectors. The
+                # products with them are recomputed at the start of each solve, since the ones
+                # that gcrotmk updates as it truncates the subspace lose accuracy.
+                CU = self._recycle_spaces.setdefault(key, [])
+                x = gcrotmk(linop, b, M=M, m=restart, k=self.options['recycle_size'], CU=CU,
+                            discard_C=True, x0=x_vec_combined, maxiter=maxiter, tol=tol,
+                            callback=monitor)[0] * b_norm
+            else:
+                x = solver(linop, b, M=M, restart=restart,
+                           x0=x_vec_combined, maxiter=maxiter, tol=tol,
+                           callback=self._monitor)[0] * b_norm
+
+            if warm_start:
+                self._prev_solutions[key] = x.copy()
+            x_vec.set_data(x)
 
         # TODO: implement this properly
 
@@ -0,0 +1,182 @@
+"""Test the AlgebraicPreconditioner class."""
+
+from __future__ import division, print_function
+
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, IndepVarComp, ExecComp, LinearSystemComp, \
+     ScipyIterativeSolver, AlgebraicPreconditioner, CSCJacobian, DenseJacobian, COOJacobian, \
+     BlockJacobian
+from openmdao.devtools.testutil import assert_rel_error
+
+
+def _linear_system_problem(precon, jacobian=CSCJacobian, mode='fwd', n=20):
+    """Return a setup LinearSystemComp model with a poorly conditioned matrix, and the matrix."""
+    np.random.seed(11)
+    A = np.diag(np.logspace(-2, 0, n)) + 0.1 * np.random.rand(n, n) / n
+
+    prob = Problem()
+    model = prob.model
+    model.add_subsystem('p1', IndepVarComp('A', A))
+    model.add_subsystem('p2', IndepVarComp('b', np.random.rand(n)))
+    model.add_subsystem('lin', LinearSystemComp(size=n))
+    model.connect('p1.A', 'lin.A')
+    model.connect('p2.b', 'lin.b')
+
+    model.jacobian = jacobian()
+    model.linear_solver = solver = ScipyIterativeSolver()
+    solver.precon = precon
+
+    # count the operator products
+    solver.num_mat_vec = 0
+    mat_vec = solver._mat_vec
+
+    def counting_mat_vec(in_vec):
+        solver.num_mat_vec += 1
+        return mat_vec(in_vec)
+
+    solver._mat_vec = counting_mat_vec
+
+    prob.setup(check=False, mode=mode)
+    prob.set_solver_print(level=0)
+    prob.run_model()
+
+    return prob, A
+
+
+class TestAlgebraicPreconditioner(unittest.TestCase):
+
+    def test_methods(self):
+        """Each method gives the right derivatives with fewer products than no preconditioner."""
+        counts = {}
+        for mode in ('fwd', 'rev'):
+            for method in (None, 'ilu', 'block_jacobi', 'diagonal'):
+                precon = None if method is None else AlgebraicPreconditioner(method=method)
+                prob, A = _linear_system_problem(precon, mode=mode)
+                solver = prob.model.linear_solver
+                solver.num_mat_vec = 0
+
+                J = prob.compute_total_derivs(of=['lin.x'], wrt=['p2.b'])
+
+                assert_rel_error(self, J['lin.x', 'p2.b'], np.linalg.inv(A), 1e-8)
+                counts[mode, method] = solver.num_mat_vec
+
+            # The block of the LinearSystemComp is the whole coupled part of the jacobian, so
+            # block Jacobi and an ILU with a small drop tolerance are nearly exact inverses.
+            self.assertLess(counts[mode, 'ilu'], 0.25 * counts[mode, None])
+            self.assertLess(counts[mode, 'block_jacobi'], 0.25 * counts[mode, None])
+            self.assertLess(counts[mode, 'diagonal'], counts[mode, None])
+
+    def test_matrix_types(self):
+        for jacobian in (DenseJacobian, COOJacobian):
+            prob, A = _linear_system_problem(AlgebraicPreconditioner(), jacobian=jacobian)
+
+            J = prob.compute_total_derivs(of=['lin.x'], wrt=['p2.b'])
+
+            assert_rel_error(self, J['lin.x', 'p2.b'], np.linalg.inv(A), 1e-8)
+
+    def test_csc_matrix_not_copied(self):
+        prob, A = _linear_system_problem(AlgebraicPreconditioner())
+        precon = prob.model.linear_solver.precon
+
+        matrix, start = precon._get_matrix()
+        self.assertIs(matrix, prob.model._jacobian._int_mtx._matrix)
+        self.assertEqual(start, 0)
+
+    def test_relinearize(self):
+        """The factorization is refreshed when the jacobian changes."""
+        prob, A = _linear_system_problem(AlgebraicPreconditioner(method='block_jacobi'))
+        precon = prob.model.linear_solver.precon
+
+        prob['p1.A'] = 2.0 * A
+        prob.run_model()
+        J = prob.compute_total_derivs(of=['lin.x'], wrt=['p2.b'])
+
+        assert_rel_error(self, J['lin.x', 'p2.b'], np.linalg.inv(2.0 * A), 1e-8)
+        i1, i2, lu = precon._blocks[-1]
+        assert_rel_error(self, np.abs(lu.U.diagonal()).prod(),
+                         np.abs(np.linalg.det(2.0 * A)), 1e-6)
+
+    def test_block_jacobian(self):
+        """The block methods use the factored diagonal blocks of a BlockJacobian."""
+        for mode in ('fwd', 'rev'):
+            for method in ('block_jacobi', 'block_gs'):
+                precon = AlgebraicPreconditioner(method=method)
+                prob, A = _linear_system_problem(precon, jacobian=BlockJacobian, mode=mode)
+
+                J = prob.compute_total_derivs(of=['lin.x'], wrt=['p2.b'])
+
+                assert_rel_error(self, J['lin.x', 'p2.b'], np.linalg.inv(A), 1e-8)
+                self.assertIs(precon._block_mtx, prob.model._jacobian._int_mtx)
+                self.assertEqual(precon._blocks, [])
+
+    def test_block_gs_requires_block_jacobian(self):
+        prob, A = _linear_system_problem(AlgebraicPreconditioner(method='block_gs'))
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_total_derivs(of=['lin.x'], wrt=['p2.b'])
+
+        self.assertEqual(str(cm.exception),
+                         "The method 'block_gs' of solver 'LN: ALGEBRAIC' in system '' requires "
+                         "a BlockJacobian.")
+
+    def test_no_assembled_jacobian(self):
+        prob = Problem()
+        model = prob.model
+        model.add_subsystem('p', IndepVarComp('x', 1.0))
+        model.add_subsystem('c', ExecComp('y = 2.0 * x'))
+        model.connect('p.x', 'c.x')
+        model.linear_solver = ScipyIterativeSolver()
+        model.linear_solver.precon = AlgebraicPreconditioner()
+
+        prob.setup(check=False)
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_total_derivs(of=['c.y'], wrt=['p.x'])
+
+        self.assertEqual(str(cm.exception),
+                         "The solver 'LN: ALGEBRAIC' in system '' requires an assembled "
+                         "jacobian.")
+
+
+class TestAlgebraicPreconditionerFeature(unittest.TestCase):
+
+    def test_specify_precon(self):
+        from openmdao.api import Problem, Group, IndepVarComp, ExecComp, NewtonSolver, \
+             ScipyIterativeSolver, AlgebraicPreconditioner, CSCJacobian
+        from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
+             SellarDis2withDerivatives
+
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.add_subsystem('obj_cmp', ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+
+        model.add_subsystem('con_cmp1', ExecComp('con1 = 3.16 - y1'), promotes=['con1', 'y1'])
+        model.add_subsystem('con_cmp2', ExecComp('con2 = y2 - 24.0'), promotes=['con2', 'y2'])
+
+        model.jacobian = CSCJacobian()
+        model.nonlinear_solver = NewtonSolver()
+        model.linear_solver = ScipyIterativeSolver()
+        model.linear_solver.precon = AlgebraicPreconditioner(method='ilu')
+
+        prob.setup()
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -45,6 +45,34 @@ class TestLinearBlockJacSolver(LinearSolverTests.LinearSolverTestCase):
                              "A block linear solver 'LN: LNBJ' is being used with"
                              " an AssembledJacobian in system ''")
 
+    def test_num_threads(self):
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.add_subsystem('obj_cmp', ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+
+        model.nonlinear_solver = NonlinearBlockGS()
+        model.linear_solver = LinearBlockJac(num_threads=3, maxiter=50)
+
+        for mode in ('fwd', 'rev'):
+            prob.setup(check=False, mode=mode)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            J = prob.compute_total_derivs(of=['obj', 'y1'], wrt=['x', 'z'],
+                                          return_format='flat_dict')
+            assert_rel_error(self, J['obj', 'z'][0][0], 9.61001056, .00001)
+            assert_rel_error(self, J['obj', 'z'][0][1], 1.78448534, .00001)
+            assert_rel_error(self, J['obj', 'x'][0][0], 2.98061391, .00001)
+
 
 class TestBJacSolverFeature(unittest.TestCase):
 
@@ -7,7 +7,8 @@ import warnings
 
 import numpy as np
 
-from openmdao.api import Group, IndepVarComp, Problem, ExecComp, NonlinearBlockGS
+from openmdao.api import Group, IndepVarComp, Problem, ExecComp, NonlinearBlockGS, \
+     LinearSystemComp
 from openmdao.devtools.testutil import assert_rel_error
 from openmdao.solvers.linear.linear_block_gs import LinearBlockGS
 from openmdao.solvers.linear.scipy_iter_solver import ScipyIterativeSolver, gmres
@@ -18,6 +19,40 @@ from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, Sel
 from openmdao.test_suite.groups.implicit_group import TestImplicitGroup
 
 
+def _ill_conditioned_problem(linear_solver, n=30):
+    """Return a LinearSystemComp model with a few small eigenvalues, and its matrix."""
+    np.random.seed(11)
+    lam = np.linspace(1.0, 2.0, n)
+    lam[:5] = [0.02, 0.04, 0.06, 0.08, 0.1]
+    Q = np.linalg.qr(np.random.rand(n, n))[0]
+    A = Q.dot(np.diag(lam)).dot(Q.T) + 0.05 * np.random.rand(n, n) / np.sqrt(n)
+
+    prob = Problem()
+    model = prob.model
+    model.add_subsystem('p1', IndepVarComp('A', A))
+    model.add_subsystem('p2', IndepVarComp('b', np.random.rand(n)))
+    model.add_subsystem('lin', LinearSystemComp(size=n))
+    model.connect('p1.A', 'lin.A')
+    model.connect('p2.b', 'lin.b')
+    model.linear_solver = linear_solver
+
+    # count the operator products
+    linear_solver.num_mat_vec = 0
+    mat_vec = linear_solver._mat_vec
+
+    def counting_mat_vec(in_vec):
+        linear_solver.num_mat_vec += 1
+        return mat_vec(in_vec)
+
+    linear_solver._mat_vec = counting_mat_vec
+
+    prob.setup(check=False)
+    prob.set_solver_print(level=0)
+    prob.run_model()
+
+    return prob, A
+
+
 class TestScipyIterativeSolver(LinearSolverTests.LinearSolverTestCase):
 
     linear_solver_class = ScipyIterativeSolver
@@ -124,6 +159,94 @@ class TestScipyIterativeSolver(LinearSolverTests.LinearSolverTestCase):
         assert_rel_error(self, output[1], g1.expected_solution[0], 3e-15)
         assert_rel_error(self, output[5], g1.expected_solution[1], 3e-15)
 
+    def test_recycle(self):
+        """Recycling the Krylov subspace saves operator products over many right-hand sides."""
+        counts = {}
+        for recycle in (False, True):
+            prob, A = _ill_conditioned_problem(ScipyIterativeSolver(recycle=recycle))
+            solver = prob.model.linear_solver
+            solver.num_mat_vec = 0
+
+            J = prob.compute_total_derivs(of=['lin.x'], wrt=['p2.b'])
+
+            assert_rel_error(self, J['lin.x', 'p2.b'], np.linalg.inv(A), 1e-8)
+            counts[recycle] = solver.num_mat_vec
+
+        self.assertLess(counts[True], 0.75 * counts[False])
+
+        # The subspace is only valid for the operator it was built with.
+        self.assertTrue(len(solver._recycle_spaces) > 0)
+        prob.model._linearize()
+        self.assertEqual(solver._recycle_spaces, {})
+
+    def test_recycle_many_solves(self):
+        """The recycled subspace keeps saving operator products after it fills up."""
+        n = 30
+        counts = {}
+        for recycle in (False, True):
+            prob, A = _ill_conditioned_problem(ScipyIterativeSolver(recycle=recycle), n=n)
+            model = prob.model
+            solver = model.linear_solver
+            model.run_linearize()
+
+            d_inputs, d_outputs, d_residuals = model.get_linear_vectors()
+
+            counts[recycle] = []
+            sizes = []
+
+            # One solve for each row of the total derivatives of lin.x, as in rev mode.
+            for i in range(n):
+                d_outputs.set_const(0.0)
+                d_outputs['lin.x'][i] = 1.0
+                d_residuals.set_const(0.0)
+                solver.num_mat_vec = 0
+                model.run_solve_linear(['linear'], 'rev')
+                counts[recycle].append(solver.num_mat_vec)
+                sizes.append(len(solver._recycle_spaces.get(('linear', 'rev'), [])))
+
+                assert_rel_error(self, d_residuals['lin.x'], np.linalg.solve(A.T, np.eye(n)[i]),
+                                 1e-8)
+
+        # The subspace fills up after a few solves and then keeps its newest vectors, plus the
+        # last solution, and every later solve still benefits.
+        self.assertEqual(set(sizes[10:]), set([11]))
+        self.assertLess(max(counts[True]), min(counts[False]))
+
+    def test_warm_start(self):
+        """Repeating a solve starts from the previous solution and takes no iterations."""
+        prob, A = _ill_conditioned_problem(ScipyIterativeSolver(warm_start=True))
+        model = prob.model
+        solver = model.linear_solver
+        model.run_linearize()
+
+        d_inputs, d_outputs, d_residuals = model.get_linear_vectors()
+
+        solutions = []
+        counts = []
+        for i in range(2):
+            d_residuals.set_const(1.0)
+            d_outputs.set_const(0.0)
+            solver.num_mat_vec = 0
+            model.run_solve_linear(['linear'], 'fwd')
+            solutions.append(d_outputs.get_data())
+            counts.append(solver.num_mat_vec)
+
+        assert_rel_error(self, solutions[1], solutions[0], 1e-10)
+        self.assertGreater(counts[0], 10)
+        self.assertLessEqual(counts[1], 2)
+
+        # An initial guess set by the caller is not replaced.
+        d_residuals.set_const(1.0)
+        d_outputs.set_const(1.0)
+        solver.num_mat_vec = 0
+        model.run_solve_linear(['linear'], 'fwd')
+        assert_rel_error(self, d_outputs.get_data(), solutions[0], 1e-10)
+        self.assertGreater(solver.num_mat_vec, 10)
+
+        # Stored solutions do not survive a new setup.
+        prob.setup(check=False)
+        self.assertEqual(solver._prev_solutions, {})
+
     def test_preconditioner_deprecation(self):
 
         group = TestImplicitGroup(lnSolverClass=ScipyIterativeSolver)
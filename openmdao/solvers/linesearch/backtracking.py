@@ -40,6 +40,42 @@ def _print_violations(unknowns, lower, upper):
             print("  Lower:", lower._views_flat[name], '\n')
 
 
+def _take_bounded_step(u, du, alpha, system, options):
+    """
+    Add a step to the unknowns and enforce their bounds.
+
+    Parameters
+    ----------
+    u : <Vector>
+        Vector containing the unknowns.
+    du : <Vector>
+        Newton step; the backtracking is applied to this vector in-place.
+    alpha : float
+        step size.
+    system : <System>
+        The system that owns the unknowns and their bounds.
+    options : <OptionsDictionary>
+        Options of the line search.
+    """
+    lower = system._lower_bounds
+    upper = system._upper_bounds
+    bound_enforcement = options['bound_enforcement']
+
+    if not options['print_bound_enforce']:
+        u._add_scal_vec_bounded(alpha, du, lower, upper, bound_enforcement)
+        return
+
+    u.add_scal_vec(alpha, du)
+    _print_violations(u, lower, upper)
+
+    if bound_enforcement == 'vector':
+        u._enforce_bounds_vector(du, alpha, lower, upper)
+    elif bound_enforcement == 'scalar':
+        u._enforce_bounds_scalar(du, alpha, lower, upper)
+    elif bound_enforcement == 'wall':
+        u._enforce_bounds_wall(du, alpha, lower, upper)
+
+
 class BoundsEnforceLS(NonlinearSolver):
     """
     Bounds enforcement only.
@@ -109,17 +145,7 @@ class BoundsEnforceLS(NonlinearSolver):
         if norm0 == 0.0:
             norm0 = 1.0
 
-        u += du
-
-        if self.options['print_bound_enforce']:
-            _print_violations(u, system._lower_bounds, system._upper_bounds)
-
-        if self.options['bound_enforcement'] == 'vector':
-            u._enforce_bounds_vector(du, 1.0, system._lower_bounds, system._upper_bounds)
-        elif self.options['bound_enforcement'] == 'scalar':
-            u._enforce_bounds_scalar(du, 1.0, system._lower_bounds, system._upper_bounds)
-        elif self.options['bound_enforcement'] == 'wall':
-            u._enforce_bounds_wall(du, 1.0, system._lower_bounds, system._upper_bounds)
+        _take_bounded_step(u, du, 1.0, system, self.options)
 
         norm = self._iter_get_norm()
         self._mpi_print(self._iter_count, norm, norm / norm0)
@@ -179,17 +205,7 @@ class ArmijoGoldsteinLS(NonlinearSolver):
         if norm0 == 0.0:
             norm0 = 1.0
 
-        u.add_scal_vec(self.alpha, du)
-
-        if self.options['print_bound_enforce']:
-            _print_violations(u, system._lower_bounds, system._upper_bounds)
-
-        if self.options['bound_enforcement'] == 'vector':
-            u._enforce_bounds_vector(du, self.alpha, system._lower_bounds, system._upper_bounds)
-        elif self.options['bound_enforcement'] == 'scalar':
-            u._enforce_bounds_scalar(du, self.alpha, system._lower_bounds, system._upper_bounds)
-        elif self.options['bound_enforcement'] == 'wall':
-            u._enforce_bounds_wall(du, self.alpha, system._lower_bounds, system._upper_bounds)
+        _take_bounded_step(u, du, self.alpha, system, self.options)
 
         norm = self._iter_get_norm()
         return norm0, norm
@@ -240,11 +256,10 @@ class ArmijoGoldsteinLS(NonlinearSolver):
 
             self._solver_info.prefix = self._solver_info.prefix[:-3]
 
-            system._apply_nonlinear()
-
-        u.add_scal_vec(-self.alpha, du)
-        self.alpha *= self.options['rho']
-        u.add_scal_vec(self.alpha, du)
+        # Take back the part of the step that is removed by backtracking, in a single pass.
+        rho = self.options['rho']
+        u.add_scal_vec((rho - 1.0) * self.alpha, du)
+        self.alpha *= rho
 
     def _run_iterator(self):
         """
@@ -264,8 +279,11 @@ class ArmijoGoldsteinLS(NonlinearSolver):
         rtol = self.options['rtol']
         c = self.options['c']
 
+        telemetry = self._telemetry
+
         self._iter_count = 0
-        norm0, norm = self._iter_initialize()
+        with telemetry._phase('initialize'):
+            norm0, norm = self._iter_initialize()
         self._mpi_print(self._iter_count, norm, norm / norm0)
 
         # Further backtracking if needed.
@@ -274,9 +292,11 @@ class ArmijoGoldsteinLS(NonlinearSolver):
         # take us to zero, and our "runs" are the same, and we can just compare the
         # "rise".
         while self._iter_count < maxiter and (norm0 - norm) < c * self.alpha * norm0:
-            self._iter_execute()
+            with telemetry._phase('execute'):
+                self._iter_execute()
             self._iter_count += 1
-            norm = self._iter_get_norm()
+            with telemetry._phase('norm'):
+                norm = self._iter_get_norm()
             self._mpi_print(self._iter_count, norm, norm / norm0)
 
         fail = (np.isinf(norm) or np.isnan(norm) or
@@ -0,0 +1,300 @@
+"""Define the BroydenSolver class."""
+
+from __future__ import print_function
+
+from openmdao.solvers.solver import NonlinearSolver
+
+
+class BroydenSolver(NonlinearSolver):
+    """
+    Quasi-Newton solver using Broyden's method.
+
+    The inverse of the Jacobian is approximated by an initial inverse, which is either a scaled
+    identity or the inverse of the Jacobian computed once at the start of the solve, plus a
+    low-rank correction that is updated every iteration from the change in the residuals. The
+    initial inverse is applied once per iteration, to the current residuals.
+
+    Attributes
+    ----------
+    linear_solver : <LinearSolver>
+        Linear solver used to apply the inverse of the initial Jacobian. The default is the
+        parent system's linear solver.
+    linesearch : <NonlinearSolver>
+        Line search algorithm. Default is None for no line search.
+    options : <OptionsDictionary>
+        options dictionary.
+    _system : <System>
+        pointer to the owning system.
+    _depth : int
+        how many subsolvers deep this solver is (0 means not a subsolver).
+    _vec_names : [str, ...]
+        list of right-hand-side (RHS) vector names.
+    _mode : str
+        'fwd' or 'rev', applicable to linear solvers only.
+    _iter_count : int
+        Number of iterations for the current invocation of the solver.
+    _linear_solver_from_parent : bool
+        This is set to True if we are using the parent system's linear solver.
+    _updates : [(ndarray, ndarray), ...]
+        Rank-one corrections (u, v) of the inverse Jacobian, which is the initial inverse
+        plus the sum of the outer products of u and v.
+    _outputs_prev : ndarray or None
+        Outputs at the start of the previous iteration.
+    _residuals_prev : ndarray or None
+        Residuals at the start of the previous iteration.
+    _initial_prod_prev : ndarray or None
+        Product of the initial inverse Jacobian and the residuals at the start of the previous
+        iteration.
+    _num_linearize : int
+        Number of times the Jacobian was computed during the current invocation of the solver.
+    """
+
+    SOLVER = 'NL: BROYDEN'
+
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(BroydenSolver, self).__init__(**kwargs)
+
+        # Slot for linear solver
+        self.linear_solver = None
+
+        # Slot for linesearch
+        self.linesearch = None
+
+        # We only need to call linearize on the linear solver
+        # if its not shared with the parent group.
+        self._linear_solver_from_parent = True
+
+        self._updates = []
+        self._outputs_prev = None
+        self._residuals_prev = None
+        self._initial_prod_prev = None
+        self._num_linearize = 0
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('compute_jacobian', type_=bool, default=True,
+                             desc='Set to True to compute the Jacobian once at the start of the '
+                                  'solve and use its inverse, applied by the linear solver, as '
+                                  'the initial inverse Jacobian. Otherwise, a scaled identity '
+                                  'is used and no derivatives are needed.')
+        self.options.declare('alpha', default=1.0,
+                             desc='Scaling of the identity used as the initial inverse Jacobian '
+                                  'when compute_jacobian is False.')
+        self.options.declare('max_updates', type_=int, default=10, lower=1,
+                             desc='Maximum number of rank-one updates stored before the inverse '
+                                  'Jacobian is reset to its initial value.')
+        self.supports['gradients'] = True
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super(BroydenSolver, self)._setup_solvers(system, depth)
+
+        if self.linear_solver is not None:
+            self.linear_solver._setup_solvers(self._system, self._depth + 1)
+            self._linear_solver_from_parent = False
+        else:
+            self.linear_solver = system.linear_solver
+
+        if self.linesearch is not None:
+            self.linesearch._setup_solvers(self._system, self._depth + 1)
+
+    def _set_solver_print(self, level=2, type_='all'):
+        """
+        Control printing for solvers and subsolvers in the model.
+
+        Parameters
+        ----------
+        level : int
+            iprint level. Set to 2 to print residuals each iteration; set to 1
+            to print just the iteration totals; set to 0 to disable all printing
+            except for failures, and set to -1 to disable all printing including failures.
+        type_ : str
+            Type of solver to set: 'LN' for linear, 'NL' for nonlinear, or 'all' for all.
+        """
+        super(BroydenSolver, self)._set_solver_print(level=level, type_=type_)
+
+        if self.linear_solver is not None and type_ != 'NL':
+            self.linear_solver._set_solver_print(level=level, type_=type_)
+
+        if self.linesearch is not None:
+            self.linesearch._set_solver_print(level=level, type_=type_)
+
+    def _iter_get_norm(self):
+        """
+        Return the norm of the residual.
+
+        Returns
+        -------
+        float
+            norm.
+        """
+        return self._get_norm_without_approx()
+
+    def _iter_initialize(self):
+        """
+        Perform any necessary pre-processing operations.
+
+        Returns
+        -------
+        float
+            initial error.
+        float
+            error at the first iteration.
+        """
+        self._updates = []
+        self._outputs_prev = None
+        self._residuals_prev = None
+        self._initial_prod_prev = None
+        self._num_linearize = 0
+
+        return super(BroydenSolver, self)._iter_initialize()
+
+    def _linearize(self):
+        """
+        Perform any required linearization operations such as matrix factorization.
+        """
+        if not self._linear_solver_from_parent:
+            self.linear_solver._linearize()
+
+        if self.linesearch is not None:
+            self.linesearch._linearize()
+
+    def _apply_initial_inv_jac(self, vec):
+        """
+        Multiply a vector by the initial approximation of the inverse Jacobian.
+
+        Parameters
+        ----------
+        vec : ndarray
+            Vector to multiply.
+
+        Returns
+        -------
+        ndarray
+            The product.
+        """
+        if not self.options['compute_jacobian']:
+            return self.options['alpha'] * vec
+
+        system = self._system
+        system._vectors['residual']['linear'].set_data(vec)
+        with self._telemetry._phase('linear_solve'):
+            self.linear_solver.solve(['linear'], 'fwd')
+        self._telemetry._add_linear_iterations(self.linear_solver._iter_count)
+        return system._vectors['output']['linear'].get_data()
+
+    def _apply_updates(self, initial_prod, vec):
+        """
+        Multiply a vector by the current approximation of the inverse Jacobian.
+
+        Parameters
+        ----------
+        initial_prod : ndarray
+            Product of the initial inverse Jacobian and the vector.
+        vec : ndarray
+            Vector to multiply.
+
+        Returns
+        -------
+        ndarray
+            The product.
+        """
+        prod = initial_prod.copy()
+        for u, v in self._updates:
+            prod += u * v.dot(vec)
+        return prod
+
+    def _update_inv_jac(self, outputs, residuals, initial_prod):
+        """
+        Add a rank-one correction to the inverse Jacobian based on the last step.
+
+        This is the inverse form of Broyden's "second" method, which only requires products
+        with the inverse Jacobian.
+
+        Parameters
+        ----------
+        outputs : ndarray
+            Current outputs.
+        residuals : ndarray
+            Current residuals.
+        initial_prod : ndarray
+            Product of the initial inverse Jacobian and the current residuals.
+        """
+        d_outputs = outputs - self._outputs_prev
+        d_residuals = residuals - self._residuals_prev
+
+        norm2 = d_residuals.dot(d_residuals)
+        if norm2 == 0.0:
+            return
+
+        # Keep memory bounded by restarting from the initial inverse Jacobian.
+        if len(self._updates) >= self.options['max_updates']:
+            self._updates = []
+
+        # The initial inverse Jacobian is linear, so its product with the change in the
+        # residuals follows from the products with the current and previous residuals.
+        prod = self._apply_updates(initial_prod - self._initial_prod_prev, d_residuals)
+        u = (d_outputs - prod) / norm2
+        self._updates.append((u, d_residuals))
+
+    def _iter_execute(self):
+        """
+        Perform the operations in the iteration loop.
+        """
+        system = self._system
+        self._solver_info.prefix += '|  '
+
+        # Disable local fd
+        approx_status = system._owns_approx_jac
+        system._owns_approx_jac = False
+
+        outputs = system._outputs.get_data()
+        residuals = system._residuals.get_data()
+
+        if self._iter_count == 0 and self.options['compute_jacobian']:
+            with self._telemetry._phase('linearize'):
+                system._linearize()
+            self._num_linearize += 1
+
+        initial_prod = self._apply_initial_inv_jac(residuals)
+
+        if self._iter_count > 0:
+            self._update_inv_jac(outputs, residuals, initial_prod)
+
+        self._outputs_prev = outputs
+        self._residuals_prev = residuals
+        self._initial_prod_prev = initial_prod
+
+        step = self._apply_updates(initial_prod, residuals)
+        step *= -1.0
+        system._vectors['output']['linear'].set_data(step)
+
+        if self.linesearch:
+            self.linesearch._do_subsolve = False
+            self.linesearch.solve()
+        else:
+            system._outputs += system._vectors['output']['linear']
+
+        self._solver_info.prefix = self._solver_info.prefix[:-3]
+
+        # Enable local fd
+        system._owns_approx_jac = approx_status
@@ -2,8 +2,10 @@
 
 from __future__ import print_function
 
+import os
+
 from openmdao.solvers.solver import NonlinearSolver
-from openmdao.recorders.recording_iteration_stack import Recording, recording_iteration_stack
+from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.utils.general_utils import warn_deprecation
 
 
@@ -34,6 +36,18 @@ class NewtonSolver(NonlinearSolver):
         Number of iterations for the current invocation of the solver.
     _linear_solver_from_parent : bool
         This is set to True if we are using the parent system's linear solver.
+    _jac_age : int
+        Number of iterations since the Jacobian was last updated.
+    _linearize_iters : [int, ...]
+        Iterations of the current invocation at which the Jacobian was updated.
+    _norm_prev : float
+        Residual norm at the iteration before the most recent one.
+    _norm_last : float
+        Residual norm at the most recent iteration.
+    _ew_eta : float or None
+        Most recent Eisenstat-Walker forcing term (relative linear tolerance).
+    _linear_iters : [int, ...]
+        Number of linear solver iterations performed in each Newton iteration.
     """
 
     SOLVER = 'NL: Newton'
@@ -59,6 +73,16 @@ class NewtonSolver(NonlinearSolver):
         # if its not shared with the parent group.
         self._linear_solver_from_parent = True
 
+        # Lagged Jacobian bookkeeping.
+        self._jac_age = 0
+        self._linearize_iters = []
+        self._norm_prev = None
+        self._norm_last = None
+
+        # Inexact Newton bookkeeping.
+        self._ew_eta = None
+        self._linear_iters = []
+
     @property
     def line_search(self):
         """
@@ -85,6 +109,33 @@ class NewtonSolver(NonlinearSolver):
                              desc='Set to True to turn on sub-solvers (Hybrid Newton).')
         self.options.declare('max_sub_solves', type_=int, default=10,
                              desc='Maximum number of subsystem solves.')
+        self.options.declare('skip_unchanged', type_=bool, default=False,
+                             desc='When solve_subsystems is True, set to True to skip the '
+                                  'nonlinear solve of subsystems whose inputs and outputs are '
+                                  'identical to those at the end of their last solve. Only valid '
+                                  'if each subsystem is a deterministic function of its inputs '
+                                  'and outputs.')
+        self.options.declare('jac_update_freq', type_=int, default=1, lower=1,
+                             desc='Number of iterations for which the Jacobian and its '
+                                  'factorization are reused before being updated. 1 gives the '
+                                  'full Newton method; larger values give the Shamanskii (chord) '
+                                  'method.')
+        self.options.declare('jac_update_ratio', default=1.0, lower=0.0,
+                             desc='When reusing a lagged Jacobian, update it at the next iteration '
+                                  'if the ratio of the current residual norm to the previous one '
+                                  'exceeds this value.')
+        self.options.declare('eisenstat_walker', type_=bool, default=False,
+                             desc='Set to True to adapt the relative tolerance of an iterative '
+                                  'linear solver every iteration from the reduction of the '
+                                  'nonlinear residual (Eisenstat-Walker forcing terms), so '
+                                  'early iterations do not over-solve the linear system.')
+        self.options.declare('ew_gamma', default=0.9, lower=0.0, upper=1.0,
+                             desc='Eisenstat-Walker forcing term scaling factor.')
+        self.options.declare('ew_alpha', default=2.0, lower=1.0, upper=2.0,
+                             desc='Eisenstat-Walker forcing term exponent.')
+        self.options.declare('ew_eta_max', default=0.9, lower=0.0, upper=1.0,
+                             desc='Largest relative linear tolerance allowed. Also used for the '
+                                  'first iteration.')
         self.supports['gradients'] = True
 
     def _setup_solvers(self, system, depth):
@@ -139,22 +190,111 @@ class NewtonSolver(NonlinearSolver):
         float
             norm.
         """
-        recording_iteration_stack.append(('_iter_get_norm', 0))
+        norm = self._get_norm_without_approx()
+        self._norm_prev = self._norm_last
+        self._norm_last = norm
 
-        system = self._system
+        return norm
 
-        # Disable local fd
-        approx_status = system._owns_approx_jac
-        system._owns_approx_jac = False
+    def _iter_initialize(self):
+        """
+        Perform any necessary pre-processing operations.
 
-        system._apply_nonlinear()
+        Returns
+        -------
+        float
+            initial error.
+        float
+            error at the first iteration.
+        """
+        self._linearize_iters = []
+        self._norm_prev = self._norm_last = None
+        self._ew_eta = None
+        self._linear_iters = []
 
-        recording_iteration_stack.pop()
+        return super(NewtonSolver, self)._iter_initialize()
 
-        # Enable local fd
-        system._owns_approx_jac = approx_status
+    def _run_iterator(self):
+        """
+        Run the iterative solver.
+
+        Returns
+        -------
+        boolean
+            Failure flag; True if failed to converge, False is successful.
+        float
+            absolute error.
+        float
+            relative error.
+        """
+        result = super(NewtonSolver, self)._run_iterator()
+
+        if self.options['eisenstat_walker'] and self.options['iprint'] == 2 and \
+                (self._system.comm.rank == 0 or os.environ.get('USE_PROC_FILES')):
+            print(self._solver_info.prefix + self.SOLVER +
+                  ' Used {} linear iterations with adaptive tolerances: {}'.format(
+                      sum(self._linear_iters), self._linear_iters))
+
+        return result
+
+    def _ew_forcing_term(self, tol_fixed):
+        """
+        Compute the Eisenstat-Walker forcing term for the current iteration.
 
-        return system._residuals.get_norm()
+        Parameters
+        ----------
+        tol_fixed : float
+            Relative tolerance of the linear solver, which the forcing term never goes below.
+
+        Returns
+        -------
+        float
+            Relative tolerance for the linear solve.
+        """
+        options = self.options
+        eta_max = options['ew_eta_max']
+        gamma = options['ew_gamma']
+        alpha = options['ew_alpha']
+        norm_prev = self._norm_prev
+        norm = self._norm_last
+
+        if self._ew_eta is None or not norm_prev:
+            eta = eta_max
+        else:
+            eta = gamma * (norm / norm_prev) ** alpha
+
+            # Safeguard against the forcing term dropping too quickly.
+            eta_safe = gamma * self._ew_eta ** alpha
+            if eta_safe > 0.1:
+                eta = max(eta, eta_safe)
+
+            # Do not solve more accurately than the nonlinear tolerance requires.
+            if norm > 0.0:
+                eta = max(eta, 0.5 * options['atol'] / norm)
+
+            eta = min(eta, eta_max)
+
+        self._ew_eta = eta
+        return max(eta, tol_fixed)
+
+    def _need_jac_update(self):
+        """
+        Return a flag that is True when the Jacobian must be updated in this iteration.
+
+        Returns
+        -------
+        boolean
+            Flag indicating that the lagged Jacobian is stale.
+        """
+        if self._iter_count == 0 or self._jac_age >= self.options['jac_update_freq']:
+            return True
+
+        # The residual reduction has degraded, so the lagged Jacobian is no longer good enough.
+        norm_prev = self._norm_prev
+        if norm_prev is not None and norm_prev > 0.0:
+            return self._norm_last / norm_prev > self.options['jac_update_ratio']
+
+        return False
 
     def _linearize_children(self):
         """
@@ -196,11 +336,15 @@ class NewtonSolver(NonlinearSolver):
             if do_subsolve:
                 self._solver_info.prefix += '+  '
 
+                skip_unchanged = self.options['skip_unchanged']
                 for isub, subsys in enumerate(system._subsystems_allprocs):
                     system._transfer('nonlinear', 'fwd', isub)
 
                     if subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                        if skip_unchanged:
+                            subsys._solve_nonlinear_if_changed()
+                        else:
+                            subsys._solve_nonlinear()
 
                 self._solver_info.prefix = self._solver_info.prefix[:-3]
 
@@ -208,9 +352,36 @@ class NewtonSolver(NonlinearSolver):
 
         system._vectors['residual']['linear'].set_vec(system._residuals)
         system._vectors['residual']['linear'] *= -1.0
-        system._linearize()
 
-        self.linear_solver.solve(['linear'], 'fwd')
+        # The Jacobian is only updated when stale; otherwise the previous partials and
+        # factorization are reused (chord / Shamanskii Newton).
+        if self._need_jac_update():
+            with self._telemetry._phase('linearize'):
+                system._linearize()
+            self._linearize_iters.append(self._iter_count)
+            self._jac_age = 0
+        self._jac_age += 1
+
+        if self.options['eisenstat_walker']:
+            linear_solver = self.linear_solver
+
+            # The forcing term is relative to the nonlinear residual, so start from zero rather
+            # than from the previous step, which may already satisfy a loose tolerance.
+            system._vectors['output']['linear'].set_const(0.0)
+
+            linear_solver._forcing_term = self._ew_forcing_term(linear_solver.options['rtol'])
+            try:
+                with self._telemetry._phase('linear_solve'):
+                    linear_solver.solve(['linear'], 'fwd')
+            finally:
+                linear_solver._forcing_term = None
+        else:
+            with self._telemetry._phase('linear_solve'):
+                self.linear_solver.solve(['linear'], 'fwd')
+        niter = self.linear_solver._iter_count
+
+        self._linear_iters.append(niter)
+        self._telemetry._add_linear_iterations(niter)
 
         if self.linesearch:
             self.linesearch._do_subsolve = do_subsolve
@@ -222,19 +393,3 @@ class NewtonSolver(NonlinearSolver):
 
         # Enable local fd
         system._owns_approx_jac = approx_status
-
-    def _mpi_print_header(self):
-        """
-        Print header text before solving.
-        """
-        if (self.options['iprint'] > 0 and self._system.comm.rank == 0):
-
-            pathname = self._system.pathname
-            if pathname:
-                nchar = len(pathname)
-                prefix = self._solver_info.prefix
-                header = prefix + "\n"
-                header += prefix + nchar * "=" + "\n"
-                header += prefix + pathname + "\n"
-                header += prefix + nchar * "="
-                print(header)
@@ -1,15 +1,87 @@
 """Define the NonlinearBlockGS class."""
 
+from collections import deque
+
+import numpy as np
+import scipy.linalg
+
 from openmdao.solvers.solver import NonlinearSolver
 
 
 class NonlinearBlockGS(NonlinearSolver):
     """
     Nonlinear block Gauss-Seidel solver.
+
+    Attributes
+    ----------
+    options : <OptionsDictionary>
+        options dictionary.
+    _system : <System>
+        pointer to the owning system.
+    _depth : int
+        how many subsolvers deep this solver is (0 means not a subsolver).
+    _vec_names : [str, ...]
+        list of right-hand-side (RHS) vector names.
+    _mode : str
+        'fwd' or 'rev', applicable to linear solvers only.
+    _iter_count : int
+        Number of iterations for the current invocation of the solver.
+    _aitken_factor : float
+        Current Aitken relaxation factor.
+    _delta_prev : ndarray or None
+        Update of the outputs made by the previous Gauss-Seidel sweep.
+    _outputs_prev : ndarray or None
+        Outputs after the previous Gauss-Seidel sweep, before acceleration.
+    _hist_doutputs : deque
+        Bounded history of the changes between successive sweep outputs, for Anderson mixing.
+    _hist_ddelta : deque
+        Bounded history of the changes between successive sweep updates, for Anderson mixing.
     """
 
     SOLVER = 'NL: NLBGS'
 
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(NonlinearBlockGS, self).__init__(**kwargs)
+
+        self._aitken_factor = 1.0
+        self._delta_prev = None
+        self._outputs_prev = None
+        self._hist_doutputs = deque()
+        self._hist_ddelta = deque()
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('skip_unchanged', type_=bool, default=False,
+                             desc='Set to True to skip the nonlinear solve of subsystems whose '
+                                  'inputs and outputs are identical to those at the end of their '
+                                  'last solve. Only valid if each subsystem is a deterministic '
+                                  'function of its inputs and outputs.')
+        self.options.declare('acceleration', default='none',
+                             values=['none', 'aitken', 'anderson'],
+                             desc="Method used to accelerate convergence of the fixed point "
+                                  "iteration: 'aitken' for dynamic relaxation of each sweep, or "
+                                  "'anderson' for mixing of the previous sweeps.")
+        self.options.declare('aitken_initial_factor', default=1.0, lower=0.0,
+                             desc='Relaxation factor for the first iteration with Aitken '
+                                  'acceleration. It is limited to the range of '
+                                  'aitken_min_factor and aitken_max_factor.')
+        self.options.declare('aitken_min_factor', default=0.1, lower=0.0,
+                             desc='Lower limit for the Aitken relaxation factor.')
+        self.options.declare('aitken_max_factor', default=1.5, lower=0.0,
+                             desc='Upper limit for the Aitken relaxation factor.')
+        self.options.declare('anderson_depth', type_=int, default=5, lower=1,
+                             desc='Number of previous sweeps used for Anderson mixing.')
+
     def _setup_solvers(self, system, depth):
         """
         Assign system instance, set depth, and optionally perform setup.
@@ -26,32 +98,131 @@ class NonlinearBlockGS(NonlinearSolver):
         if len(system._subsystems_allprocs) != len(system._subsystems_myproc):
             raise RuntimeError('Nonlinear Gauss-Seidel cannot be used on a parallel group.')
 
+    def _iter_initialize(self):
+        """
+        Perform any necessary pre-processing operations.
+
+        Returns
+        -------
+        float
+            initial error.
+        float
+            error at the first iteration.
+        """
+        self._aitken_factor = min(max(self.options['aitken_initial_factor'],
+                                      self.options['aitken_min_factor']),
+                                  self.options['aitken_max_factor'])
+        self._delta_prev = None
+        self._outputs_prev = None
+        depth = self.options['anderson_depth']
+        self._hist_doutputs = deque(maxlen=depth)
+        self._hist_ddelta = deque(maxlen=depth)
+
+        return super(NonlinearBlockGS, self)._iter_initialize()
+
     def _iter_execute(self):
         """
         Perform the operations in the iteration loop.
         """
         system = self._system
+        acceleration = self.options['acceleration']
+        skip_unchanged = self.options['skip_unchanged']
+
+        # The acceleration only updates the real part of the outputs, so under complex step the
+        # plain iteration is used to converge the imaginary part correctly.
+        if system._outputs._vector_info._under_complex_step:
+            acceleration = 'none'
+
+        if acceleration != 'none':
+            outputs = system._outputs.get_data()
 
         self._solver_info.prefix += '|  '
         for isub, subsys in enumerate(system._subsystems_myproc):
             system._transfer('nonlinear', 'fwd', isub)
-            subsys._solve_nonlinear()
+            if skip_unchanged:
+                subsys._solve_nonlinear_if_changed()
+            else:
+                subsys._solve_nonlinear()
             system._check_reconf_update()
 
         self._solver_info.prefix = self._solver_info.prefix[:-3]
 
-    def _mpi_print_header(self):
+        if acceleration == 'aitken':
+            self._aitken_update(outputs)
+        elif acceleration == 'anderson':
+            self._anderson_update(outputs)
+
+    def _aitken_update(self, outputs):
         """
-        Print header text before solving.
+        Relax the update made by the latest sweep using the Aitken factor.
+
+        Parameters
+        ----------
+        outputs : ndarray
+            Outputs before the latest sweep.
+        """
+        system_outputs = self._system._outputs
+        delta = system_outputs.get_data() - outputs
+        delta_prev = self._delta_prev
+
+        if delta_prev is not None:
+            ddelta = delta - delta_prev
+            norm2 = self._dot(ddelta, ddelta)
+            if norm2 > 0.0:
+                factor = -self._aitken_factor * self._dot(delta_prev, ddelta) / norm2
+                self._aitken_factor = min(max(factor, self.options['aitken_min_factor']),
+                                          self.options['aitken_max_factor'])
+
+        self._delta_prev = delta
+        system_outputs.set_data(outputs + self._aitken_factor * delta)
+
+    def _anderson_update(self, outputs):
         """
-        if (self.options['iprint'] > 0 and self._system.comm.rank == 0):
+        Replace the outputs of the latest sweep with the Anderson mixing of the previous sweeps.
+
+        Parameters
+        ----------
+        outputs : ndarray
+            Outputs before the latest sweep.
+        """
+        system_outputs = self._system._outputs
+        new_outputs = system_outputs.get_data()
+        delta = new_outputs - outputs
+
+        if self._delta_prev is not None:
+            self._hist_doutputs.append(new_outputs - self._outputs_prev)
+            self._hist_ddelta.append(delta - self._delta_prev)
+
+        self._outputs_prev = new_outputs
+        self._delta_prev = delta
+
+        if self._hist_ddelta:
+            # Find the combination of previous updates that best cancels the current one, from
+            # the normal equations so that the same combination is used on every process.
+            ddelta = np.array(self._hist_ddelta)
+            gamma = scipy.linalg.lstsq(self._dot(ddelta, ddelta.T), self._dot(ddelta, delta))[0]
+            system_outputs.set_data(new_outputs - np.array(self._hist_doutputs).T.dot(gamma))
+
+    def _dot(self, a, b):
+        """
+        Return the dot product of arrays of the local outputs, summed over the processes.
+
+        Parameters
+        ----------
+        a : ndarray
+            Array of the local outputs, or of one set of them in each row.
+        b : ndarray
+            Array of the local outputs, or of one set of them in each column.
+
+        Returns
+        -------
+        float or ndarray
+            Dot product of the arrays over all of the outputs.
+        """
+        dot = a.dot(b)
+
+        comm = self._system.comm
+        if comm.size > 1:
+            dot = comm.allreduce(dot)
 
-            pathname = self._system.pathname
-            if pathname:
-                nchar = len(pathname)
-                prefix = self._solver_info.prefix
-                header = prefix + "\n"
-                header += prefix + nchar * "=" + "\n"
-                header += prefix + pathname + "\n"
-                header += prefix + nchar * "="
-                print(header)
+        return dot
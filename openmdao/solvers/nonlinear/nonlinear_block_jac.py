@@ -1,6 +1,7 @@
 """Define the NonlinearBlockJac class."""
 from openmdao.solvers.solver import NonlinearSolver
 from openmdao.recorders.recording_iteration_stack import Recording
+from openmdao.utils.thread_utils import run_threaded, get_num_threads
 
 
 class NonlinearBlockJac(NonlinearSolver):
@@ -10,34 +11,32 @@ class NonlinearBlockJac(NonlinearSolver):
 
     SOLVER = 'NL: NLBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('num_threads', type_=int, default=1, lower=1,
+                             desc='Number of threads used to solve the subsystems concurrently. '
+                                  'This only pays off if the subsystems spend most of their time '
+                                  'in code that releases the GIL, such as numpy or external codes.')
+
     def _iter_execute(self):
         """
         Perform the operations in the iteration loop.
         """
+        system = self._system
+        prefix = self._solver_info.prefix
         self._solver_info.prefix += '|  '
-        self._system._transfer('nonlinear', 'fwd')
+        system._transfer('nonlinear', 'fwd')
+
+        num_threads = get_num_threads(system, self.options['num_threads'])
 
         with Recording('NonlinearBlockJac', 0, self) as rec:
-            for subsys in self._system._subsystems_myproc:
-                subsys._solve_nonlinear()
-            self._system._check_reconf_update()
+            run_threaded(lambda subsys: subsys._solve_nonlinear(), system._subsystems_myproc,
+                         num_threads)
+            system._check_reconf_update()
             rec.abs = 0.0
             rec.rel = 0.0
 
-        self._solver_info.prefix = self._solver_info.prefix[:-3]
-
-    def _mpi_print_header(self):
-        """
-        Print header text before solving.
-        """
-        if (self.options['iprint'] > 0 and self._system.comm.rank == 0):
-
-            pathname = self._system.pathname
-            if pathname:
-                nchar = len(pathname)
-                prefix = self._solver_info.prefix
-                header = prefix + "\n"
-                header += prefix + nchar * "=" + "\n"
-                header += prefix + pathname + "\n"
-                header += prefix + nchar * "="
-                print(header)
+        # Concurrent subsystem solves may leave the shared prefix in any state.
+        self._solver_info.prefix = prefix
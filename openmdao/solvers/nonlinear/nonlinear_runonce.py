@@ -16,7 +16,17 @@ class NonLinearRunOnce(NonlinearSolver):
 
     SOLVER = 'NL: RUNONCE'
 
-    def solve(self):
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('skip_unchanged', type_=bool, default=False,
+                             desc='Set to True to skip the nonlinear solve of subsystems whose '
+                                  'inputs and outputs are identical to those at the end of their '
+                                  'last solve. Only valid if each subsystem is a deterministic '
+                                  'function of its inputs and outputs.')
+
+    def _solve(self):
         """
         Run the solver.
 
@@ -30,19 +40,26 @@ class NonLinearRunOnce(NonlinearSolver):
             relative error.
         """
         system = self._system
+        skip_unchanged = self.options['skip_unchanged']
 
         with Recording('NLRunOnce', 0, self) as rec:
             # If this is a parallel group, transfer all at once then run each subsystem.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
                 system._transfer('nonlinear', 'fwd')
                 for subsys in system._subsystems_myproc:
-                    subsys._solve_nonlinear()
+                    if skip_unchanged:
+                        subsys._solve_nonlinear_if_changed()
+                    else:
+                        subsys._solve_nonlinear()
                 system._check_reconf_update()
             # If this is not a parallel group, transfer for each subsystem just prior to running it.
             else:
                 for isub, subsys in enumerate(system._subsystems_myproc):
                     system._transfer('nonlinear', 'fwd', isub)
-                    subsys._solve_nonlinear()
+                    if skip_unchanged:
+                        subsys._solve_nonlinear_if_changed()
+                    else:
+                        subsys._solve_nonlinear()
                     system._check_reconf_update()
             rec.abs = 0.0
             rec.rel = 0.0
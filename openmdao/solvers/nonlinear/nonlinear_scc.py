@@ -0,0 +1,167 @@
+"""Define the NonlinearSCC class."""
+
+import numpy as np
+
+from openmdao.error_checking.check_config import get_scc_blocks
+from openmdao.recorders.recording_iteration_stack import Recording
+from openmdao.solvers.solver import NonlinearSolver
+
+
+class NonlinearSCC(NonlinearSolver):
+    """
+    Nonlinear solver that follows the strongly connected components of the subsystem graph.
+
+    At setup, the subsystems are partitioned into strongly connected components (cycles, and
+    single subsystems that are not part of a cycle) using the connections of the owning system.
+    Each iteration then visits the components in dataflow order, so the acyclic parts of the
+    model run once, while each cycle is converged on its own with block Gauss-Seidel before
+    moving on to the subsystems that depend on it.
+
+    Attributes
+    ----------
+    options : <OptionsDictionary>
+        options dictionary.
+    _system : <System>
+        pointer to the owning system.
+    _depth : int
+        how many subsolvers deep this solver is (0 means not a subsolver).
+    _vec_names : [str, ...]
+        list of right-hand-side (RHS) vector names.
+    _mode : str
+        'fwd' or 'rev', applicable to linear solvers only.
+    _iter_count : int
+        Number of iterations for the current invocation of the solver.
+    _blocks : [[int, ...], ...]
+        Indices of the subsystems in each strongly connected component, in execution order.
+    _cycle_iter_counts : [int, ...]
+        Number of Gauss-Seidel iterations taken by each cycle in the latest iteration.
+    """
+
+    SOLVER = 'NL: SCC'
+
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(NonlinearSCC, self).__init__(**kwargs)
+
+        self._blocks = []
+        self._cycle_iter_counts = []
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        self.options.declare('cycle_maxiter', type_=int, default=100, lower=1,
+                             desc='Maximum number of Gauss-Seidel iterations used to converge '
+                                  'each cycle.')
+        self.options.declare('cycle_atol', default=1e-10,
+                             desc='Absolute tolerance on the change of the outputs of a cycle '
+                                  'over one Gauss-Seidel iteration.')
+        self.options.declare('cycle_rtol', default=1e-10,
+                             desc='Tolerance on the change of the outputs of a cycle over one '
+                                  'Gauss-Seidel iteration, relative to the change over the first '
+                                  'iteration.')
+
+        # A single pass converges the model if each cycle is converged.
+        self.options['maxiter'] = 3
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and partition the subsystems.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super(NonlinearSCC, self)._setup_solvers(system, depth)
+
+        if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
+            raise RuntimeError("The solver '%s' in system '%s' does not support "
+                               "parallel groups." % (self.SOLVER, system.pathname))
+
+        self._blocks = get_scc_blocks(system)
+
+    def _get_block_outputs(self, block):
+        """
+        Return the outputs of the subsystems in a strongly connected component.
+
+        Parameters
+        ----------
+        block : [int, ...]
+            Indices of the subsystems.
+
+        Returns
+        -------
+        ndarray
+            Concatenated outputs of the subsystems.
+        """
+        subsystems = self._system._subsystems_myproc
+        return np.concatenate([subsystems[isub]._outputs.get_data() for isub in block])
+
+    def _solve_cycle(self, block):
+        """
+        Converge a cycle with block Gauss-Seidel.
+
+        Parameters
+        ----------
+        block : [int, ...]
+            Indices of the subsystems in the cycle.
+
+        Returns
+        -------
+        int
+            Number of iterations taken.
+        """
+        system = self._system
+        subsystems = system._subsystems_myproc
+        atol = self.options['cycle_atol']
+        rtol = self.options['cycle_rtol']
+
+        norm0 = None
+        outputs = self._get_block_outputs(block)
+        for cycle_iter in range(1, self.options['cycle_maxiter'] + 1):
+            for isub in block:
+                system._transfer('nonlinear', 'fwd', isub)
+                subsystems[isub]._solve_nonlinear()
+                system._check_reconf_update()
+
+            new_outputs = self._get_block_outputs(block)
+            norm = np.linalg.norm(new_outputs - outputs)
+            outputs = new_outputs
+
+            if norm0 is None:
+                norm0 = norm if norm != 0.0 else 1.0
+            if norm < atol or norm / norm0 < rtol:
+                break
+
+        return cycle_iter
+
+    def _iter_execute(self):
+        """
+        Perform the operations in the iteration loop.
+        """
+        system = self._system
+        subsystems = system._subsystems_myproc
+        self._solver_info.prefix += '|  '
+        self._cycle_iter_counts = []
+
+        with Recording('NonlinearSCC', self._iter_count, self):
+            for block in self._blocks:
+                if len(block) == 1:
+                    isub = block[0]
+                    system._transfer('nonlinear', 'fwd', isub)
+                    subsystems[isub]._solve_nonlinear()
+                    system._check_reconf_update()
+                else:
+                    self._cycle_iter_counts.append(self._solve_cycle(block))
+
+        self._solver_info.prefix = self._solver_info.prefix[:-3]
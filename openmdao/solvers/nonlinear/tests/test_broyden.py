@@ -0,0 +1,149 @@
+"""Test the Broyden nonlinear solver. """
+
+import unittest
+
+from openmdao.api import Problem, Group, IndepVarComp, BroydenSolver, DirectSolver, \
+    ScipyIterativeSolver
+from openmdao.devtools.testutil import assert_rel_error
+from openmdao.solvers.linesearch.backtracking import BoundsEnforceLS
+from openmdao.test_suite.components.double_sellar import DoubleSellar
+from openmdao.test_suite.components.implicit_newton_linesearch import ImplCompTwoStates
+from openmdao.test_suite.components.sellar import SellarDerivatives, SellarNoDerivatives, \
+    SellarStateConnection
+
+
+class TestBroyden(unittest.TestCase):
+
+    def test_sellar(self):
+        prob = Problem()
+        prob.model = SellarDerivatives(nonlinear_solver=BroydenSolver(maxiter=20),
+                                       linear_solver=DirectSolver())
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+        # The Jacobian is only computed once.
+        solver = prob.model.nonlinear_solver
+        self.assertEqual(solver._num_linearize, 1)
+        self.assertLess(solver._iter_count, 8)
+
+        # and the linear solver is only run once per iteration.
+        self.assertEqual(prob.model.linear_solver.get_telemetry()['num_solves'],
+                         solver._iter_count)
+
+    def test_sellar_no_jacobian(self):
+        # Without the initial Jacobian, no derivatives are needed at all.
+        prob = Problem()
+        prob.model = SellarNoDerivatives(nonlinear_solver=BroydenSolver(maxiter=20,
+                                                                        compute_jacobian=False))
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+        self.assertEqual(prob.model.nonlinear_solver._num_linearize, 0)
+
+    def test_sellar_state_connection(self):
+        prob = Problem()
+        prob.model = SellarStateConnection(nonlinear_solver=BroydenSolver(maxiter=20),
+                                           linear_solver=ScipyIterativeSolver())
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['state_eq.y2_command'], 12.05848819, .00001)
+
+    def test_max_updates(self):
+        prob = Problem()
+        prob.model = SellarDerivatives(nonlinear_solver=BroydenSolver(maxiter=20, max_updates=2),
+                                       linear_solver=DirectSolver())
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+        self.assertLessEqual(len(prob.model.nonlinear_solver._updates), 2)
+
+    def test_double_sellar(self):
+        prob = Problem()
+        prob.model = DoubleSellar()
+        prob.model.nonlinear_solver = BroydenSolver(maxiter=30)
+        prob.model.linear_solver = DirectSolver()
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['g1.y1'], 0.64, .00001)
+        assert_rel_error(self, prob['g1.y2'], 0.80, .00001)
+        assert_rel_error(self, prob['g2.y1'], 0.64, .00001)
+        assert_rel_error(self, prob['g2.y2'], 0.80, .00001)
+
+    def test_linesearch_bounds(self):
+        top = Problem()
+        top.model = Group()
+        top.model.add_subsystem('px', IndepVarComp('x', 1.0))
+        top.model.add_subsystem('comp', ImplCompTwoStates())
+        top.model.connect('px.x', 'comp.x')
+
+        top.model.nonlinear_solver = BroydenSolver(maxiter=10)
+        top.model.nonlinear_solver.linesearch = BoundsEnforceLS(bound_enforcement='vector')
+        top.model.linear_solver = ScipyIterativeSolver()
+
+        top.setup(check=False)
+        top.set_solver_print(level=0)
+
+        # Test lower bound: should go to the lower bound and stall
+        top['px.x'] = 2.0
+        top['comp.y'] = 0.0
+        top['comp.z'] = 1.6
+        top.run_model()
+        assert_rel_error(self, top['comp.z'], 1.5, 1e-8)
+
+
+class TestBroydenFeatures(unittest.TestCase):
+
+    def test_feature_basic(self):
+        from openmdao.api import Problem, BroydenSolver, DirectSolver
+        from openmdao.test_suite.components.sellar import SellarDerivatives
+
+        prob = Problem()
+        prob.model = SellarDerivatives(nonlinear_solver=BroydenSolver(),
+                                       linear_solver=DirectSolver())
+
+        prob.setup()
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+    def test_feature_compute_jacobian(self):
+        from openmdao.api import Problem, BroydenSolver
+        from openmdao.test_suite.components.sellar import SellarNoDerivatives
+
+        broyden = BroydenSolver()
+        broyden.options['compute_jacobian'] = False
+        broyden.options['maxiter'] = 20
+
+        prob = Problem()
+        prob.model = SellarNoDerivatives(nonlinear_solver=broyden)
+
+        prob.setup()
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -411,6 +411,38 @@ class TestNewton(unittest.TestCase):
         assert_rel_error(self, prob['g2.y1'], 0.64, .00001)
         assert_rel_error(self, prob['g2.y2'], 0.80, .00001)
 
+    def test_solve_subsystems_skip_unchanged(self):
+        counts = {}
+        for skip in (False, True):
+            prob = Problem()
+            model = prob.model
+
+            model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+            model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+            model.add_subsystem('py', IndepVarComp('y2', 3.0))
+            pre = model.add_subsystem('pre', SellarDis1withDerivatives(),
+                                      promotes_inputs=['x', 'z'])
+            model.connect('py.y2', 'pre.y2')
+
+            model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+            model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+            model.nonlinear_solver = NewtonSolver(solve_subsystems=True, skip_unchanged=skip)
+            model.linear_solver = DirectSolver()
+
+            prob.setup(check=False)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+            assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+            assert_rel_error(self, prob['pre.y1'], 27.4, 1e-15)
+
+            counts[skip] = pre.execution_count
+
+        # The Newton step leaves the feed-forward branch alone, so it isn't solved again.
+        self.assertLess(counts[True], counts[False])
+
     def test_solve_subsystems_basic_dense_jac(self):
         prob = Problem()
         model = prob.model = DoubleSellar()
@@ -754,6 +786,119 @@ class TestNewton(unittest.TestCase):
         self.assertEqual(g2.nonlinear_solver.total_count, 4)
         self.assertEqual(g1.linear_solver.lin_count, 4)
 
+    def test_jac_update_freq(self):
+        # Lagged Jacobian: linearize only every third iteration.
+
+        class CountDS(DirectSolver):
+
+            def __init__(self, **kwargs):
+                super(CountDS, self).__init__(**kwargs)
+                self.lin_count = 0
+
+            def _linearize(self):
+                super(CountDS, self)._linearize()
+                self.lin_count += 1
+
+        newton = NewtonSolver()
+        newton.options['maxiter'] = 20
+        newton.options['jac_update_freq'] = 3
+        newton.options['jac_update_ratio'] = 10.0
+
+        prob = Problem()
+        model = prob.model = SellarDerivatives(nonlinear_solver=newton,
+                                               linear_solver=CountDS())
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+        niter = newton._iter_count
+        self.assertEqual(newton._linearize_iters, list(range(0, niter, 3)))
+        self.assertEqual(model.linear_solver.lin_count, len(newton._linearize_iters))
+
+    def test_jac_update_ratio(self):
+        # A ratio of zero forces an update whenever the residual fails to vanish, which
+        # recovers the full Newton method.
+        newton = NewtonSolver()
+        newton.options['jac_update_freq'] = 100
+        newton.options['jac_update_ratio'] = 0.0
+
+        prob = Problem()
+        prob.model = SellarDerivatives(nonlinear_solver=newton, linear_solver=DirectSolver())
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+        self.assertEqual(newton._linearize_iters, list(range(newton._iter_count)))
+
+    def _ew_double_sellar(self, linear_solver, eisenstat_walker):
+        prob = Problem()
+        prob.model = DoubleSellar()
+        prob.model.nonlinear_solver = NewtonSolver(maxiter=20, eisenstat_walker=eisenstat_walker)
+        prob.model.linear_solver = linear_solver
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['g1.y1'], 0.64, .00001)
+        assert_rel_error(self, prob['g1.y2'], 0.80, .00001)
+        assert_rel_error(self, prob['g2.y1'], 0.64, .00001)
+        assert_rel_error(self, prob['g2.y2'], 0.80, .00001)
+
+        return prob.model.nonlinear_solver._linear_iters
+
+    def test_eisenstat_walker(self):
+        fixed_iters = self._ew_double_sellar(LinearBlockGS(maxiter=100), False)
+
+        linear_solver = LinearBlockGS(maxiter=100)
+
+        # The forcing terms are passed to the linear solver without changing its options.
+        tols = []
+        iter_initialize = linear_solver._iter_initialize
+
+        def logging_iter_initialize():
+            tols.append((linear_solver.options['rtol'], linear_solver._get_rtol()))
+            return iter_initialize()
+
+        linear_solver._iter_initialize = logging_iter_initialize
+
+        ew_iters = self._ew_double_sellar(linear_solver, True)
+
+        self.assertLess(sum(ew_iters), sum(fixed_iters))
+
+        self.assertEqual(set(rtol for rtol, eta in tols), set([1e-10]))
+        self.assertEqual(tols[0][1], 0.9)
+        self.assertIsNone(linear_solver._forcing_term)
+
+    def test_eisenstat_walker_scipy(self):
+        # Restarting every iteration makes gmres take enough iterations for loose early
+        # tolerances to pay off on this small model.
+        fixed_iters = self._ew_double_sellar(ScipyIterativeSolver(restart=1), False)
+
+        linear_solver = ScipyIterativeSolver(restart=1)
+        ew_iters = self._ew_double_sellar(linear_solver, True)
+
+        self.assertLess(sum(ew_iters), sum(fixed_iters))
+        self.assertIsNone(linear_solver._forcing_term)
+
+    def test_eisenstat_walker_warm_start(self):
+        # The zero initial guess of the adaptive solves is not replaced by a previous solution.
+        fixed_iters = self._ew_double_sellar(ScipyIterativeSolver(restart=1), False)
+
+        linear_solver = ScipyIterativeSolver(restart=1, warm_start=True)
+        ew_iters = self._ew_double_sellar(linear_solver, True)
+
+        self.assertLess(sum(ew_iters), sum(fixed_iters))
+        self.assertTrue(linear_solver.options['warm_start'])
+
     def test_maxiter_one(self):
         # Fix bug when maxiter was set to 1.
         # This bug caused linearize to run before apply in this case.
@@ -999,6 +1144,57 @@ class TestNewtonFeatures(unittest.TestCase):
         prob.setup()
         prob.run_model()
 
+    def test_feature_jac_update_freq(self):
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.add_subsystem('obj_cmp', ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+
+        model.add_subsystem('con_cmp1', ExecComp('con1 = 3.16 - y1'), promotes=['con1', 'y1'])
+        model.add_subsystem('con_cmp2', ExecComp('con2 = y2 - 24.0'), promotes=['con2', 'y2'])
+
+        model.linear_solver = DirectSolver()
+
+        newton = model.nonlinear_solver = NewtonSolver()
+        newton.options['maxiter'] = 20
+        newton.options['jac_update_freq'] = 4
+
+        prob.setup()
+
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+    def test_feature_eisenstat_walker(self):
+        from openmdao.api import Problem, NewtonSolver, LinearBlockGS
+        from openmdao.test_suite.components.double_sellar import DoubleSellar
+
+        prob = Problem()
+        model = prob.model = DoubleSellar()
+
+        model.linear_solver = LinearBlockGS()
+        model.linear_solver.options['maxiter'] = 100
+
+        newton = model.nonlinear_solver = NewtonSolver()
+        newton.options['maxiter'] = 20
+        newton.options['eisenstat_walker'] = True
+
+        prob.setup()
+
+        prob.run_model()
+
+        assert_rel_error(self, prob['g1.y1'], 0.64, .00001)
+        assert_rel_error(self, prob['g1.y2'], 0.80, .00001)
+
     def test_feature_err_on_maxiter(self):
 
         prob = Problem()
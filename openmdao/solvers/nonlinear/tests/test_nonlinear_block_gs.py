@@ -157,6 +157,139 @@ class TestNLBGaussSeidel(unittest.TestCase):
         assert_rel_error(self, prob['y1'], 25.5882856302, .00001)
         assert_rel_error(self, prob['y2'], 12.05848819, .00001)
 
+    def test_feature_acceleration(self):
+
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.add_subsystem('obj_cmp', ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                               z=np.array([0.0, 0.0]), x=0.0),
+                           promotes=['obj', 'x', 'z', 'y1', 'y2'])
+
+        model.add_subsystem('con_cmp1', ExecComp('con1 = 3.16 - y1'), promotes=['con1', 'y1'])
+        model.add_subsystem('con_cmp2', ExecComp('con2 = y2 - 24.0'), promotes=['con2', 'y2'])
+
+        nlgbs = prob.model.nonlinear_solver = NonlinearBlockGS()
+        nlgbs.options['acceleration'] = 'anderson'
+
+        prob.setup()
+
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+    def _tight_cycle(self, **options):
+        # A cycle whose plain fixed point iteration contracts very slowly.
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('c1', ExecComp('y1 = 1.0 - 0.95*y2 + 0.01*y2**2'), promotes=['*'])
+        model.add_subsystem('c2', ExecComp('y2 = y1'), promotes=['*'])
+        model.nonlinear_solver = NonlinearBlockGS(maxiter=500, **options)
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 0.51417629, 1e-6)
+        assert_rel_error(self, prob['y2'], 0.51417629, 1e-6)
+
+        return model.nonlinear_solver._iter_count
+
+    def test_acceleration(self):
+        self.assertGreater(self._tight_cycle(), 300)
+        self.assertLess(self._tight_cycle(acceleration='aitken'), 10)
+        self.assertLess(self._tight_cycle(acceleration='anderson'), 10)
+        self.assertLess(self._tight_cycle(acceleration='anderson', anderson_depth=1), 10)
+
+        # the relaxation factor stays within its limits
+        self.assertLess(self._tight_cycle(acceleration='aitken', aitken_max_factor=0.6,
+                                          aitken_initial_factor=0.6), 50)
+
+        # a zero initial factor is raised to the lower limit, so that the iteration moves
+        self.assertLess(self._tight_cycle(acceleration='aitken', aitken_initial_factor=0.0), 10)
+
+    def test_anderson_bounded_history(self):
+        prob = Problem()
+        prob.model = SellarDerivatives(nonlinear_solver=NonlinearBlockGS(acceleration='anderson',
+                                                                         anderson_depth=2))
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        nlgbs = prob.model.nonlinear_solver
+        self.assertEqual(len(nlgbs._hist_ddelta), 2)
+        self.assertEqual(len(nlgbs._hist_doutputs), 2)
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+    def test_acceleration_complex_step(self):
+        # The imaginary part of the outputs must converge to the derivatives, so complex step
+        # totals agree with finite difference ones whichever acceleration is used.
+        for acceleration in ('aitken', 'anderson'):
+            totals = {}
+            for method, options in (('fd', {'form': 'central'}), ('cs', {})):
+                prob = Problem()
+                prob.model = SellarDerivatives(
+                    nonlinear_solver=NonlinearBlockGS(acceleration=acceleration, atol=1e-12,
+                                                      rtol=1e-12, maxiter=100))
+                prob.model.approx_total_derivs(method=method, **options)
+                prob.setup(check=False, force_alloc_complex=True)
+                prob.set_solver_print(level=0)
+
+                # Complex step starts from the unconverged point, so that the solver iterates on
+                # the real and imaginary parts together.
+                if method == 'fd':
+                    prob.run_model()
+
+                totals[method] = prob.compute_total_derivs(of=['obj', 'con1', 'con2'],
+                                                           wrt=['x', 'z'])
+
+            for key, J in totals['cs'].items():
+                assert_rel_error(self, J, totals['fd'][key], 1e-5)
+
+    def test_skip_unchanged(self):
+        # A feed-forward branch only has to run in the first sweep.
+        counts = {}
+        for skip in (False, True):
+            prob = Problem()
+            model = prob.model
+
+            model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+            model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+            model.add_subsystem('py', IndepVarComp('y2', 3.0))
+            pre = model.add_subsystem('pre', SellarDis1withDerivatives(),
+                                      promotes_inputs=['x', 'z'])
+            model.connect('py.y2', 'pre.y2')
+
+            d1 = model.add_subsystem('d1', SellarDis1withDerivatives(),
+                                     promotes=['x', 'z', 'y1', 'y2'])
+            model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+            model.nonlinear_solver = NonlinearBlockGS(skip_unchanged=skip)
+
+            prob.setup(check=False)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+            assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+            assert_rel_error(self, prob['pre.y1'], 27.4, 1e-15)
+
+            counts[skip] = (pre.execution_count, d1.execution_count,
+                            model.nonlinear_solver._iter_count)
+
+        # The coupled components are solved in every sweep either way.
+        self.assertEqual(counts[True][1], counts[False][1])
+        self.assertEqual(counts[False][0] - counts[True][0], counts[True][2] - 1)
+
     def test_sellar(self):
         # Basic sellar test.
 
@@ -1,13 +1,38 @@
 """Test the Nonlinear Block Jacobi solver. """
 
+import os
+import threading
+import time
 import unittest
 
+from shutil import rmtree
+from tempfile import mkdtemp
+
 import numpy as np
 
-from openmdao.api import Problem, Group, IndepVarComp, ExecComp, LinearBlockGS
+from openmdao.api import Problem, Group, IndepVarComp, ExecComp, LinearBlockGS, \
+    ExplicitComponent, SqliteRecorder, AssembledJacobian
 from openmdao.devtools.testutil import assert_rel_error
 from openmdao.solvers.nonlinear.nonlinear_block_jac import NonlinearBlockJac
+from openmdao.recorders.recording_iteration_stack import get_formatted_iteration_coordinate
 from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives
+from openmdao.utils import thread_utils
+
+
+class SlowComp(ExplicitComponent):
+    """Component that releases the GIL while it computes, and logs where it ran."""
+
+    def initialize(self):
+        self.log = []
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('y', 1.0)
+
+    def compute(self, inputs, outputs):
+        self.log.append((threading.current_thread().name, get_formatted_iteration_coordinate()))
+        time.sleep(0.01)
+        outputs['y'] = 2.0 * inputs['x']
 
 
 class TestNLBlockJacobi(unittest.TestCase):
@@ -40,6 +65,107 @@ class TestNLBlockJacobi(unittest.TestCase):
         assert_rel_error(self, prob['y1'], 25.58830273, .00001)
         assert_rel_error(self, prob['y2'], 12.05848819, .00001)
 
+    def _slow_comps_problem(self, names, grouped=False):
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('px', IndepVarComp('x', 3.0))
+        comps = {}
+        for name in names:
+            if grouped:
+                sub = model.add_subsystem('sub_' + name, Group())
+                comps[name] = sub.add_subsystem(name, SlowComp())
+                model.connect('px.x', 'sub_%s.%s.x' % (name, name))
+            else:
+                comps[name] = model.add_subsystem(name, SlowComp())
+                model.connect('px.x', name + '.x')
+
+        model.nonlinear_solver = NonlinearBlockJac(num_threads=4)
+
+        return prob, comps
+
+    def test_num_threads(self):
+        names = ['c%d' % i for i in range(4)]
+        prob, comps = self._slow_comps_problem(names)
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        threads = set()
+        for name in names:
+            assert_rel_error(self, prob[name + '.y'], 6.0, 1e-15)
+
+            for thread, coord in comps[name].log:
+                if 'NonlinearBlockJac' in coord:
+                    # Each worker thread starts from the iteration coordinate of the solver.
+                    self.assertTrue(coord.rsplit('|', 1)[0].endswith(
+                        'root._solve_nonlinear|0|NonlinearBlockJac|0|%s._solve_nonlinear' % name))
+                    threads.add(thread)
+
+        self.assertTrue(len(threads) > 1)
+
+    def test_num_threads_serial_fallback(self):
+        names = ['c%d' % i for i in range(4)]
+        tempdir = mkdtemp()
+        try:
+            for case in ('iprint', 'recorder', 'assembled_jac'):
+                # The subgroups' solvers print when iprint is left on.
+                prob, comps = self._slow_comps_problem(names, grouped=(case == 'iprint'))
+                if case == 'recorder':
+                    recorder = SqliteRecorder(os.path.join(tempdir, 'cases.sql'))
+                    comps['c2'].add_recorder(recorder)
+                elif case == 'assembled_jac':
+                    prob.model.jacobian = AssembledJacobian()
+
+                prob.setup(check=False)
+                if case != 'iprint':
+                    prob.set_solver_print(level=0)
+                prob.run_model()
+
+                threads = set()
+                for name in names:
+                    assert_rel_error(self, prob[comps[name].pathname + '.y'], 6.0, 1e-15)
+                    threads.update(thread for thread, coord in comps[name].log)
+
+                # Shared printing, recording or jacobian state makes the subsystems run serially.
+                self.assertEqual(threads, set([threading.current_thread().name]), case)
+
+                prob.cleanup()
+        finally:
+            rmtree(tempdir)
+
+    def test_cleanup_closes_thread_pool(self):
+        prob, comps = self._slow_comps_problem(['c%d' % i for i in range(4)])
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        self.assertTrue(thread_utils._thread_pools)
+
+        prob.cleanup()
+        self.assertFalse(thread_utils._thread_pools)
+
+    def test_num_threads_sellar(self):
+        prob = Problem()
+        model = prob.model = Group()
+
+        model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.linear_solver = LinearBlockGS()
+        model.nonlinear_solver = NonlinearBlockJac(num_threads=2, maxiter=50)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
     def test_feature_maxiter(self):
 
         prob = Problem()
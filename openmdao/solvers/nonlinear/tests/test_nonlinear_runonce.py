@@ -2,10 +2,14 @@
 
 import unittest
 
+import numpy as np
+
 from openmdao.api import Problem, ScipyIterativeSolver, IndepVarComp, Group
 from openmdao.devtools.testutil import assert_rel_error
 from openmdao.solvers.nonlinear.nonlinear_runonce import NonLinearRunOnce
 from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
+     SellarDis2withDerivatives
 from openmdao.test_suite.groups.parallel_groups import ConvergeDivergeGroups
 
 
@@ -32,6 +36,38 @@ class TestNonLinearRunOnceSolver(unittest.TestCase):
         # Make sure value is fine.
         assert_rel_error(self, prob['c7.y1'], -102.7, 1e-6)
 
+    def test_skip_unchanged(self):
+        prob = Problem()
+        model = prob.model
+
+        model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+        model.add_subsystem('py', IndepVarComp('y2', 3.0), promotes=['y2'])
+        d1 = model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        d2 = model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1'])
+
+        model.nonlinear_solver = NonLinearRunOnce(skip_unchanged=True)
+
+        prob.setup(check=False)
+        prob.run_model()
+        counts = (d1.execution_count, d2.execution_count)
+        assert_rel_error(self, prob['y1'], 27.4, 1e-10)
+
+        # Nothing changed, so nothing runs.
+        prob.run_model()
+        self.assertEqual((d1.execution_count, d2.execution_count), counts)
+
+        # Only the components downstream of the change run.
+        prob['y2'] = 2.0
+        prob.run_model()
+        self.assertEqual((d1.execution_count, d2.execution_count),
+                         (counts[0] + 1, counts[1] + 1))
+        assert_rel_error(self, prob['y1'], 27.6, 1e-10)
+
+        prob['z'] = np.array([5.0, 3.0])
+        prob.run_model()
+        assert_rel_error(self, prob['y1'], 28.6, 1e-10)
+
     def test_feature_solver(self):
 
         prob = Problem()
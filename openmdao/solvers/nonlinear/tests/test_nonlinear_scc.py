@@ -0,0 +1,118 @@
+"""Test the NonlinearSCC solver."""
+
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, Group, IndepVarComp, ExecComp, NonlinearBlockGS, \
+    NonlinearSCC, NewtonSolver, DirectSolver
+from openmdao.devtools.testutil import assert_rel_error
+from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
+    SellarDis2withDerivatives
+
+
+def _add_sellar_out_of_order(model, cycle_group=None):
+    """Add the Sellar problem to a model, with the subsystems declared against the data flow."""
+    model.add_subsystem('obj_cmp', ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                            z=np.array([0.0, 0.0]), x=0.0),
+                        promotes=['obj', 'x', 'z', 'y1', 'y2'])
+    model.add_subsystem('con_cmp1', ExecComp('con1 = 3.16 - y1'), promotes=['con1', 'y1'])
+
+    parent = model
+    if cycle_group is not None:
+        parent = model.add_subsystem('cycle', cycle_group, promotes=['*'])
+    parent.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+    model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+    parent.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+
+    model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+
+class TestNonlinearSCC(unittest.TestCase):
+
+    def test_feature_basic(self):
+        prob = Problem()
+        model = prob.model
+
+        model.add_subsystem('obj_cmp', ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+        model.add_subsystem('px', IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('pz', IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        model.nonlinear_solver = NonlinearSCC()
+
+        prob.setup()
+        prob.run_model()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+        assert_rel_error(self, prob['obj'], 28.58830817, .00001)
+
+    def test_blocks(self):
+        prob = Problem()
+        model = prob.model
+        _add_sellar_out_of_order(model)
+        model.nonlinear_solver = NonlinearSCC()
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        names = [s.name for s in model._subsystems_allprocs]
+        blocks = [[names[i] for i in block] for block in model.nonlinear_solver._blocks]
+        self.assertEqual(blocks, [['px'], ['pz'], ['d2', 'd1'], ['obj_cmp'], ['con_cmp1']])
+
+        # A single pass is enough, since the cycle is converged before its dependents run.
+        self.assertEqual(model.nonlinear_solver._iter_count, 1)
+        self.assertEqual(len(model.nonlinear_solver._cycle_iter_counts), 1)
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['con1'], 3.16 - 25.58830273, .00001)
+
+        # Block Gauss-Seidel over the same model in declaration order needs many passes.
+        prob = Problem()
+        _add_sellar_out_of_order(prob.model)
+        prob.model.nonlinear_solver = NonlinearBlockGS()
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        self.assertGreater(prob.model.nonlinear_solver._iter_count, 3)
+
+    def test_cycle_group_solver(self):
+        # A cycle in its own group is solved with the group's solver.
+        prob = Problem()
+        model = prob.model
+        cycle = Group()
+        cycle.nonlinear_solver = NewtonSolver()
+        cycle.linear_solver = DirectSolver()
+        _add_sellar_out_of_order(model, cycle)
+        model.nonlinear_solver = NonlinearSCC()
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        self.assertEqual(model.nonlinear_solver._cycle_iter_counts, [])
+        self.assertEqual(model.nonlinear_solver._iter_count, 1)
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+    def test_cycle_maxiter(self):
+        prob = Problem()
+        model = prob.model
+        _add_sellar_out_of_order(model)
+        model.nonlinear_solver = NonlinearSCC(cycle_maxiter=2, maxiter=1)
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        self.assertEqual(model.nonlinear_solver._cycle_iter_counts, [2])
+        self.assertGreater(abs(prob['y1'][0] - 25.58830273), 1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
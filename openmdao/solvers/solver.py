@@ -3,13 +3,18 @@
 from __future__ import division, print_function
 
 import os
+from contextlib import contextmanager
+from timeit import default_timer
 
 import numpy as np
 
 
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.jacobians.assembled_jacobian import AssembledJacobian
+from openmdao.recorders.recording_iteration_stack import recording_iteration_stack
+from openmdao.recorders.recording_manager import RecordingManager
 from openmdao.utils.options_dictionary import OptionsDictionary
+from openmdao.utils.record_util import create_local_meta
 
 
 class SolverInfo(object):
@@ -29,6 +34,142 @@ class SolverInfo(object):
         self.prefix = ""
 
 
+class SolverTelemetry(object):
+    """
+    Timing and iteration statistics of a solver, accumulated over all of its solves.
+
+    Times are wall times in seconds. The time of a phase does not include the time of the phases
+    of the same solver nested in it, so the linear solves of a Newton iteration are not counted
+    as execution. The time of other solvers run within a phase is included in it.
+
+    Attributes
+    ----------
+    num_solves : int
+        Number of times the solver was run.
+    num_iterations : int
+        Total number of iterations.
+    num_linear_iterations : int
+        Total number of linear solver iterations performed within the iterations.
+    linear_iterations : [int, ...]
+        Number of linear solver iterations performed in each iteration of the latest solve.
+    time : float
+        Total time spent in the solver.
+    phase_times : dict
+        Time spent in each phase: 'initialize', 'execute', 'norm', 'linearize', and
+        'linear_solve'.
+    _solve_start : float or None
+        Start time of the solve in progress.
+    _phase_stack : [[str, float, float], ...]
+        Name, start time, and time spent in nested phases of each phase in progress.
+    """
+
+    PHASES = ('initialize', 'execute', 'norm', 'linearize', 'linear_solve')
+
+    def __init__(self):
+        """
+        Initialize all attributes.
+        """
+        self.num_solves = 0
+        self.num_iterations = 0
+        self.num_linear_iterations = 0
+        self.linear_iterations = []
+        self.time = 0.0
+        self.phase_times = {phase: 0.0 for phase in self.PHASES}
+        self._solve_start = None
+        self._phase_stack = []
+
+    def reset(self):
+        """
+        Set all statistics to zero.
+        """
+        self.__init__()
+
+    @contextmanager
+    def _solve(self, solver):
+        """
+        Time the code inside the 'with' block as a solve of the given solver.
+
+        Solves nested in another solve of the same solver are counted as part of it.
+
+        Parameters
+        ----------
+        solver : <Solver>
+            The solver that owns this object, which provides the iteration count.
+
+        Yields
+        ------
+        None
+        """
+        if self._solve_start is not None:
+            yield
+            return
+
+        self.linear_iterations = []
+        self._solve_start = default_timer()
+        try:
+            yield
+        finally:
+            self.time += default_timer() - self._solve_start
+            self._solve_start = None
+            self.num_solves += 1
+            self.num_iterations += solver._iter_count
+
+    @contextmanager
+    def _phase(self, name):
+        """
+        Time the code inside the 'with' block as the given phase.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+
+        Yields
+        ------
+        None
+        """
+        stack = self._phase_stack
+        stack.append([name, default_timer(), 0.0])
+        try:
+            yield
+        finally:
+            name, start, nested = stack.pop()
+            elapsed = default_timer() - start
+            self.phase_times[name] += elapsed - nested
+            if stack:
+                stack[-1][2] += elapsed
+
+    def _add_linear_iterations(self, niter):
+        """
+        Record the number of linear solver iterations of the current iteration.
+
+        Parameters
+        ----------
+        niter : int
+            Number of linear iterations.
+        """
+        self.linear_iterations.append(niter)
+        self.num_linear_iterations += niter
+
+    def get_summary(self):
+        """
+        Return the statistics as a dictionary.
+
+        Returns
+        -------
+        dict
+            The statistics, with the phase times under 'phase_times'.
+        """
+        return {
+            'num_solves': self.num_solves,
+            'num_iterations': self.num_iterations,
+            'num_linear_iterations': self.num_linear_iterations,
+            'linear_iterations': list(self.linear_iterations),
+            'time': self.time,
+            'phase_times': dict(self.phase_times),
+        }
+
+
 class Solver(object):
     """
     Base solver class.
@@ -55,6 +196,10 @@ class Solver(object):
     supports : <OptionsDictionary>
         Options dictionary describing what features are supported by this
         solver.
+    _rec_mgr : <RecordingManager>
+        Object that manages all recorders added to this solver.
+    _telemetry : <SolverTelemetry>
+        Timing and iteration statistics of this solver.
     """
 
     SOLVER = 'base_solver'
@@ -75,6 +220,9 @@ class Solver(object):
         self._mode = 'fwd'
         self._iter_count = 0
 
+        self._rec_mgr = RecordingManager()
+        self._telemetry = SolverTelemetry()
+
         self.options = OptionsDictionary()
         self.options.declare('maxiter', type_=int, default=10,
                              desc='maximum number of iterations')
@@ -116,6 +264,66 @@ class Solver(object):
         self._system = system
         self._depth = depth
 
+        self._rec_mgr.startup(self)
+        self._rec_mgr.record_metadata(self)
+
+    def _get_subsolvers(self):
+        """
+        Return the solvers nested in this solver, such as a linesearch or a preconditioner.
+
+        Returns
+        -------
+        [(str, <Solver>), ...]
+            Attribute name and instance of each nested solver.
+        """
+        subsolvers = []
+        for name in ('linear_solver', 'linesearch', 'precon'):
+            solver = getattr(self, name, None)
+            if isinstance(solver, Solver):
+                subsolvers.append((name, solver))
+        return subsolvers
+
+    def add_recorder(self, recorder):
+        """
+        Add a recorder to the solver.
+
+        Parameters
+        ----------
+        recorder : <BaseRecorder>
+           A recorder instance.
+        """
+        self._rec_mgr.append(recorder)
+
+    def record_iteration(self, **kwargs):
+        """
+        Record an iteration of the current Solver.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Keyword arguments (used for abs and rel error).
+        """
+        if not self._rec_mgr._recorders:
+            return
+
+        metadata = create_local_meta(self.SOLVER)
+        self._rec_mgr.record_iteration(self, metadata, telemetry=self._telemetry.get_summary(),
+                                       **kwargs)
+
+    def get_telemetry(self):
+        """
+        Return the timing and iteration statistics of this solver.
+
+        Returns
+        -------
+        dict
+            Number of solves, iterations and linear iterations, total time, and time spent in
+            each phase ('phase_times').
+        """
+        summary = self._telemetry.get_summary()
+        summary['solver'] = self.SOLVER
+        return summary
+
     def _set_solver_print(self, level=2, type_='all'):
         """
         Control printing for solvers and subsolvers in the model.
@@ -162,6 +370,17 @@ class Solver(object):
         """
         pass
 
+    def _get_rtol(self):
+        """
+        Return the relative tolerance of the current solve.
+
+        Returns
+        -------
+        float
+            Relative error tolerance.
+        """
+        return self.options['rtol']
+
     def _run_iterator(self):
         """
         Run the iterative solver.
@@ -177,43 +396,50 @@ class Solver(object):
         """
         maxiter = self.options['maxiter']
         atol = self.options['atol']
-        rtol = self.options['rtol']
+        rtol = self._get_rtol()
         iprint = self.options['iprint']
 
-        self._mpi_print_header()
+        telemetry = self._telemetry
 
-        self._iter_count = 0
-        norm0, norm = self._iter_initialize()
-        self._mpi_print(self._iter_count, norm, norm / norm0)
+        # Nested in the solve that is already timed, unless a subclass overrides solve itself.
+        with telemetry._solve(self):
+            self._mpi_print_header()
 
-        while self._iter_count < maxiter and \
-                norm > atol and norm / norm0 > rtol:
-            self._iter_execute()
-            self._iter_count += 1
-            norm = self._iter_get_norm()
+            self._iter_count = 0
+            with telemetry._phase('initialize'):
+                norm0, norm = self._iter_initialize()
             self._mpi_print(self._iter_count, norm, norm / norm0)
 
-        fail = (np.isinf(norm) or np.isnan(norm) or
-                (norm > atol and norm / norm0 > rtol))
-
-        if self._system.comm.rank == 0 or os.environ.get('USE_PROC_FILES'):
-            if fail:
-                if iprint > -1:
-                    msg = ' Failed to Converge in {} iterations'.format(self._iter_count)
-                    print(self._solver_info.prefix + self.SOLVER + msg)
-
-                # Raise AnalysisError if requested.
-                if self.options['err_on_maxiter']:
-                    msg = "Solver '{}' on system '{}' failed to converge."
-                    raise AnalysisError(msg.format(self.SOLVER, self._system.pathname))
-
-            elif iprint == 1:
-                print(self._solver_info.prefix + self.SOLVER +
-                      ' Converged in {} iterations'.format(self._iter_count))
-            elif iprint == 2:
-                print(self._solver_info.prefix + self.SOLVER + ' Converged')
-
-        return fail, norm, norm / norm0
+            while self._iter_count < maxiter and \
+                    norm > atol and norm / norm0 > rtol:
+                with telemetry._phase('execute'):
+                    self._iter_execute()
+                self._iter_count += 1
+                with telemetry._phase('norm'):
+                    norm = self._iter_get_norm()
+                self._mpi_print(self._iter_count, norm, norm / norm0)
+
+            fail = (np.isinf(norm) or np.isnan(norm) or
+                    (norm > atol and norm / norm0 > rtol))
+
+            if self._system.comm.rank == 0 or os.environ.get('USE_PROC_FILES'):
+                if fail:
+                    if iprint > -1:
+                        msg = ' Failed to Converge in {} iterations'.format(self._iter_count)
+                        print(self._solver_info.prefix + self.SOLVER + msg)
+
+                    # Raise AnalysisError if requested.
+                    if self.options['err_on_maxiter']:
+                        msg = "Solver '{}' on system '{}' failed to converge."
+                        raise AnalysisError(msg.format(self.SOLVER, self._system.pathname))
+
+                elif iprint == 1:
+                    print(self._solver_info.prefix + self.SOLVER +
+                          ' Converged in {} iterations'.format(self._iter_count))
+                elif iprint == 2:
+                    print(self._solver_info.prefix + self.SOLVER + ' Converged')
+
+            return fail, norm, norm / norm0
 
     def _iter_initialize(self):
         """
@@ -298,6 +524,22 @@ class NonlinearSolver(Solver):
         """
         Run the solver.
 
+        Returns
+        -------
+        boolean
+            Failure flag; True if failed to converge, False is successful.
+        float
+            absolute error.
+        float
+            relative error.
+        """
+        with self._telemetry._solve(self):
+            return self._solve()
+
+    def _solve(self):
+        """
+        Run the solver; overridden by solvers that do not use the iteration loop.
+
         Returns
         -------
         boolean
@@ -339,16 +581,113 @@ class NonlinearSolver(Solver):
         self._system._apply_nonlinear()
         return self._system._residuals.get_norm()
 
+    def _get_norm_without_approx(self):
+        """
+        Return the norm of the residual, computed without the approximated Jacobian of the system.
+
+        Returns
+        -------
+        float
+            norm.
+        """
+        recording_iteration_stack.append(('_iter_get_norm', 0))
+
+        system = self._system
+
+        # Disable local fd
+        approx_status = system._owns_approx_jac
+        system._owns_approx_jac = False
+
+        system._apply_nonlinear()
+
+        recording_iteration_stack.pop()
+
+        # Enable local fd
+        system._owns_approx_jac = approx_status
+
+        return system._residuals.get_norm()
+
+    def _mpi_print_header(self):
+        """
+        Print header text before solving.
+        """
+        if (self.options['iprint'] > 0 and self._system.comm.rank == 0):
+
+            pathname = self._system.pathname
+            if pathname:
+                nchar = len(pathname)
+                prefix = self._solver_info.prefix
+                header = prefix + "\n"
+                header += prefix + nchar * "=" + "\n"
+                header += prefix + pathname + "\n"
+                header += prefix + nchar * "="
+                print(header)
+
 
 class LinearSolver(Solver):
     """
     Base class for linear solvers.
+
+    Attributes
+    ----------
+    _forcing_term : float or None
+        Relative tolerance of the current solve set by a NewtonSolver using Eisenstat-Walker
+        forcing terms, which takes the place of the rtol option when not None.
     """
 
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(LinearSolver, self).__init__(**kwargs)
+
+        self._forcing_term = None
+
+    def _get_rtol(self):
+        """
+        Return the relative tolerance of the current solve.
+
+        Returns
+        -------
+        float
+            Relative error tolerance.
+        """
+        if self._forcing_term is not None:
+            return self._forcing_term
+        return self.options['rtol']
+
     def solve(self, vec_names, mode):
         """
         Run the solver.
 
+        Parameters
+        ----------
+        vec_names : [str, ...]
+            list of names of the right-hand-side vectors.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        boolean
+            Failure flag; True if failed to converge, False is successful.
+        float
+            initial error.
+        float
+            error at the first iteration.
+        """
+        with self._telemetry._solve(self):
+            return self._solve(vec_names, mode)
+
+    def _solve(self, vec_names, mode):
+        """
+        Run the solver; overridden by solvers that do not use the iteration loop.
+
         Parameters
         ----------
         vec_names : [str, ...]
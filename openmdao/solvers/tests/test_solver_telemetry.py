@@ -0,0 +1,174 @@
+"""Test the timing and iteration statistics of the solvers."""
+
+import unittest
+
+from openmdao.api import Problem, NewtonSolver, DirectSolver, ScipyIterativeSolver, \
+     ArmijoGoldsteinLS, LinearBlockGS, NonlinearBlockGS
+from openmdao.devtools.testutil import assert_rel_error
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.test_suite.components.double_sellar import DoubleSellar
+
+
+class TestSolverTelemetry(unittest.TestCase):
+
+    def test_newton_direct(self):
+        prob = Problem(model=SellarDerivatives(nonlinear_solver=NewtonSolver(),
+                                               linear_solver=DirectSolver()))
+        model = prob.model
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        newton = model.nonlinear_solver
+        stats = newton.get_telemetry()
+        self.assertEqual(stats['solver'], 'NL: Newton')
+        self.assertEqual(stats['num_solves'], 1)
+        self.assertEqual(stats['num_iterations'], newton._iter_count)
+        self.assertGreater(stats['num_iterations'], 0)
+
+        # The direct solver is run once per Newton iteration, and takes no iterations.
+        self.assertEqual(stats['linear_iterations'], [0] * stats['num_iterations'])
+        self.assertEqual(stats['num_linear_iterations'], 0)
+
+        phase_times = stats['phase_times']
+        for phase in ('execute', 'norm', 'linearize', 'linear_solve'):
+            self.assertGreater(phase_times[phase], 0.0)
+        self.assertLessEqual(sum(phase_times.values()), stats['time'])
+
+        direct = model.linear_solver.get_telemetry()
+        self.assertEqual(direct['num_solves'], stats['num_iterations'])
+        self.assertGreater(direct['phase_times']['linearize'], 0.0)
+
+        # statistics accumulate over runs until they are reset
+        prob['x'] = 2.0
+        prob.run_model()
+        self.assertEqual(newton.get_telemetry()['num_solves'], 2)
+
+        model.reset_solver_telemetry()
+        stats = newton.get_telemetry()
+        self.assertEqual(stats['num_solves'], 0)
+        self.assertEqual(stats['time'], 0.0)
+        self.assertEqual(stats['phase_times']['execute'], 0.0)
+
+    def test_linear_iterations(self):
+        newton = NewtonSolver()
+        newton.linear_solver = ScipyIterativeSolver()
+
+        prob = Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                               linear_solver=LinearBlockGS()))
+        model = prob.model
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        stats = newton.get_telemetry()
+        gmres = newton.linear_solver.get_telemetry()
+
+        self.assertEqual(len(stats['linear_iterations']), stats['num_iterations'])
+        self.assertGreater(stats['num_linear_iterations'], 0)
+        self.assertEqual(stats['num_linear_iterations'], sum(stats['linear_iterations']))
+        self.assertEqual(gmres['num_solves'], stats['num_iterations'])
+
+        # The linear block Gauss-Seidel solver is only used for derivatives.
+        self.assertEqual(model.linear_solver.get_telemetry()['num_solves'], 0)
+        prob.compute_total_derivs(of=['obj'], wrt=['x'])
+        self.assertEqual(model.linear_solver.get_telemetry()['num_solves'], 1)
+
+    def test_get_solver_telemetry(self):
+        prob = Problem(model=DoubleSellar())
+        model = prob.model
+
+        g1 = model.get_subsystem('g1')
+        g1.nonlinear_solver = NewtonSolver()
+        g1.nonlinear_solver.linesearch = ArmijoGoldsteinLS()
+        g1.linear_solver = DirectSolver()
+
+        model.nonlinear_solver = NonlinearBlockGS(maxiter=20)
+        model.linear_solver = ScipyIterativeSolver()
+        model.linear_solver.precon = LinearBlockGS()
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        telemetry = prob.get_solver_telemetry()
+
+        self.assertIn(('', 'nonlinear_solver'), telemetry)
+        self.assertIn(('', 'linear_solver.precon'), telemetry)
+        self.assertIn(('g1', 'nonlinear_solver.linesearch'), telemetry)
+        self.assertIn(('g2', 'linear_solver'), telemetry)
+
+        # the linear solver of g1 is also used by its Newton solver, but only shows up once
+        self.assertIn(('g1', 'linear_solver'), telemetry)
+        self.assertNotIn(('g1', 'nonlinear_solver.linear_solver'), telemetry)
+
+        self.assertEqual(telemetry['g1', 'nonlinear_solver']['solver'], 'NL: Newton')
+        self.assertEqual(telemetry['g1', 'nonlinear_solver.linesearch']['solver'], 'LS: AG')
+
+        # g1 is run in each Gauss-Seidel iteration of the model
+        self.assertEqual(telemetry['g1', 'nonlinear_solver']['num_solves'],
+                         telemetry['', 'nonlinear_solver']['num_iterations'])
+
+        # the time of the nested solvers is included in the time of the model's solver
+        self.assertGreaterEqual(telemetry['', 'nonlinear_solver']['time'],
+                                telemetry['g1', 'nonlinear_solver']['time'] +
+                                telemetry['g2', 'nonlinear_solver']['time'])
+
+        sub_telemetry = g1.get_solver_telemetry()
+        self.assertEqual(set(key[0] for key in sub_telemetry), set(['g1']))
+
+    def test_overridden_solve(self):
+
+        class CustomSolver(NonlinearBlockGS):
+
+            def solve(self):
+                return self._run_iterator()
+
+        prob = Problem(model=SellarDerivatives(nonlinear_solver=CustomSolver(maxiter=20),
+                                               linear_solver=LinearBlockGS()))
+
+        prob.setup(check=False)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        solver = prob.model.nonlinear_solver
+        stats = solver.get_telemetry()
+        self.assertEqual(stats['num_solves'], 1)
+        self.assertEqual(stats['num_iterations'], solver._iter_count)
+        self.assertGreater(stats['num_iterations'], 0)
+        self.assertGreater(stats['phase_times']['execute'], 0.0)
+        self.assertLessEqual(sum(stats['phase_times'].values()), stats['time'])
+
+
+class TestSolverTelemetryFeature(unittest.TestCase):
+
+    def test_feature_solver_telemetry(self):
+        from openmdao.api import Problem, NewtonSolver, ScipyIterativeSolver, DirectSolver
+        from openmdao.test_suite.components.sellar import SellarDerivatives
+
+        newton = NewtonSolver()
+        newton.linear_solver = ScipyIterativeSolver()
+
+        prob = Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                               linear_solver=DirectSolver()))
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        telemetry = prob.get_solver_telemetry()
+
+        newton = telemetry['', 'nonlinear_solver']
+        print(newton['num_iterations'], newton['linear_iterations'])
+
+        for key in sorted(telemetry):
+            stats = telemetry[key]
+            print(key, stats['solver'], stats['num_solves'], stats['num_iterations'])
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -58,3 +58,26 @@ def convert_neg(arr, dim):
     """
     arr[arr < 0] += dim
     return arr
+
+
+def ravel_src_indices(src_indices, global_shape_out):
+    """
+    Convert multi-dimensional src_indices into flat indices into the source.
+
+    Parameters
+    ----------
+    src_indices : ndarray
+        Array of shape (..., ndim) where each entry along the last axis is an index
+        into the source array.
+    global_shape_out : tuple
+        Global shape of the source array.
+
+    Returns
+    -------
+    ndarray
+        The flat source indices, in the (C) order of the input entries.
+    """
+    cols = src_indices.reshape((-1, src_indices.shape[-1]))
+    dimidxs = [np.where(cols[:, i] < 0, cols[:, i] + dim, cols[:, i])
+               for i, dim in enumerate(global_shape_out)]
+    return np.ravel_multi_index(dimidxs, global_shape_out)
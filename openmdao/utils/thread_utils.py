@@ -0,0 +1,142 @@
+"""Utilities for running work on shared thread pools."""
+import threading
+from multiprocessing.pool import ThreadPool
+
+from openmdao.recorders.recording_iteration_stack import recording_iteration_stack
+
+# Thread pools shared by everything in the process, keyed by number of threads.
+_thread_pools = {}
+
+# Per-thread state; 'active' is set while a thread runs a task started by run_threaded.
+_worker_state = threading.local()
+
+
+def get_thread_pool(num_threads):
+    """
+    Return a shared thread pool with the given number of threads.
+
+    Parameters
+    ----------
+    num_threads : int
+        Number of threads in the pool.
+
+    Returns
+    -------
+    <ThreadPool>
+        The thread pool.
+    """
+    if num_threads not in _thread_pools:
+        _thread_pools[num_threads] = ThreadPool(num_threads)
+    return _thread_pools[num_threads]
+
+
+def close_thread_pools():
+    """
+    Close the shared thread pools and wait for their threads to exit.
+    """
+    for pool in _thread_pools.values():
+        pool.close()
+        pool.join()
+    _thread_pools.clear()
+
+
+def get_num_threads(system, num_threads):
+    """
+    Return the number of threads that the subsystems of a system can safely be run on.
+
+    The subsystems share the assembled jacobian of the system, the solver print prefix and the
+    recorders, none of which are thread safe. They run serially if the system has an assembled
+    jacobian, or if any system or solver below it records or any solver prints.
+
+    Parameters
+    ----------
+    system : <System>
+        System whose subsystems are to be run.
+    num_threads : int
+        Requested number of threads.
+
+    Returns
+    -------
+    int
+        Number of threads to use.
+    """
+    if num_threads <= 1 or system._owns_assembled_jac or system._views_assembled_jac:
+        return 1
+
+    for subsys in system.system_iter(recurse=True):
+        if subsys._rec_mgr._recorders:
+            return 1
+        for slot, solver in subsys._get_solvers():
+            if solver._rec_mgr._recorders or solver.options['iprint'] > 0:
+                return 1
+
+    return num_threads
+
+
+def in_worker_thread():
+    """
+    Return True if the current thread is running a task started by run_threaded.
+
+    Work started from such a task must not wait on a shared pool, since all of the pool's
+    threads may already be busy waiting themselves.
+
+    Returns
+    -------
+    bool
+        True if called from a worker task.
+    """
+    return getattr(_worker_state, 'active', False)
+
+
+def _run_task(args):
+    """
+    Run one task on a worker thread, starting from the caller's recording iteration stack.
+
+    Parameters
+    ----------
+    args : (function, object, list)
+        The function, its argument, and the recording iteration stack of the caller.
+
+    Returns
+    -------
+    object
+        The return value of the function.
+    """
+    func, item, stack = args
+    _worker_state.active = True
+    recording_iteration_stack.reset(stack)
+    try:
+        return func(item)
+    finally:
+        recording_iteration_stack.reset()
+        _worker_state.active = False
+
+
+def run_threaded(func, items, num_threads):
+    """
+    Call a function on each item, concurrently on a shared thread pool if requested.
+
+    The calls run serially if num_threads is 1, if there is only one item, or if this is called
+    from within another threaded task.
+
+    Parameters
+    ----------
+    func : function
+        Function that takes a single item.
+    items : iterable
+        Items to call the function on.
+    num_threads : int
+        Maximum number of concurrent calls.
+
+    Returns
+    -------
+    list
+        The return values, in the order of the items.
+    """
+    items = list(items)
+    if num_threads <= 1 or len(items) <= 1 or in_worker_thread():
+        return [func(item) for item in items]
+
+    stack = list(recording_iteration_stack)
+    return get_thread_pool(num_threads).map(_run_task, [(func, item, stack) for item in items],
+                                            chunksize=1)
@@ -4,7 +4,7 @@ from copy import deepcopy
 import numbers
 
 from six import iteritems, itervalues
-from six.moves import range, zip
+from six.moves import range
 
 import numpy as np
 
@@ -400,7 +400,9 @@ class DefaultVector(Vector):
                 data += i_val * vec._data[set_name] + r_val * vec._imag_data[set_name]
         else:
             for set_name, data in iteritems(self._data):
-                data += val * vec._data[set_name]
+                work = self._get_work_data(set_name)[0]
+                np.multiply(vec._data[set_name], val, out=work)
+                data += work
 
     def elem_mult(self, vec):
         """
@@ -464,9 +466,170 @@ class DefaultVector(Vector):
         """
         global_sum = 0
         for data in itervalues(self._data):
-            global_sum += np.sum(data**2)
+            global_sum += np.dot(data, data)
         return global_sum ** 0.5
 
+    def _get_work_data(self, set_name):
+        """
+        Return the scratch arrays of a varset, allocating them on first use.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the varset.
+
+        Returns
+        -------
+        (ndarray, ndarray, ndarray)
+            Two float arrays and one boolean array with the size of the data of the varset.
+        """
+        data = self._data[set_name]
+        work = self._work_data.get(set_name)
+        if work is None or work[0].shape != data.shape:
+            work = (np.empty_like(data), np.empty_like(data), np.empty(data.shape, dtype=bool))
+            self._work_data[set_name] = work
+        return work
+
+    def _get_bounds_violation(self, set_name, du, lower_bounds, upper_bounds):
+        """
+        Return the largest bound violation of a varset, relative to the step.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the varset.
+        du : <Vector>
+            Newton step.
+        lower_bounds : <Vector>
+            Lower bounds vector.
+        upper_bounds : <Vector>
+            Upper bounds vector.
+
+        Returns
+        -------
+        float
+            The step size that has to be taken back to satisfy the bounds, or 0 if they are.
+        """
+        u_data = self._data[set_name]
+        du_data = du._data[set_name]
+        ratio, abs_du, zero_du = self._get_work_data(set_name)
+
+        np.equal(du_data, 0.0, out=zero_du)
+        if zero_du.all():
+            return 0
+
+        np.abs(du_data, out=abs_du)
+        d_alpha = 0
+
+        # Entries that are not moved by the step can't be pulled back by backtracking.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.subtract(lower_bounds._data[set_name], u_data, out=ratio)
+            ratio /= abs_du
+            np.copyto(ratio, -np.inf, where=zero_du)
+            d_alpha = max(d_alpha, ratio.max())
+
+            np.subtract(u_data, upper_bounds._data[set_name], out=ratio)
+            ratio /= abs_du
+            np.copyto(ratio, -np.inf, where=zero_du)
+            d_alpha = max(d_alpha, ratio.max())
+
+        return d_alpha
+
+    def _enforce_bounds_set(self, set_name, du, alpha, lower_bounds, upper_bounds, wall):
+        """
+        Enforce lower/upper bounds on each scalar of a varset separately.
+
+        Parameters
+        ----------
+        set_name : str
+            Name of the varset.
+        du : <Vector>
+            Newton step; the backtracking is applied to this vector in-place.
+        alpha : float
+            step size.
+        lower_bounds : <Vector>
+            Lower bounds vector.
+        upper_bounds : <Vector>
+            Upper bounds vector.
+        wall : bool
+            If True, the step of the entries that hit a bound is set to zero so that the
+            backtracking follows the wall.
+        """
+        u_data = self._data[set_name]
+        du_data = du._data[set_name]
+        change_lower, change_upper, changed = self._get_work_data(set_name)
+
+        # If u > lower, we're just adding zero. Otherwise, we're adding
+        # the step required to get up to the lower bound.
+        np.maximum(u_data, lower_bounds._data[set_name], out=change_lower)
+        change_lower -= u_data
+        u_data += change_lower
+
+        # If u < upper, we're just adding zero. Otherwise, we're adding
+        # the step required to get down to the upper bound.
+        np.minimum(u_data, upper_bounds._data[set_name], out=change_upper)
+        change_upper -= u_data
+        u_data += change_upper
+
+        if wall:
+            # The entries of du at the bounds are set to zero, which makes the line search
+            # backtrack along the wall.
+            np.logical_or(change_lower, change_upper, out=changed)
+            np.copyto(du_data, 0.0, where=changed)
+        else:
+            # For du, we normalize by alpha since du eventually gets multiplied by alpha.
+            change_lower += change_upper
+            change_lower /= alpha
+            du_data += change_lower
+
+    def _add_scal_vec_bounded(self, alpha, du, lower_bounds, upper_bounds, bound_enforcement):
+        """
+        Add a step to this vector and enforce lower/upper bounds on the result.
+
+        This is equivalent to add_scal_vec followed by the _enforce_bounds_* method selected by
+        bound_enforcement, and modifies both self (u) and step (du) in-place. Each varset is
+        stepped and checked in a single pass, while its data is still in cache.
+
+        Parameters
+        ----------
+        alpha : float
+            step size.
+        du : <Vector>
+            Newton step; the backtracking is applied to this vector in-place.
+        lower_bounds : <Vector>
+            Lower bounds vector.
+        upper_bounds : <Vector>
+            Upper bounds vector.
+        bound_enforcement : str
+            'vector', 'scalar', or 'wall'.
+        """
+        if self._vector_info._under_complex_step:
+            self.add_scal_vec(alpha, du)
+            if bound_enforcement == 'vector':
+                self._enforce_bounds_vector(du, alpha, lower_bounds, upper_bounds)
+            elif bound_enforcement == 'scalar':
+                self._enforce_bounds_scalar(du, alpha, lower_bounds, upper_bounds)
+            elif bound_enforcement == 'wall':
+                self._enforce_bounds_wall(du, alpha, lower_bounds, upper_bounds)
+            return
+
+        d_alpha = 0
+        for set_name, u_data in iteritems(self._data):
+            work = self._get_work_data(set_name)[0]
+            np.multiply(du._data[set_name], alpha, out=work)
+            u_data += work
+
+            if bound_enforcement == 'vector':
+                d_alpha = max(d_alpha, self._get_bounds_violation(set_name, du, lower_bounds,
+                                                                  upper_bounds))
+            else:
+                self._enforce_bounds_set(set_name, du, alpha, lower_bounds, upper_bounds,
+                                         bound_enforcement == 'wall')
+
+        if d_alpha > 0:
+            self.add_scal_vec(-d_alpha, du)
+            du *= 1 - d_alpha / alpha
+
     def _enforce_bounds_vector(self, du, alpha, lower_bounds, upper_bounds):
         """
         Enforce lower/upper bounds, backtracking the entire vector together.
@@ -497,34 +660,22 @@ class DefaultVector(Vector):
 
         # Loop over varsets and find the largest amount a bound is violated
         # where positive means a bound is violated - i.e. the required d_alpha.
-        for u_data, du_data, lower_data, upper_data in zip(
-                u._data.values(), du._data.values(),
-                lower_bounds._data.values(), upper_bounds._data.values()):
-
-            mask = du_data != 0
-            if mask.any():
-                abs_du_mask = np.abs(du_data[mask])
-
-                # Check lower bound
-                max_d_alpha = np.amax((lower_data[mask] - u_data[mask]) / abs_du_mask)
-                d_alpha = max(d_alpha, max_d_alpha)
-
-                # Check upper bound
-                max_d_alpha = np.amax((u_data[mask] - upper_data[mask]) / abs_du_mask)
-                d_alpha = max(d_alpha, max_d_alpha)
+        for set_name in u._data:
+            d_alpha = max(d_alpha, u._get_bounds_violation(set_name, du, lower_bounds,
+                                                           upper_bounds))
 
         # d_alpha will not be negative because it was initialized to be 0
         # and we've only done max operations.
         # d_alpha will not be greater than alpha because the assumption is that
         # the original point was valid - i.e., no bounds were violated.
         # Therefore 0 <= d_alpha <= alpha.
+        if d_alpha > 0:
+            # We first update u to reflect the required change to du.
+            u.add_scal_vec(-d_alpha, du)
 
-        # We first update u to reflect the required change to du.
-        u.add_scal_vec(-d_alpha, du)
-
-        # At this point, we normalize d_alpha by alpha to figure out the relative
-        # amount that the du vector has to be reduced, then apply the reduction.
-        du *= 1 - d_alpha / alpha
+            # At this point, we normalize d_alpha by alpha to figure out the relative
+            # amount that the du vector has to be reduced, then apply the reduction.
+            du *= 1 - d_alpha / alpha
 
     def _enforce_bounds_scalar(self, du, alpha, lower_bounds, upper_bounds):
         """
@@ -543,33 +694,13 @@ class DefaultVector(Vector):
         upper_bounds : <Vector>
             Upper bounds vector.
         """
-        u = self
-
         # The assumption is that alpha * step has been added to this vector
         # just prior to this method being called. We are currently in the
         # initialization of a line search, and we're trying to ensure that
         # the initial step does not violate bounds. If it does, we modify
         # the step vector directly.
-
-        # Loop over varsets and enforce bounds on step in-place.
-        for u_data, du_data, lower_data, upper_data in zip(
-                u._data.values(), du._data.values(),
-                lower_bounds._data.values(), upper_bounds._data.values()):
-
-            # If u > lower, we're just adding zero. Otherwise, we're adding
-            # the step required to get up to the lower bound.
-            # For du, we normalize by alpha since du eventually gets
-            # multiplied by alpha.
-            change = np.maximum(u_data, lower_data) - u_data
-            u_data += change
-            du_data += change / alpha
-
-            # If u < upper, we're just adding zero. Otherwise, we're adding
-            # the step required to get down to the upper bound, but normalized
-            # by alpha since du eventually gets multiplied by alpha.
-            change = np.minimum(u_data, upper_data) - u_data
-            u_data += change
-            du_data += change / alpha
+        for set_name in self._data:
+            self._enforce_bounds_set(set_name, du, alpha, lower_bounds, upper_bounds, False)
 
     def _enforce_bounds_wall(self, du, alpha, lower_bounds, upper_bounds):
         """
@@ -588,38 +719,13 @@ class DefaultVector(Vector):
         upper_bounds : <Vector>
             Upper bounds vector.
         """
-        u = self
-
         # The assumption is that alpha * step has been added to this vector
         # just prior to this method being called. We are currently in the
         # initialization of a line search, and we're trying to ensure that
         # the initial step does not violate bounds. If it does, we modify
         # the step vector directly.
-
-        # Loop over varsets and enforce bounds on step in-place.
-        for u_data, du_data, lower_data, upper_data in zip(
-                u._data.values(), du._data.values(),
-                lower_bounds._data.values(), upper_bounds._data.values()):
-
-            # If u > lower, we're just adding zero. Otherwise, we're adding
-            # the step required to get up to the lower bound.
-            # For du, we normalize by alpha since du eventually gets
-            # multiplied by alpha.
-            change_lower = np.maximum(u_data, lower_data) - u_data
-            u_data += change_lower
-            du_data += change_lower / alpha
-
-            # If u < upper, we're just adding zero. Otherwise, we're adding
-            # the step required to get down to the upper bound, but normalized
-            # by alpha since du eventually gets multiplied by alpha.
-            change_upper = np.minimum(u_data, upper_data) - u_data
-            u_data += change_upper
-            du_data += change_upper / alpha
-
-            # Now we ensure that we will backtrack along the wall during the
-            # line search by setting the entries of du at the bounds to zero.
-            changed_either = change_lower.astype(bool) + change_upper.astype(bool)
-            du_data[changed_either] = 0.
+        for set_name in self._data:
+            self._enforce_bounds_set(set_name, du, alpha, lower_bounds, upper_bounds, True)
 
     def __getstate__(self):
         """
@@ -136,5 +136,5 @@ class PETScVector(DefaultVector):
         """
         global_sum = 0
         for data in itervalues(self._data):
-            global_sum += np.sum(data**2)
+            global_sum += np.dot(data, data)
         return self._system.comm.allreduce(global_sum) ** 0.5
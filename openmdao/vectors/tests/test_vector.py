@@ -1,6 +1,9 @@
 import unittest
 
+import numpy as np
+
 from openmdao.api import Problem, IndepVarComp
+from openmdao.devtools.testutil import assert_rel_error
 
 class TestVector(unittest.TestCase):
 
@@ -18,6 +21,60 @@ class TestVector(unittest.TestCase):
 
         self.assertListEqual(outputs, expected, msg='Iter is not returning the expected names')
 
+    def test_norm(self):
+
+        p = Problem()
+        comp = IndepVarComp()
+        comp.add_output('v1', val=3.0)
+        comp.add_output('v2', val=np.array([4.0, 12.0]))
+        p.model.add_subsystem('des_vars', comp, promotes=['*'])
+        p.setup()
+
+        self.assertEqual(p.model._outputs.get_norm(), 13.0)
+
+    def test_add_scal_vec_bounded(self):
+
+        p = Problem()
+        comp = IndepVarComp()
+        comp.add_output('v1', val=np.zeros(5), lower=-1.0, upper=1.0)
+        comp.add_output('v2', val=np.zeros(3), lower=-1.0)
+        p.model.add_subsystem('des_vars', comp, promotes=['*'])
+        p.setup()
+
+        model = p.model
+        u = model._outputs
+        du = model._vectors['output']['linear']
+        step = np.array([0.5, -3.0, 2.0, 0.0, 1.5, 1.0, -0.5, 0.0])
+
+        for bound_enforcement in ('vector', 'scalar', 'wall'):
+            results = []
+            for fused in (True, False):
+                u.set_const(0.0)
+                du.set_data(step)
+                alpha = 0.8
+                if fused:
+                    u._add_scal_vec_bounded(alpha, du, model._lower_bounds, model._upper_bounds,
+                                            bound_enforcement)
+                else:
+                    u.add_scal_vec(alpha, du)
+                    enforce = getattr(u, '_enforce_bounds_' + bound_enforcement)
+                    enforce(du, alpha, model._lower_bounds, model._upper_bounds)
+                results.append((u.get_data(), du.get_data()))
+
+            assert_rel_error(self, results[0][0], results[1][0], 1e-15)
+            assert_rel_error(self, results[0][1], results[1][1], 1e-15)
+
+            if bound_enforcement == 'vector':
+                # The second entry hits its lower bound first, after a step of 1/3.
+                assert_rel_error(self, results[0][0], step / 3.0, 1e-15)
+
+        # The scratch space is allocated once and reused.
+        work = [w for work in u._work_data.values() for w in work]
+        u.add_scal_vec(1.0, du)
+        self.assertEqual([id(w) for work in u._work_data.values() for w in work],
+                         [id(w) for w in work])
+
+
 if __name__ == '__main__':
 
     unittest.main()
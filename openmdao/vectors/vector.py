@@ -76,6 +76,9 @@ class Vector(object):
         by varset name.
     _complex_view_cache : {}
         Temporary storage of complex views used by in-place numpy operations.
+    _work_data : {}
+        Dict of scratch arrays used by in-place operations, keyed by varset name and allocated
+        on first use.
     """
 
     _vector_info = VectorInfo()
@@ -123,6 +126,8 @@ class Vector(object):
         self._imag_views_flat = {}
         self._alloc_complex = alloc_complex
 
+        self._work_data = {}
+
         if root_vector is None:
             self._root_vector = self
         else:
@@ -501,6 +506,30 @@ class Vector(object):
         """
         pass
 
+    def _add_scal_vec_bounded(self, alpha, du, lower_bounds, upper_bounds, bound_enforcement):
+        """
+        Add a step to this vector and enforce lower/upper bounds on the result.
+
+        This is equivalent to add_scal_vec followed by the _enforce_bounds_* method selected by
+        bound_enforcement, and modifies both self (u) and step (du) in-place.
+
+        Must be implemented by the subclass.
+
+        Parameters
+        ----------
+        alpha : float
+            step size.
+        du : <Vector>
+            Newton step; the backtracking is applied to this vector in-place.
+        lower_bounds : <Vector>
+            Lower bounds vector.
+        upper_bounds : <Vector>
+            Upper bounds vector.
+        bound_enforcement : str
+            'vector', 'scalar', or 'wall'.
+        """
+        pass
+
     def _enforce_bounds_scalar(self, du, alpha, lower_bounds, upper_bounds):
         """
         Enforce lower/upper bounds on each scalar separately, then backtrack as a vector.